@@ -62,6 +62,9 @@ DEFAULT_SETTINGS = {
         "max_entries": 50,
         "auto_backup": True
     },
+    "maintenance": {
+        "compression": "gzip"
+    },
     "system": {
         "version": "1.0.0",
         "last_update_check": None,
@@ -6,16 +6,23 @@ This module provides comprehensive maintenance, migration, and validation
 functionality for the Curso Processor application.
 """
 
+import io
 import os
 import sys
 import json
 import shutil
 import time
 import glob
+import gzip
+import functools
+import math
 import hashlib
 import logging
 import datetime
 import re
+import string
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple, NamedTuple, Set, Union
 from dataclasses import dataclass
@@ -37,6 +44,36 @@ try:
     HAS_CREDENTIALS = True
 except Exception:
     HAS_CREDENTIALS = False
+# orjson is optional; fall back to the standard json module
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+# blake3 is optional; fall back to hashlib.blake2b
+try:
+    import blake3
+    HAS_BLAKE3 = True
+except ImportError:
+    HAS_BLAKE3 = False
+# zstandard and deflate (libdeflate) are optional faster compressors
+try:
+    import zstandard as zstd
+    HAS_ZSTD = True
+except ImportError:
+    HAS_ZSTD = False
+try:
+    import deflate
+    HAS_DEFLATE = True
+except ImportError:
+    HAS_DEFLATE = False
+# lxml is optional; fall back to the standard ElementTree
+try:
+    from lxml import etree as ET
+    HAS_LXML = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    HAS_LXML = False
 from utils import file_manager
 from utils.ui_components import (
     console, NORD_BLUE, NORD_CYAN, NORD_GREEN, NORD_YELLOW, NORD_RED, NORD_DIM,
@@ -52,6 +89,325 @@ logging.basicConfig(
 )
 logger = logging.getLogger("maintenance")
 
+# Precompiled Nord markup tags
+BLUE_OPEN, BLUE_CLOSE = f"[{NORD_BLUE}]", f"[/{NORD_BLUE}]"
+CYAN_OPEN, CYAN_CLOSE = f"[{NORD_CYAN}]", f"[/{NORD_CYAN}]"
+GREEN_OPEN, GREEN_CLOSE = f"[{NORD_GREEN}]", f"[/{NORD_GREEN}]"
+YELLOW_OPEN, YELLOW_CLOSE = f"[{NORD_YELLOW}]", f"[/{NORD_YELLOW}]"
+RED_OPEN, RED_CLOSE = f"[{NORD_RED}]", f"[/{NORD_RED}]"
+DIM_OPEN, DIM_CLOSE = f"[{NORD_DIM}]", f"[/{NORD_DIM}]"
+
+# Static header of the health report panel
+_HEALTH_REPORT_HEADER = "🏥 Relatório de Saúde do Sistema\n" + DIM_OPEN + "━" * 35 + DIM_CLOSE + "\n\n"
+
+# Buffer size for streaming file copies/compression and gzip file signature
+_COPY_BUFFER_SIZE = 1024 * 1024
+_GZIP_MAGIC = b"\x1f\x8b"
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+_COMPRESSED_MAGICS = (_GZIP_MAGIC, _ZSTD_MAGIC)
+
+# zstd level for text compression and largest file compressed in memory by libdeflate
+_ZSTD_LEVEL = 15
+_DEFLATE_MAX_SIZE = 64 * 1024 * 1024
+
+# Bytes hashed to pre-screen same-size files before a full hash
+_HEAD_HASH_SIZE = 64 * 1024
+
+# Database files larger than this are minified with orjson, when available
+_STREAM_MINIFY_THRESHOLD = 256 * 1024
+
+# Runs of 19+ digits: possibly integers beyond 64 bits, which orjson would
+# read as floats (losing precision) but json keeps exact
+_LONG_NUMBER_RE = re.compile(rb"\d{19,}")
+
+# Directories in the base directory that are not courses (compared lowercase)
+_EXCLUDED_DIRS = frozenset(("temp", "cache", "logs", "backups"))
+
+# iTunes podcast namespace; the standard ElementTree needs it registered to
+# keep the itunes prefix when rewriting feeds (lxml keeps prefixes itself)
+_ITUNES_NS = "http://www.itunes.com/dtds/podcast-1.0.dtd"
+if not HAS_LXML:
+    ET.register_namespace("itunes", _ITUNES_NS)
+
+# Tags every RSS feed must contain, in the order they are reported and added
+_REQUIRED_XML_TAGS = ("title", "description", "pubDate", "enclosure")
+_REQUIRED_XML_TAG_SET = frozenset(_REQUIRED_XML_TAGS)
+
+# Placeholder content for feeds created or completed by the XML repair
+_PLACEHOLDER_DESCRIPTION = "Curso processado automaticamente"
+_PLACEHOLDER_ENCLOSURE_URL = string.Template("https://example.com/${course_name}.mp3")
+
+# Start-tag names in raw XML bytes, for single-pass tag presence checks
+_XML_TAG_RE = re.compile(rb"<([A-Za-z_][\w:-]*)")
+
+# Google Drive URL prefix and the placeholder used for invalid link URLs
+_GDRIVE_PREFIX = "https://drive.google.com/"
+_GDRIVE_PLACEHOLDER_URL = _GDRIVE_PREFIX + "placeholder"
+
+# Fields every entry of processed_courses.json must have
+_REQUIRED_COURSE_FIELDS = frozenset(("course_name", "directory", "created_at", "last_updated"))
+
+def _has_non_finite_float(data: Any) -> bool:
+    """
+    Check whether JSON-like data contains NaN or infinite floats
+    
+    Args:
+        data: Data to check
+        
+    Returns:
+        bool: True if any float in the data is not finite
+    """
+    stack = [data]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, float):
+            if not math.isfinite(value):
+                return True
+        elif isinstance(value, dict):
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+    return False
+
+def _json_dumps(data: Any, pretty: bool = False) -> bytes:
+    """
+    Serialize data to UTF-8 encoded JSON
+    
+    Args:
+        data: Data to serialize
+        pretty: Whether to indent the output (compact otherwise)
+        
+    Returns:
+        bytes: Encoded JSON
+    """
+    # orjson writes NaN and Infinity as null and rejects integers beyond
+    # 64 bits, so such data goes through the json module
+    if HAS_ORJSON and not _has_non_finite_float(data):
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(data, option=option)
+        except orjson.JSONEncodeError:
+            pass
+    
+    if pretty:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+@functools.lru_cache(maxsize=256)
+def _basic_rss(course_name: str, pub_date: str) -> bytes:
+    """
+    Build a minimal RSS feed for a course (cached per course and date)
+    
+    Args:
+        course_name: Course name (escaped by the XML builder)
+        pub_date: Feed publication date
+        
+    Returns:
+        bytes: UTF-8 encoded feed with XML declaration
+    """
+    if HAS_LXML:
+        rss = ET.Element("rss", version="2.0", nsmap={"itunes": _ITUNES_NS})
+    else:
+        rss = ET.Element("rss", {"version": "2.0", "xmlns:itunes": _ITUNES_NS})
+    
+    channel = ET.SubElement(rss, "channel")
+    ET.SubElement(channel, "title").text = course_name
+    ET.SubElement(channel, "description").text = _PLACEHOLDER_DESCRIPTION
+    ET.SubElement(channel, "pubDate").text = pub_date
+    
+    item = ET.SubElement(channel, "item")
+    ET.SubElement(item, "title").text = f"{course_name} - Episódio 1"
+    ET.SubElement(item, "description").text = f"Episódio 1 do curso {course_name}"
+    ET.SubElement(item, "enclosure", url=_PLACEHOLDER_ENCLOSURE_URL.substitute(course_name=course_name),
+                  type="audio/mpeg", length="0")
+    
+    if HAS_LXML:
+        return ET.tostring(rss, encoding="utf-8", xml_declaration=True, pretty_print=True)
+    ET.indent(rss)
+    return ET.tostring(rss, encoding="utf-8", xml_declaration=True)
+
+def _write_bytes_synced(file_path: str, data: bytes):
+    """
+    Write bytes to a file in one pass and fsync it once
+    
+    Args:
+        file_path: Destination file
+        data: Content to write
+    """
+    fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+def _read_file_bytes(file_path: str, limit: Optional[int] = None) -> bytes:
+    """
+    Read a file as raw bytes with unbuffered os.read calls
+    
+    Args:
+        file_path: File to read
+        limit: Maximum number of bytes to read (None for the whole file)
+        
+    Returns:
+        bytes: File content (the first limit bytes if limit is set)
+    """
+    fd = os.open(file_path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        if limit is not None:
+            size = min(size, limit)
+        chunks = []
+        while size > 0:
+            chunk = os.read(fd, size)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            size -= len(chunk)
+        return chunks[0] if len(chunks) == 1 else b"".join(chunks)
+    finally:
+        os.close(fd)
+
+def _iter_files(root: str):
+    """
+    Recursively yield the file entries under a directory
+    
+    Args:
+        root: Directory to scan
+        
+    Yields:
+        os.DirEntry: Entry for each non-directory file (stat results are cached)
+    """
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    else:
+                        yield entry
+        except OSError as e:
+            logger.error(f"Failed to scan directory {directory}: {str(e)}")
+
+def _hash_file(file_path: str, limit: Optional[int] = None) -> str:
+    """
+    Hash a file's content by streaming it in fixed-size chunks
+    
+    Args:
+        file_path: File to hash
+        limit: Hash only the first `limit` bytes (whole file if None)
+        
+    Returns:
+        str: Hex digest (BLAKE3 if available, BLAKE2b otherwise)
+    """
+    hasher = blake3.blake3() if HAS_BLAKE3 else hashlib.blake2b(digest_size=16)
+    remaining = limit
+    with open(file_path, 'rb', buffering=0) as f:
+        # Reuse one buffer for every chunk. Reads may return fewer bytes
+        # than requested (e.g. on network filesystems), so keep reading
+        # until EOF or until `limit` bytes were hashed
+        view = memoryview(bytearray(_COPY_BUFFER_SIZE if limit is None else min(limit, _COPY_BUFFER_SIZE)))
+        while remaining is None or remaining > 0:
+            n = f.readinto(view if remaining is None or remaining >= len(view) else view[:remaining])
+            if not n:
+                break
+            hasher.update(view[:n])
+            if remaining is not None:
+                remaining -= n
+    return hasher.hexdigest()
+
+def _try_hash_file(file_path: str, limit: Optional[int] = None) -> Tuple[str, Optional[str]]:
+    """
+    Hash a file, logging failures instead of raising
+    
+    Args:
+        file_path: File to hash
+        limit: Hash only the first `limit` bytes (whole file if None)
+        
+    Returns:
+        Tuple[str, Optional[str]]: File path and its digest (None on failure)
+    """
+    try:
+        return file_path, _hash_file(file_path, limit)
+    except Exception as e:
+        logger.error(f"Failed to process file {file_path}: {str(e)}")
+        return file_path, None
+
+def _group_by_hash(executor: ThreadPoolExecutor, candidates: List[Tuple[int, str]],
+                   limit: Optional[int] = None) -> Dict[Tuple[int, str], List[str]]:
+    """
+    Hash files concurrently and group them by (size, digest)
+    
+    Args:
+        executor: Thread pool to hash on
+        candidates: (size, path) pairs to hash
+        limit: Hash only the first `limit` bytes (whole file if None)
+        
+    Returns:
+        Dict[Tuple[int, str], List[str]]: Paths grouped by size and digest
+    """
+    groups = defaultdict(list)
+    results = executor.map(_try_hash_file, [file_path for _, file_path in candidates], [limit] * len(candidates))
+    for (size, _), (file_path, file_hash) in zip(candidates, results):
+        if file_hash is not None:
+            groups[(size, file_hash)].append(file_path)
+    return groups
+
+def _safe_rewrite(file_path: str, data: bytes, backup_suffix: str = ".bak"):
+    """
+    Replace a file's content atomically, keeping the old content as a backup
+    
+    The new content is written to a temporary file first. The backup is a
+    hard link to the original, or the original itself renamed aside if
+    linking fails, so the old content is never copied.
+    
+    Args:
+        file_path: File to rewrite
+        data: New content
+        backup_suffix: Suffix of the backup file
+    """
+    backup_path = file_path + backup_suffix
+    temp_path = file_path + ".tmp"
+    try:
+        _write_bytes_synced(temp_path, data)
+        
+        if os.path.lexists(backup_path):
+            os.remove(backup_path)
+        try:
+            os.link(file_path, backup_path)
+        except OSError:
+            os.replace(file_path, backup_path)
+        
+        os.replace(temp_path, file_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+def _replace_file_bytes(file_path: str, data: bytes):
+    """
+    Replace a file's content atomically through a synced temporary file
+    
+    Args:
+        file_path: File to write
+        data: New content
+    """
+    temp_path = file_path + ".tmp"
+    try:
+        _write_bytes_synced(temp_path, data)
+        os.replace(temp_path, file_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
 # Define validation result structure
 @dataclass
 class ValidationResult:
@@ -76,6 +432,8 @@ class SystemMaintenance:
         self.cache_dir = os.path.join(self.base_dir, "cache")
         self.logs_dir = os.path.join(self.base_dir, "logs")
         self.backup_dir = os.path.join(self.base_dir, "backups")
+        self.project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        self.data_dir = os.path.join(self.project_root, "data")
         
         # Create directories if they don't exist
         for directory in [self.temp_dir, self.cache_dir, self.logs_dir, self.backup_dir]:
@@ -87,6 +445,9 @@ class SystemMaintenance:
             f"maintenance_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
         )
         
+        # Drive links validation cache: path -> (mtime_ns, size, issues, next expiry)
+        self._drive_links_cache = {}
+        
         # Add file handler to logger
         file_handler = logging.FileHandler(self.log_file)
         file_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
@@ -170,14 +531,26 @@ class SystemMaintenance:
             int: Size in bytes
         """
         total_size = 0
-        for dirpath, dirnames, filenames in os.walk(directory):
-            for filename in filenames:
-                file_path = os.path.join(dirpath, filename)
-                if os.path.exists(file_path):
-                    total_size += os.path.getsize(file_path)
+        for entry in _iter_files(directory):
+            try:
+                total_size += entry.stat().st_size
+            except OSError:
+                pass
         
         return total_size
     
+    def _iter_courses(self):
+        """
+        Yield the course directories in the base directory
+        
+        Yields:
+            str: Path of each course directory
+        """
+        with os.scandir(self.base_dir) as it:
+            for entry in it:
+                if entry.name.lower() not in _EXCLUDED_DIRS and entry.is_dir():
+                    yield entry.path
+    
     def format_size(self, size_bytes: int) -> str:
         """
         Format size in bytes to human-readable format
@@ -213,14 +586,13 @@ class SystemMaintenance:
         # Create backup before cleanup
         self.create_backup(self.temp_dir, "temp_files_pre_cleanup")
         
-        # Get initial size
-        initial_size = self.get_directory_size(self.temp_dir)
-        
-        # Get all files in temp directory
+        # Get all files in temp directory, with their sizes
         temp_files = []
-        for root, dirs, files in os.walk(self.temp_dir):
-            for file in files:
-                temp_files.append(os.path.join(root, file))
+        for entry in _iter_files(self.temp_dir):
+            try:
+                temp_files.append((entry.path, entry.stat(follow_symlinks=False).st_size))
+            except OSError:
+                pass
         
         # No files to clean up
         if not temp_files:
@@ -229,11 +601,12 @@ class SystemMaintenance:
                 progress.update(task_id, completed=100)
             return 0
         
-        # Clean up files
+        # Clean up files, counting the bytes freed
         files_removed = 0
+        freed = 0
         total_files = len(temp_files)
         
-        for i, file_path in enumerate(temp_files):
+        for i, (file_path, size) in enumerate(temp_files):
             try:
                 # Skip if file doesn't exist
                 if not os.path.exists(file_path):
@@ -242,6 +615,7 @@ class SystemMaintenance:
                 # Remove file
                 os.remove(file_path)
                 files_removed += 1
+                freed += size
                 
                 # Update progress
                 if progress and task_id is not None:
@@ -249,11 +623,8 @@ class SystemMaintenance:
             except Exception as e:
                 logger.error(f"Failed to remove temporary file {file_path}: {str(e)}")
         
-        # Get final size
-        final_size = self.get_directory_size(self.temp_dir)
-        
         # Calculate space freed
-        space_freed = (initial_size - final_size) / (1024 * 1024)  # Convert to MB
+        space_freed = freed / (1024 * 1024)  # Convert to MB
         
         logger.info(f"Removed {files_removed} temporary files, freed {space_freed:.1f} MB")
         
@@ -275,18 +646,15 @@ class SystemMaintenance:
         # Create backup before cleanup
         self.create_backup(self.cache_dir, "cache_pre_cleanup")
         
-        # Get initial size
-        initial_size = self.get_directory_size(self.cache_dir)
-        
-        # Get all files in cache directory
+        # Get all files in cache directory, with their age in days and size
         cache_files = []
-        for root, dirs, files in os.walk(self.cache_dir):
-            for file in files:
-                file_path = os.path.join(root, file)
-                # Get file age in days
-                if os.path.exists(file_path):
-                    file_age = (time.time() - os.path.getmtime(file_path)) / (60 * 60 * 24)
-                    cache_files.append((file_path, file_age))
+        now = time.time()
+        for entry in _iter_files(self.cache_dir):
+            try:
+                st = entry.stat(follow_symlinks=False)
+            except OSError:
+                continue
+            cache_files.append((entry.path, (now - st.st_mtime) / (60 * 60 * 24), st.st_size))
         
         # No files to clean up
         if not cache_files:
@@ -295,11 +663,12 @@ class SystemMaintenance:
                 progress.update(task_id, completed=100)
             return 0
         
-        # Clean up files older than 30 days
+        # Clean up files older than 30 days, counting the bytes freed
         files_removed = 0
+        freed = 0
         total_files = len(cache_files)
         
-        for i, (file_path, file_age) in enumerate(cache_files):
+        for i, (file_path, file_age, size) in enumerate(cache_files):
             try:
                 # Skip if file doesn't exist
                 if not os.path.exists(file_path):
@@ -309,6 +678,7 @@ class SystemMaintenance:
                 if file_age > 30:
                     os.remove(file_path)
                     files_removed += 1
+                    freed += size
                 
                 # Update progress
                 if progress and task_id is not None:
@@ -316,11 +686,8 @@ class SystemMaintenance:
             except Exception as e:
                 logger.error(f"Failed to remove cache file {file_path}: {str(e)}")
         
-        # Get final size
-        final_size = self.get_directory_size(self.cache_dir)
-        
         # Calculate space freed
-        space_freed = (initial_size - final_size) / (1024 * 1024)  # Convert to MB
+        space_freed = freed / (1024 * 1024)  # Convert to MB
         
         logger.info(f"Removed {files_removed} expired cache files, freed {space_freed:.1f} MB")
         
@@ -342,19 +709,16 @@ class SystemMaintenance:
         # Create backup before cleanup
         self.create_backup(self.logs_dir, "logs_pre_cleanup")
         
-        # Get initial size
-        initial_size = self.get_directory_size(self.logs_dir)
-        
-        # Get all log files
+        # Get all log files, with their age in days and size
         log_files = []
-        for root, dirs, files in os.walk(self.logs_dir):
-            for file in files:
-                if file.endswith(".log"):
-                    file_path = os.path.join(root, file)
-                    # Get file age in days
-                    if os.path.exists(file_path):
-                        file_age = (time.time() - os.path.getmtime(file_path)) / (60 * 60 * 24)
-                        log_files.append((file_path, file_age))
+        now = time.time()
+        for entry in _iter_files(self.logs_dir):
+            if entry.name.endswith(".log"):
+                try:
+                    st = entry.stat(follow_symlinks=False)
+                except OSError:
+                    continue
+                log_files.append((entry.path, (now - st.st_mtime) / (60 * 60 * 24), st.st_size))
         
         # No files to clean up
         if not log_files:
@@ -363,11 +727,12 @@ class SystemMaintenance:
                 progress.update(task_id, completed=100)
             return 0
         
-        # Clean up files older than 90 days
+        # Clean up files older than 90 days, counting the bytes freed
         files_removed = 0
+        freed = 0
         total_files = len(log_files)
         
-        for i, (file_path, file_age) in enumerate(log_files):
+        for i, (file_path, file_age, size) in enumerate(log_files):
             try:
                 # Skip if file doesn't exist
                 if not os.path.exists(file_path):
@@ -381,6 +746,7 @@ class SystemMaintenance:
                 if file_age > 90:
                     os.remove(file_path)
                     files_removed += 1
+                    freed += size
                 
                 # Update progress
                 if progress and task_id is not None:
@@ -388,11 +754,8 @@ class SystemMaintenance:
             except Exception as e:
                 logger.error(f"Failed to remove log file {file_path}: {str(e)}")
         
-        # Get final size
-        final_size = self.get_directory_size(self.logs_dir)
-        
         # Calculate space freed
-        space_freed = (initial_size - final_size) / (1024 * 1024)  # Convert to MB
+        space_freed = freed / (1024 * 1024)  # Convert to MB
         
         logger.info(f"Removed {files_removed} old log files, freed {space_freed:.1f} MB")
         
@@ -411,19 +774,16 @@ class SystemMaintenance:
         """
         logger.info("Starting cleanup of old backups")
         
-        # Get initial size
-        initial_size = self.get_directory_size(self.backup_dir)
-        
-        # Get all backup files
+        # Get all backup files, with their age in days and size
         backup_files = []
-        for root, dirs, files in os.walk(self.backup_dir):
-            for file in files:
-                if file.endswith(".zip"):
-                    file_path = os.path.join(root, file)
-                    # Get file age in days
-                    if os.path.exists(file_path):
-                        file_age = (time.time() - os.path.getmtime(file_path)) / (60 * 60 * 24)
-                        backup_files.append((file_path, file_age))
+        now = time.time()
+        for entry in _iter_files(self.backup_dir):
+            if entry.name.endswith(".zip"):
+                try:
+                    st = entry.stat(follow_symlinks=False)
+                except OSError:
+                    continue
+                backup_files.append((entry.path, (now - st.st_mtime) / (60 * 60 * 24), st.st_size))
         
         # No files to clean up
         if not backup_files:
@@ -434,7 +794,7 @@ class SystemMaintenance:
         
         # Group backups by type
         backup_groups = {}
-        for file_path, file_age in backup_files:
+        for file_path, file_age, size in backup_files:
             file_name = os.path.basename(file_path)
             # Extract backup type (everything before the timestamp)
             match = re.match(r"(.+)_\d{8}_\d{6}\.zip", file_name)
@@ -442,10 +802,11 @@ class SystemMaintenance:
                 backup_type = match.group(1)
                 if backup_type not in backup_groups:
                     backup_groups[backup_type] = []
-                backup_groups[backup_type].append((file_path, file_age))
+                backup_groups[backup_type].append((file_path, file_age, size))
         
-        # Keep only the 5 most recent backups of each type
+        # Keep only the 5 most recent backups of each type, counting the bytes freed
         files_removed = 0
+        freed = 0
         total_groups = len(backup_groups)
         
         for i, (backup_type, files) in enumerate(backup_groups.items()):
@@ -455,10 +816,11 @@ class SystemMaintenance:
                 
                 # Remove old backups (keep 5 most recent)
                 if len(files) > 5:
-                    for file_path, _ in files[5:]:
+                    for file_path, _, size in files[5:]:
                         if os.path.exists(file_path):
                             os.remove(file_path)
                             files_removed += 1
+                            freed += size
                 
                 # Update progress
                 if progress and task_id is not None:
@@ -466,11 +828,8 @@ class SystemMaintenance:
             except Exception as e:
                 logger.error(f"Failed to process backup group {backup_type}: {str(e)}")
         
-        # Get final size
-        final_size = self.get_directory_size(self.backup_dir)
-        
         # Calculate space freed
-        space_freed = (initial_size - final_size) / (1024 * 1024)  # Convert to MB
+        space_freed = freed / (1024 * 1024)  # Convert to MB
         
         logger.info(f"Removed {files_removed} old backup files, freed {space_freed:.1f} MB")
         
@@ -490,11 +849,7 @@ class SystemMaintenance:
         logger.info("Starting cleanup of orphaned audio files")
         
         # Get all course directories
-        course_dirs = []
-        for item in os.listdir(self.base_dir):
-            item_path = os.path.join(self.base_dir, item)
-            if os.path.isdir(item_path) and item not in ["temp", "cache", "logs", "backups"]:
-                course_dirs.append(item_path)
+        course_dirs = list(self._iter_courses())
         
         # No courses to process
         if not course_dirs:
@@ -590,7 +945,7 @@ class SystemMaintenance:
                 freed_space = task_func(progress, task_id)
                 total_freed += freed_space
                 
-        console.print(f"[{NORD_GREEN}]✅ Limpeza concluída! {total_freed:.1f} MB liberados[/{NORD_GREEN}]")
+        console.print(GREEN_OPEN + f"✅ Limpeza concluída! {total_freed:.1f} MB liberados" + GREEN_CLOSE)
         
         logger.info(f"Comprehensive cleanup completed. Total space freed: {total_freed:.1f} MB")
         
@@ -717,7 +1072,7 @@ class SystemMaintenance:
         errors = 0
         
         with Progress() as progress:
-            task = progress.add_task(f"[{NORD_CYAN}]Migrando arquivos...[/{NORD_CYAN}]", total=total_files)
+            task = progress.add_task(CYAN_OPEN + "Migrando arquivos..." + CYAN_CLOSE, total=total_files)
             
             for file_type, plan in migration_plan.items():
                 for file_info in plan["files"]:
@@ -750,10 +1105,10 @@ class SystemMaintenance:
         logger.info(f"Migration completed. Processed {files_processed} files with {errors} errors")
         
         if errors > 0:
-            console.print(f"[{NORD_YELLOW}]⚠️ Migração concluída com {errors} erros. Verifique o log para mais detalhes.[/{NORD_YELLOW}]")
+            console.print(YELLOW_OPEN + f"⚠️ Migração concluída com {errors} erros. Verifique o log para mais detalhes." + YELLOW_CLOSE)
             return False
         else:
-            console.print(f"[{NORD_GREEN}]✅ Migração concluída com sucesso! {files_processed} arquivos processados.[/{NORD_GREEN}]")
+            console.print(GREEN_OPEN + f"✅ Migração concluída com sucesso! {files_processed} arquivos processados." + GREEN_CLOSE)
             return True
     
     def _files_are_identical(self, file1: str, file2: str) -> bool:
@@ -796,18 +1151,18 @@ class SystemMaintenance:
         # Validate operation
         if operation not in ["copy", "move", "sync"]:
             logger.error(f"Invalid operation: {operation}")
-            console.print(f"[{NORD_RED}]❌ Operação inválida: {operation}[/{NORD_RED}]")
+            console.print(RED_OPEN + f"❌ Operação inválida: {operation}" + RED_CLOSE)
             return
         
         # Analyze migration
         migration_plan = self.analyze_migration(source_dir, target_dir)
         
         if not migration_plan:
-            console.print(f"[{NORD_RED}]❌ Falha ao analisar migração[/{NORD_RED}]")
+            console.print(RED_OPEN + "❌ Falha ao analisar migração" + RED_CLOSE)
             return
         
         # Display migration plan
-        console.print(f"[{NORD_CYAN}]📋 Plano de Migração:[/{NORD_CYAN}]")
+        console.print(CYAN_OPEN + "📋 Plano de Migração:" + CYAN_CLOSE)
         table = Table(title="Arquivos a serem migrados")
         table.add_column("Tipo", style=NORD_CYAN)
         table.add_column("Quantidade", style=NORD_WHITE) 
@@ -820,13 +1175,13 @@ class SystemMaintenance:
         console.print(table)
         
         # Confirm migration
-        if Confirm.ask(f"[{NORD_YELLOW}]Continuar com a migração?[/{NORD_YELLOW}]"):
+        if Confirm.ask(YELLOW_OPEN + "Continuar com a migração?" + YELLOW_CLOSE):
             # Execute migration
             self.execute_migration(migration_plan, source_dir, target_dir, operation)
         else:
-            console.print(f"[{NORD_YELLOW}]Migração cancelada pelo usuário[/{NORD_YELLOW}]")
+            console.print(YELLOW_OPEN + "Migração cancelada pelo usuário" + YELLOW_CLOSE)
     
-    def migrate_database(self, source_file: str, target_file: str, merge: bool = False):
+    def migrate_database(self, source_file: str, target_file: str, merge: bool = False, pretty: bool = False):
         """
         Migrate database from source to target file
         
@@ -834,13 +1189,14 @@ class SystemMaintenance:
             source_file: Source file
             target_file: Target file
             merge: Whether to merge data (True) or replace (False)
+            pretty: Whether to write indented JSON for debugging (compact otherwise)
         """
         logger.info(f"Starting database migration from {source_file} to {target_file} (merge: {merge})")
         
         # Check if source file exists
         if not os.path.exists(source_file):
             logger.error(f"Source file does not exist: {source_file}")
-            console.print(f"[{NORD_RED}]❌ Arquivo de origem não existe: {source_file}[/{NORD_RED}]")
+            console.print(RED_OPEN + f"❌ Arquivo de origem não existe: {source_file}" + RED_CLOSE)
             return
         
         try:
@@ -868,11 +1224,14 @@ class SystemMaintenance:
                     if id_field:
                         # If we have an ID field, use it to avoid duplicates
                         existing_ids = {item.get(id_field) for item in target_data if id_field in item}
+                        ids_add = existing_ids.add
+                        target_append = target_data.append
                         
                         for item in source_data:
-                            if id_field in item and item[id_field] not in existing_ids:
-                                target_data.append(item)
-                                existing_ids.add(item[id_field])
+                            item_id = item.get(id_field)
+                            if item_id is not None and item_id not in existing_ids:
+                                target_append(item)
+                                ids_add(item_id)
                     else:
                         # No ID field, just append all items
                         target_data.extend(source_data)
@@ -895,15 +1254,14 @@ class SystemMaintenance:
             # Create target directory if it doesn't exist
             os.makedirs(os.path.dirname(target_file), exist_ok=True)
             
-            # Save target data
-            with open(target_file, 'w', encoding='utf-8') as f:
-                json.dump(target_data, f, indent=4, ensure_ascii=False)
+            # Save target data with a single write and fsync
+            _write_bytes_synced(target_file, _json_dumps(target_data, pretty=pretty))
             
             logger.info(f"Database migration completed successfully")
-            console.print(f"[{NORD_GREEN}]✅ Migração de banco de dados concluída com sucesso![/{NORD_GREEN}]")
+            console.print(GREEN_OPEN + "✅ Migração de banco de dados concluída com sucesso!" + GREEN_CLOSE)
         except Exception as e:
             logger.error(f"Failed to migrate database: {str(e)}")
-            console.print(f"[{NORD_RED}]❌ Falha ao migrar banco de dados: {str(e)}[/{NORD_RED}]")
+            console.print(RED_OPEN + "❌ Falha ao migrar banco de dados: " + str(e) + RED_CLOSE)
     
     def _detect_id_field(self, data: List[Dict[str, Any]]) -> Optional[str]:
         """
@@ -970,7 +1328,7 @@ class SystemMaintenance:
                 issues.append(f"Diretório não encontrado: {directory}")
         
         # Check if data directory exists
-        data_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data")
+        data_dir = self.data_dir
         if not os.path.exists(data_dir):
             issues.append(f"Diretório de dados não encontrado: {data_dir}")
         
@@ -1056,7 +1414,7 @@ class SystemMaintenance:
         issues = []
         
         # Get data directory
-        data_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data")
+        data_dir = self.data_dir
         
         # Required configuration files
         config_files = [
@@ -1130,7 +1488,7 @@ class SystemMaintenance:
         issues = []
         
         # Get data directory
-        data_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data")
+        data_dir = self.data_dir
         
         # Progress database file
         progress_file = os.path.join(data_dir, "processed_courses.json")
@@ -1150,22 +1508,34 @@ class SystemMaintenance:
                 issues.append(f"Formato de dados de progresso inválido: esperado lista, encontrado {type(progress_data).__name__}")
                 return ValidationResult(is_valid=False, issues=issues)
             
-            # Check each course
+            # Check each course, collecting paths whose existence must be verified
+            paths_to_check = []
+            
             for i, course in enumerate(progress_data):
-                # Check required fields
-                required_fields = ["course_name", "directory", "created_at", "last_updated"]
+                # Entries must be objects
+                if not isinstance(course, dict):
+                    issues.append(f"Entrada inválida no curso {i}: esperado objeto, encontrado {type(course).__name__}")
+                    continue
                 
-                for field in required_fields:
-                    if field not in course:
-                        issues.append(f"Campo ausente no curso {i}: {field}")
+                # Check required fields
+                for field in sorted(_REQUIRED_COURSE_FIELDS - course.keys()):
+                    issues.append(f"Campo ausente no curso {i}: {field}")
                 
                 # Check if directory exists
-                if "directory" in course and not os.path.exists(course["directory"]):
-                    issues.append(f"Diretório de curso não encontrado: {course['directory']}")
+                directory = course.get("directory")
+                if directory is not None:
+                    paths_to_check.append((directory, f"Diretório de curso não encontrado: {directory}"))
                 
                 # Check if state file exists
-                if "state_file" in course and not os.path.exists(course["state_file"]):
-                    issues.append(f"Arquivo de estado de curso não encontrado: {course['state_file']}")
+                state_file = course.get("state_file")
+                if state_file is not None:
+                    paths_to_check.append((state_file, f"Arquivo de estado de curso não encontrado: {state_file}"))
+            
+            # Check all paths with a single directory listing per parent
+            existing_paths = self._find_existing_paths(path for path, _ in paths_to_check)
+            for path, issue in paths_to_check:
+                if path not in existing_paths:
+                    issues.append(issue)
         except Exception as e:
             issues.append(f"Falha ao validar banco de dados de progresso: {str(e)}")
         
@@ -1182,6 +1552,41 @@ class SystemMaintenance:
             issues=issues
         )
     
+    def _find_existing_paths(self, paths) -> Set[str]:
+        """
+        Find which of the given paths exist, listing each parent directory once
+        
+        Args:
+            paths: Paths to check
+            
+        Returns:
+            Set[str]: Subset of paths that exist
+        """
+        # Group paths by parent directory
+        by_parent = {}
+        for path in paths:
+            parent, name = os.path.split(os.path.normpath(path))
+            by_parent.setdefault(parent, []).append((path, name))
+        
+        existing = set()
+        for parent, entries in by_parent.items():
+            # Entries that exist (is_dir/is_file follow symlinks, so dangling
+            # symlinks are left out)
+            try:
+                with os.scandir(parent or os.curdir) as it:
+                    names = {entry.name for entry in it if entry.is_dir() or entry.is_file()}
+            except OSError:
+                names = set()
+            
+            for path, name in entries:
+                # Misses (and roots, which have no basename) are checked
+                # directly, as names may differ in case on case-insensitive
+                # filesystems
+                if (name and name in names) or os.path.exists(path):
+                    existing.add(path)
+        
+        return existing
+    
     def validate_drive_links(self) -> ValidationResult:
         """
         Validate Google Drive links
@@ -1194,11 +1599,7 @@ class SystemMaintenance:
         issues = []
         
         # Get all course directories
-        course_dirs = []
-        for item in os.listdir(self.base_dir):
-            item_path = os.path.join(self.base_dir, item)
-            if os.path.isdir(item_path) and item not in ["temp", "cache", "logs", "backups"]:
-                course_dirs.append(item_path)
+        course_dirs = list(self._iter_courses())
         
         # No courses to validate
         if not course_dirs:
@@ -1206,34 +1607,27 @@ class SystemMaintenance:
             return ValidationResult(is_valid=True, issues=[])
         
         # Check each course
+        now = datetime.datetime.now()
+        
         for course_dir in course_dirs:
             # Look for drive_links.json
             drive_links_file = os.path.join(course_dir, "drive_links.json")
             
-            if not os.path.exists(drive_links_file):
+            try:
+                stat = os.stat(drive_links_file)
+            except OSError:
                 continue
             
-            try:
-                # Load drive links
-                with open(drive_links_file, 'r', encoding='utf-8') as f:
-                    drive_links = json.load(f)
-                
-                # Check each link
-                for link_name, link_info in drive_links.items():
-                    # Check if link is expired
-                    if "expiry" in link_info:
-                        try:
-                            expiry_date = datetime.datetime.fromisoformat(link_info["expiry"])
-                            if expiry_date < datetime.datetime.now():
-                                issues.append(f"Link expirado: {link_name} em {os.path.basename(course_dir)}")
-                        except Exception:
-                            issues.append(f"Data de expiração inválida para link: {link_name} em {os.path.basename(course_dir)}")
-                    
-                    # Check if link URL is valid
-                    if "url" not in link_info or not link_info["url"].startswith("https://drive.google.com/"):
-                        issues.append(f"URL de link inválida: {link_name} em {os.path.basename(course_dir)}")
-            except Exception as e:
-                issues.append(f"Falha ao validar links do Drive para {os.path.basename(course_dir)}: {str(e)}")
+            # Reuse cached result if the file is unchanged and no link expired since
+            cached = self._drive_links_cache.get(drive_links_file)
+            if (cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size
+                    and (cached[3] is None or now < cached[3])):
+                issues.extend(cached[2])
+                continue
+            
+            course_issues, next_expiry = self._validate_drive_links_file(drive_links_file, os.path.basename(course_dir), now)
+            self._drive_links_cache[drive_links_file] = (stat.st_mtime_ns, stat.st_size, course_issues, next_expiry)
+            issues.extend(course_issues)
         
         # Log results
         if issues:
@@ -1248,6 +1642,47 @@ class SystemMaintenance:
             issues=issues
         )
     
+    def _validate_drive_links_file(self, drive_links_file: str, course_name: str, now: datetime.datetime) -> Tuple[List[str], Optional[datetime.datetime]]:
+        """
+        Validate the Google Drive links of a single course
+        
+        Args:
+            drive_links_file: Path to drive_links.json
+            course_name: Course name used in issue messages
+            now: Reference time for expiry checks
+            
+        Returns:
+            Tuple: Issues found and the earliest expiry still in the future (None if none)
+        """
+        issues = []
+        next_expiry = None
+        
+        try:
+            # Load drive links
+            with open(drive_links_file, 'r', encoding='utf-8') as f:
+                drive_links = json.load(f)
+            
+            # Check each link
+            for link_name, link_info in drive_links.items():
+                # Check if link is expired
+                if "expiry" in link_info:
+                    try:
+                        expiry_date = datetime.datetime.fromisoformat(link_info["expiry"])
+                        if expiry_date < now:
+                            issues.append(f"Link expirado: {link_name} em {course_name}")
+                        elif next_expiry is None or expiry_date < next_expiry:
+                            next_expiry = expiry_date
+                    except Exception:
+                        issues.append(f"Data de expiração inválida para link: {link_name} em {course_name}")
+                
+                # Check if link URL is valid
+                if not link_info.get("url", "").startswith(_GDRIVE_PREFIX):
+                    issues.append(f"URL de link inválida: {link_name} em {course_name}")
+        except Exception as e:
+            issues.append(f"Falha ao validar links do Drive para {course_name}: {str(e)}")
+        
+        return issues, next_expiry
+    
     def validate_xml_integrity(self) -> ValidationResult:
         """
         Validate XML integrity
@@ -1268,11 +1703,7 @@ class SystemMaintenance:
             return ValidationResult(is_valid=False, issues=issues)
         
         # Get all XML files
-        xml_files = []
-        for root, dirs, files in os.walk(xml_dir):
-            for file in files:
-                if file.endswith(".xml"):
-                    xml_files.append(os.path.join(root, file))
+        xml_files = [entry.path for entry in _iter_files(xml_dir) if entry.name.endswith(".xml")]
         
         # No XML files to validate
         if not xml_files:
@@ -1282,19 +1713,18 @@ class SystemMaintenance:
         # Check each XML file
         for xml_file in xml_files:
             try:
-                # Read XML file
-                with open(xml_file, 'r', encoding='utf-8') as f:
-                    xml_content = f.read()
+                # Read XML file as bytes (the checks need no decoding)
+                xml_content = _read_file_bytes(xml_file)
                 
                 # Check if XML is well-formed
-                if not xml_content.strip().startswith("<?xml"):
+                if not xml_content.strip().startswith(b"<?xml"):
                     issues.append(f"XML mal formado: {os.path.basename(xml_file)}")
                 
-                # Check for required tags
-                required_tags = ["title", "description", "pubDate", "enclosure"]
+                # Check for required tags against the tags found in one scan
+                present = {match.decode('ascii', 'replace') for match in _XML_TAG_RE.findall(xml_content)}
                 
-                for tag in required_tags:
-                    if f"<{tag}>" not in xml_content and f"<{tag} " not in xml_content:
+                for tag in _REQUIRED_XML_TAGS:
+                    if tag not in present:
                         issues.append(f"Tag ausente no XML: {tag} em {os.path.basename(xml_file)}")
             except Exception as e:
                 issues.append(f"Falha ao validar XML: {os.path.basename(xml_file)} ({str(e)})")
@@ -1330,97 +1760,87 @@ class SystemMaintenance:
             ("📊 XML do podcast", self.validate_xml_integrity)
         ]
         
-        issues_found = []
-        validation_results = {}
+        validation_results = []
         
         with Progress() as progress:
             for validation_name, validation_func in validations:
-                task = progress.add_task(f"[{NORD_CYAN}]{validation_name}[/{NORD_CYAN}]", total=100)
-                result = validation_func()
-                validation_results[validation_name] = result
-                
-                if not result.is_valid:
-                    issues_found.append((validation_name, result.issues))
-                
+                task = progress.add_task(CYAN_OPEN + validation_name + CYAN_CLOSE, total=100)
+                validation_results.append((validation_name, validation_func()))
                 progress.update(task, completed=100)
         
         # Generate health report
-        health_report = self.generate_health_report(issues_found, validation_results)
+        health_report = self.generate_health_report(validation_results)
         
         logger.info("System integrity validation completed")
         
         return health_report
     
-    def generate_health_report(self, issues_found: List[Tuple[str, List[str]]], validation_results: Dict[str, ValidationResult]) -> Dict[str, Any]:
+    def generate_health_report(self, validation_results: List[Tuple[str, ValidationResult]]) -> Dict[str, Any]:
         """
         Generate health report
         
         Args:
-            issues_found: List of issues found
-            validation_results: Validation results
+            validation_results: Ordered list of (validation name, result) pairs
             
         Returns:
             Dict: Health report
         """
         logger.info("Generating health report")
         
-        # Determine system health
+        # Add validation results and issues in a single pass
+        validations = {}
+        issues = []
         system_health = "SAUDÁVEL"
-        if issues_found:
-            if any(len(issues) > 5 for _, issues in issues_found):
-                system_health = "CRÍTICO"
-            else:
-                system_health = "ATENÇÃO"
+        
+        for validation_name, result in validation_results:
+            validations[validation_name] = {
+                "is_valid": result.is_valid,
+                "issues": result.issues
+            }
+            
+            if not result.is_valid:
+                issues.extend({"validation": validation_name, "description": issue} for issue in result.issues)
+                
+                # Determine system health
+                if len(result.issues) > 5:
+                    system_health = "CRÍTICO"
+                elif system_health == "SAUDÁVEL":
+                    system_health = "ATENÇÃO"
         
         # Create health report
         health_report = {
             "timestamp": datetime.datetime.now().isoformat(),
             "system_health": system_health,
-            "validations": {},
-            "issues": [],
+            "validations": validations,
+            "issues": issues,
             "recommendations": []
         }
         
-        # Add validation results
-        for validation_name, result in validation_results.items():
-            health_report["validations"][validation_name] = {
-                "is_valid": result.is_valid,
-                "issues": result.issues
-            }
-        
-        # Add issues
-        for validation_name, issues in issues_found:
-            for issue in issues:
-                health_report["issues"].append({
-                    "validation": validation_name,
-                    "description": issue
-                })
-        
         # Generate recommendations
         recommendations = []
         
         # Check for directory structure issues
-        if not validation_results["📁 Estrutura de diretórios"].is_valid:
+        if not validations["📁 Estrutura de diretórios"]["is_valid"]:
             recommendations.append("🔧 Corrigir estrutura de diretórios")
         
         # Check for API credential issues
-        if not validation_results["🔑 Credenciais de API"].is_valid:
+        if not validations["🔑 Credenciais de API"]["is_valid"]:
             recommendations.append("🔑 Atualizar credenciais de API")
         
         # Check for configuration file issues
-        if not validation_results["📄 Arquivos de configuração"].is_valid:
+        if not validations["📄 Arquivos de configuração"]["is_valid"]:
             recommendations.append("📄 Corrigir arquivos de configuração")
         
         # Check for progress database issues
-        if not validation_results["💾 Database de progresso"].is_valid:
+        if not validations["💾 Database de progresso"]["is_valid"]:
             recommendations.append("💾 Reparar banco de dados de progresso")
         
         # Check for Drive link issues
-        if not validation_results["🔗 Links do Google Drive"].is_valid:
+        if not validations["🔗 Links do Google Drive"]["is_valid"]:
             recommendations.append("🔗 Atualizar links expirados do Google Drive")
         
         # Check for XML integrity issues
-        if not validation_results["📊 XML do podcast"].is_valid:
+        if not validations["📊 XML do podcast"]["is_valid"]:
             recommendations.append("📊 Corrigir arquivos XML")
         
         # Check cache size
@@ -1457,41 +1877,36 @@ class SystemMaintenance:
             health_color = NORD_RED
         
         # Create health report panel
-        report_text = [
-            f"🏥 Relatório de Saúde do Sistema",
-            f"[{NORD_DIM}]━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━[/{NORD_DIM}]",
-            "",
-            f"[{health_color}]✅ Sistema Geral: {health_report['system_health']}[/{health_color}]",
-            "",
-            f"[{NORD_CYAN}]🔍 Verificações Realizadas:[/{NORD_CYAN}]"
-        ]
+        report_text = io.StringIO()
+        write = report_text.write
+        write(_HEALTH_REPORT_HEADER)
+        write(f"[{health_color}]✅ Sistema Geral: {health_report['system_health']}[/{health_color}]\n\n")
+        write(CYAN_OPEN + "🔍 Verificações Realizadas:" + CYAN_CLOSE)
         
         # Add validation results
         for validation_name, result in health_report["validations"].items():
             status_icon = "✅" if result["is_valid"] else "⚠️"
-            report_text.append(f"{status_icon} {validation_name}")
+            write("\n" + status_icon + " " + validation_name)
         
         # Add issues
         if health_report["issues"]:
-            report_text.append("")
-            report_text.append(f"[{NORD_YELLOW}]⚠️ Problemas Encontrados:[/{NORD_YELLOW}]")
+            write("\n\n" + YELLOW_OPEN + "⚠️ Problemas Encontrados:" + YELLOW_CLOSE)
             
             for issue in health_report["issues"]:
-                report_text.append(f"• {issue['description']}")
+                write("\n• " + issue["description"])
         
         # Add recommendations
         if health_report["recommendations"]:
-            report_text.append("")
-            report_text.append(f"[{NORD_CYAN}]🔧 Ações Recomendadas:[/{NORD_CYAN}]")
+            write("\n\n" + CYAN_OPEN + "🔧 Ações Recomendadas:" + CYAN_CLOSE)
             
             for i, recommendation in enumerate(health_report["recommendations"], 1):
-                report_text.append(f"[{NORD_BLUE}][{i}][/{NORD_BLUE}] {recommendation}")
+                write("\n" + BLUE_OPEN + f"[{i}]" + BLUE_CLOSE + " " + recommendation)
             
-            report_text.append(f"[{NORD_BLUE}][0][/{NORD_BLUE}] ← Voltar")
+            write("\n" + BLUE_OPEN + "[0]" + BLUE_CLOSE + " ← Voltar")
         
         # Create panel
         panel = Panel(
-            Text.from_markup("\n".join(report_text)),
+            Text.from_markup(report_text.getvalue()),
             title="Relatório de Saúde do Sistema",
             border_style=NORD_CYAN,
             padding=(1, 2)
@@ -1552,31 +1967,31 @@ class SystemMaintenance:
         total_freed = (initial_size - final_size) / (1024 * 1024)  # Convert to MB
         
         # Display results
-        console.print(f"[{NORD_GREEN}]✅ Otimização de armazenamento concluída![/{NORD_GREEN}]")
-        console.print(f"[{NORD_GREEN}]   Total liberado: {total_freed:.1f} MB[/{NORD_GREEN}]")
-        console.print(f"[{NORD_GREEN}]   Limpeza: {cleanup_freed:.1f} MB[/{NORD_GREEN}]")
-        console.print(f"[{NORD_GREEN}]   Otimização de cursos: {course_freed:.1f} MB[/{NORD_GREEN}]")
-        console.print(f"[{NORD_GREEN}]   Otimização de banco de dados: {database_freed:.1f} MB[/{NORD_GREEN}]")
+        console.print(GREEN_OPEN + "✅ Otimização de armazenamento concluída!" + GREEN_CLOSE)
+        console.print(GREEN_OPEN + f"   Total liberado: {total_freed:.1f} MB" + GREEN_CLOSE)
+        console.print(GREEN_OPEN + f"   Limpeza: {cleanup_freed:.1f} MB" + GREEN_CLOSE)
+        console.print(GREEN_OPEN + f"   Otimização de cursos: {course_freed:.1f} MB" + GREEN_CLOSE)
+        console.print(GREEN_OPEN + f"   Otimização de banco de dados: {database_freed:.1f} MB" + GREEN_CLOSE)
         
         logger.info(f"Storage optimization completed. Total space freed: {total_freed:.1f} MB")
         
         return total_freed
     
-    def _optimize_course_files(self) -> float:
+    def _optimize_course_files(self, exact: bool = False) -> float:
         """
         Optimize course files
         
+        Args:
+            exact: Measure space freed by re-scanning the course directories
+                instead of summing the bytes reported by each optimization step
+        
         Returns:
             float: Space freed in MB
         """
         logger.info("Optimizing course files")
         
         # Get all course directories
-        course_dirs = []
-        for item in os.listdir(self.base_dir):
-            item_path = os.path.join(self.base_dir, item)
-            if os.path.isdir(item_path) and item not in ["temp", "cache", "logs", "backups"]:
-                course_dirs.append(item_path)
+        course_dirs = list(self._iter_courses())
         
         # No courses to optimize
         if not course_dirs:
@@ -1584,127 +1999,191 @@ class SystemMaintenance:
             return 0
         
         # Get initial size
-        initial_size = sum(self.get_directory_size(course_dir) for course_dir in course_dirs)
+        if exact:
+            initial_size = sum(self.get_directory_size(course_dir) for course_dir in course_dirs)
         
-        # Process each course
+        # Process courses in parallel (hashing and compression release the GIL)
         with Progress() as progress:
-            task = progress.add_task(f"[{NORD_CYAN}]Otimizando cursos...[/{NORD_CYAN}]", total=len(course_dirs))
+            task = progress.add_task(CYAN_OPEN + "Otimizando cursos..." + CYAN_CLOSE, total=len(course_dirs))
             
-            for course_dir in course_dirs:
-                try:
-                    # Optimize course
-                    self._optimize_single_course(course_dir)
-                    
-                    # Update progress
-                    progress.update(task, advance=1)
-                except Exception as e:
-                    logger.error(f"Failed to optimize course {course_dir}: {str(e)}")
+            bytes_freed = 0
+            max_workers = min(os.cpu_count() or 1, len(course_dirs))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(self._optimize_single_course, course_dir): course_dir
+                    for course_dir in course_dirs
+                }
+                
+                for future in as_completed(futures):
+                    try:
+                        # Optimize course
+                        bytes_freed += future.result()
+                        
+                        # Update progress
+                        progress.update(task, advance=1)
+                    except Exception as e:
+                        logger.error(f"Failed to optimize course {futures[future]}: {str(e)}")
         
         # Get final size
-        final_size = sum(self.get_directory_size(course_dir) for course_dir in course_dirs)
+        if exact:
+            final_size = sum(self.get_directory_size(course_dir) for course_dir in course_dirs)
+            bytes_freed = initial_size - final_size
         
         # Calculate space freed
-        space_freed = (initial_size - final_size) / (1024 * 1024)  # Convert to MB
+        space_freed = bytes_freed / (1024 * 1024)  # Convert to MB
         
         logger.info(f"Course files optimization completed. Space freed: {space_freed:.1f} MB")
         
         return space_freed
     
-    def _optimize_single_course(self, course_dir: str):
+    def _optimize_single_course(self, course_dir: str) -> int:
         """
         Optimize a single course
         
         Args:
             course_dir: Course directory
+            
+        Returns:
+            int: Bytes freed
         """
         # Remove duplicate files
-        self._remove_duplicate_files(course_dir)
+        bytes_freed = self._remove_duplicate_files(course_dir)
         
         # Compress large text files
-        self._compress_large_text_files(course_dir)
+        bytes_freed += self._compress_large_text_files(course_dir)
+        
+        return bytes_freed
     
-    def _remove_duplicate_files(self, directory: str):
+    def _remove_duplicate_files(self, directory: str) -> int:
         """
         Remove duplicate files in a directory
         
+        Files are grouped by size first; only files sharing a size are hashed.
+        
         Args:
             directory: Directory to process
+            
+        Returns:
+            int: Bytes freed
         """
-        # Get all files
-        files = []
-        for root, dirs, filenames in os.walk(directory):
-            for filename in filenames:
-                files.append(os.path.join(root, filename))
-        
-        # Group files by hash
-        file_hashes = {}
-        for file_path in files:
+        # Group files by size
+        size_map = defaultdict(list)
+        for entry in _iter_files(directory):
             try:
-                # Skip if file doesn't exist
-                if not os.path.exists(file_path):
-                    continue
-                
-                # Calculate hash
-                with open(file_path, 'rb') as f:
-                    file_hash = hashlib.md5(f.read()).hexdigest()
+                size_map[entry.stat().st_size].append(entry.path)
+            except OSError as e:
+                logger.error(f"Failed to process file {entry.path}: {str(e)}")
+        
+        # Hash the head of same-size files, then fully hash only files whose
+        # heads collide; hashing runs in parallel (it releases the GIL)
+        candidates = [
+            (size, file_path)
+            for size, file_paths in size_map.items() if len(file_paths) > 1
+            for file_path in file_paths
+        ]
+        file_hashes = {}
+        if candidates:
+            max_workers = min(32, (os.cpu_count() or 1) * 4, len(candidates))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                full_candidates = []
+                for (size, head_hash), file_paths in _group_by_hash(executor, candidates, _HEAD_HASH_SIZE).items():
+                    if len(file_paths) < 2:
+                        continue
+                    if size <= _HEAD_HASH_SIZE:
+                        # The head is the whole file
+                        file_hashes[(size, head_hash)] = file_paths
+                    else:
+                        full_candidates.extend((size, file_path) for file_path in file_paths)
                 
-                # Add to hash group
-                if file_hash not in file_hashes:
-                    file_hashes[file_hash] = []
-                file_hashes[file_hash].append(file_path)
-            except Exception as e:
-                logger.error(f"Failed to process file {file_path}: {str(e)}")
+                file_hashes.update(_group_by_hash(executor, full_candidates))
         
         # Remove duplicates
-        for file_hash, file_paths in file_hashes.items():
+        bytes_freed = 0
+        for (size, _), file_paths in file_hashes.items():
             if len(file_paths) > 1:
                 # Keep the first file, remove the rest
                 for file_path in file_paths[1:]:
                     try:
-                        if os.path.exists(file_path):
-                            os.remove(file_path)
-                            logger.info(f"Removed duplicate file: {file_path}")
+                        os.remove(file_path)
+                        bytes_freed += size
+                        logger.info(f"Removed duplicate file: {file_path}")
                     except Exception as e:
                         logger.error(f"Failed to remove duplicate file {file_path}: {str(e)}")
+        
+        return bytes_freed
     
-    def _compress_large_text_files(self, directory: str):
+    def _compress_large_text_files(self, directory: str, compresslevel: int = 6) -> int:
         """
         Compress large text files in a directory
         
+        Files are compressed to .gz (with libdeflate when the deflate package is
+        installed) or, if the "maintenance.compression" setting is "zstd" and the
+        zstandard package is installed, to .zst.
+        
         Args:
             directory: Directory to process
+            compresslevel: gzip compression level (1 = fastest, 9 = smallest)
+            
+        Returns:
+            int: Bytes freed
         """
         # Get all text files
         text_files = []
-        for root, dirs, filenames in os.walk(directory):
-            for filename in filenames:
-                if filename.endswith((".txt", ".md", ".json", ".xml")):
-                    file_path = os.path.join(root, filename)
-                    # Check if file is larger than 1 MB
-                    if os.path.exists(file_path) and os.path.getsize(file_path) > 1024 * 1024:
-                        text_files.append(file_path)
+        for entry in _iter_files(directory):
+            if entry.name.endswith((".txt", ".md", ".json", ".xml")):
+                # Check if file is larger than 1 MB
+                try:
+                    size = entry.stat().st_size
+                    if size > 1024 * 1024:
+                        text_files.append((entry.path, size))
+                except OSError:
+                    pass
+        
+        # Compression format (zstd compressors are not thread-safe, so one per call)
+        use_zstd = HAS_ZSTD and self.config.get("maintenance", {}).get("compression") == "zstd"
+        zstd_compressor = zstd.ZstdCompressor(level=_ZSTD_LEVEL, threads=-1) if use_zstd else None
         
         # Compress files
-        for file_path in text_files:
+        bytes_freed = 0
+        view = memoryview(bytearray(_COPY_BUFFER_SIZE))
+        for file_path, original_size in text_files:
             try:
-                # Skip if file doesn't exist
-                if not os.path.exists(file_path):
-                    continue
-                
                 # Create compressed file
-                compressed_path = f"{file_path}.gz"
+                compressed_path = file_path + (".zst" if use_zstd else ".gz")
                 
-                # Compress file
-                with open(file_path, 'rb') as f_in:
-                    with open(compressed_path, 'wb') as f_out:
-                        shutil.copyfileobj(f_in, f_out)
+                with open(file_path, 'rb', buffering=0) as f_in:
+                    # Skip files that are already compressed
+                    if f_in.read(4).startswith(_COMPRESSED_MAGICS):
+                        continue
+                    f_in.seek(0)
+                    
+                    if use_zstd:
+                        with open(compressed_path, 'wb') as f_out:
+                            zstd_compressor.copy_stream(
+                                f_in, f_out, read_size=_COPY_BUFFER_SIZE, write_size=_COPY_BUFFER_SIZE
+                            )
+                    elif HAS_DEFLATE and original_size <= _DEFLATE_MAX_SIZE:
+                        # libdeflate compresses whole buffers only
+                        with open(compressed_path, 'wb') as f_out:
+                            f_out.write(deflate.gzip_compress(f_in.read(), compresslevel))
+                    else:
+                        # Compress file, reusing one buffer for every chunk
+                        with gzip.open(compressed_path, 'wb', compresslevel=compresslevel) as f_out:
+                            while True:
+                                n = f_in.readinto(view)
+                                if not n:
+                                    break
+                                f_out.write(view[:n])
                 
                 # Remove original file
                 os.remove(file_path)
+                bytes_freed += original_size - os.path.getsize(compressed_path)
                 
                 logger.info(f"Compressed large text file: {file_path}")
             except Exception as e:
                 logger.error(f"Failed to compress file {file_path}: {str(e)}")
+        
+        return bytes_freed
     
     def _optimize_database_files(self) -> float:
         """
@@ -1716,7 +2195,7 @@ class SystemMaintenance:
         logger.info("Optimizing database files")
         
         # Get data directory
-        data_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data")
+        data_dir = self.data_dir
         
         # Get initial size
         initial_size = self.get_directory_size(data_dir)
@@ -1735,24 +2214,28 @@ class SystemMaintenance:
                     continue
                 
                 # Load data
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                with open(file_path, 'rb') as f:
+                    raw = f.read()
                 
-                # Create backup
-                backup_path = f"{file_path}.bak"
-                shutil.copy2(file_path, backup_path)
+                # Minify large files in C (orjson), unless they may hold
+                # integers that orjson would turn into floats; invalid files
+                # fail to parse and are left untouched
+                if len(raw) > _STREAM_MINIFY_THRESHOLD and HAS_ORJSON and not _LONG_NUMBER_RE.search(raw):
+                    optimized = _json_dumps(orjson.loads(raw))
+                else:
+                    optimized = json.dumps(json.loads(raw), ensure_ascii=False, separators=(',', ':')).encode('utf-8')
                 
-                # Save optimized data
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+                # Skip files that are already minified
+                if len(optimized) == len(raw):
+                    logger.debug(f"Database file already optimized: {file_path}")
+                    continue
+                
+                # Save optimized data, keeping the original as backup
+                _safe_rewrite(file_path, optimized)
                 
                 logger.info(f"Optimized database file: {file_path}")
             except Exception as e:
                 logger.error(f"Failed to optimize database file {file_path}: {str(e)}")
-                
-                # Restore from backup if available
-                if os.path.exists(f"{file_path}.bak"):
-                    shutil.copy2(f"{file_path}.bak", file_path)
         
         # Get final size
         final_size = self.get_directory_size(data_dir)
@@ -1771,18 +2254,18 @@ class SystemMaintenance:
         logger.info("Starting auto-repair system")
         
         # Create backup before repair
-        self.create_backup(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "pre_auto_repair")
+        self.create_backup(self.project_root, "pre_auto_repair")
         
         # Validate system integrity
         health_report = self.validate_system_integrity()
         
         # No issues to repair
         if health_report["system_health"] == "SAUDÁVEL":
-            console.print(f"[{NORD_GREEN}]✅ Sistema saudável, nenhum reparo necessário![/{NORD_GREEN}]")
+            console.print(GREEN_OPEN + "✅ Sistema saudável, nenhum reparo necessário!" + GREEN_CLOSE)
             return
         
         # Display repair plan
-        console.print(f"[{NORD_CYAN}]🔧 Plano de Reparo Automático:[/{NORD_CYAN}]")
+        console.print(CYAN_OPEN + "🔧 Plano de Reparo Automático:" + CYAN_CLOSE)
         
         repair_tasks = []
         
@@ -1808,17 +2291,17 @@ class SystemMaintenance:
         
         # Display repair tasks
         for i, (task_name, _) in enumerate(repair_tasks, 1):
-            console.print(f"[{NORD_BLUE}][{i}][/{NORD_BLUE}] {task_name}")
+            console.print(BLUE_OPEN + f"[{i}]" + BLUE_CLOSE + " " + task_name)
         
         # Confirm repair
-        if not Confirm.ask(f"[{NORD_YELLOW}]Executar reparo automático?[/{NORD_YELLOW}]"):
-            console.print(f"[{NORD_YELLOW}]Reparo cancelado pelo usuário[/{NORD_YELLOW}]")
+        if not Confirm.ask(YELLOW_OPEN + "Executar reparo automático?" + YELLOW_CLOSE):
+            console.print(YELLOW_OPEN + "Reparo cancelado pelo usuário" + YELLOW_CLOSE)
             return
         
         # Execute repair tasks
         with Progress() as progress:
             for task_name, task_func in repair_tasks:
-                task_id = progress.add_task(f"[{NORD_CYAN}]{task_name}[/{NORD_CYAN}]", total=100)
+                task_id = progress.add_task(CYAN_OPEN + task_name + CYAN_CLOSE, total=100)
                 task_func(progress, task_id)
         
         # Validate system integrity again
@@ -1826,10 +2309,10 @@ class SystemMaintenance:
         
         # Check if repair was successful
         if new_health_report["system_health"] == "SAUDÁVEL":
-            console.print(f"[{NORD_GREEN}]✅ Reparo automático concluído com sucesso![/{NORD_GREEN}]")
+            console.print(GREEN_OPEN + "✅ Reparo automático concluído com sucesso!" + GREEN_CLOSE)
         else:
-            console.print(f"[{NORD_YELLOW}]⚠️ Reparo automático concluído, mas alguns problemas persistem.[/{NORD_YELLOW}]")
-            console.print(f"[{NORD_YELLOW}]   Recomenda-se verificar o relatório de saúde para mais detalhes.[/{NORD_YELLOW}]")
+            console.print(YELLOW_OPEN + "⚠️ Reparo automático concluído, mas alguns problemas persistem." + YELLOW_CLOSE)
+            console.print(YELLOW_OPEN + "   Recomenda-se verificar o relatório de saúde para mais detalhes." + YELLOW_CLOSE)
         
         logger.info("Auto-repair system completed")
     
@@ -1855,32 +2338,33 @@ class SystemMaintenance:
         ]
         
         # Create directories if they don't exist
-        for i, directory in enumerate(required_dirs):
+        step = 100 / len(required_dirs)
+        for directory in required_dirs:
             try:
-                os.makedirs(directory, exist_ok=True)
-                logger.info(f"Created directory: {directory}")
-                
-                # Update progress
-                if progress and task_id is not None:
-                    progress.update(task_id, completed=(i + 1) * 100 / len(required_dirs))
+                if not os.path.isdir(directory):
+                    os.makedirs(directory, exist_ok=True)
+                    logger.info(f"Created directory: {directory}")
             except Exception as e:
                 logger.error(f"Failed to create directory {directory}: {str(e)}")
+            
+            # Update progress
+            if progress and task_id is not None:
+                progress.advance(task_id, step)
         
         # Create data directory
-        data_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data")
+        data_dir = self.data_dir
         os.makedirs(data_dir, exist_ok=True)
         
-        # Create required data files
+        # Create required data files (human-edited files are pretty-printed)
         required_files = [
-            (os.path.join(data_dir, "settings.json"), settings.get_default_settings()),
-            (os.path.join(data_dir, "processed_courses.json"), [])
+            (os.path.join(data_dir, "settings.json"), settings.get_default_settings(), True),
+            (os.path.join(data_dir, "processed_courses.json"), [], False)
         ]
         
-        for file_path, default_data in required_files:
+        for file_path, default_data, pretty in required_files:
             if not os.path.exists(file_path):
                 try:
-                    with open(file_path, 'w', encoding='utf-8') as f:
-                        json.dump(default_data, f, indent=4, ensure_ascii=False)
+                    _write_bytes_synced(file_path, _json_dumps(default_data, pretty=pretty))
                     
                     logger.info(f"Created data file: {file_path}")
                 except Exception as e:
@@ -1899,23 +2383,22 @@ class SystemMaintenance:
         logger.info("Repairing configuration files")
         
         # Get data directory
-        data_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data")
+        data_dir = self.data_dir
         
-        # Required configuration files
+        # Required configuration files (human-edited files are pretty-printed)
         config_files = [
-            (os.path.join(data_dir, "settings.json"), settings.get_default_settings()),
-            (os.path.join(data_dir, "credentials.json"), {}),
-            (os.path.join(data_dir, "processed_courses.json"), [])
+            (os.path.join(data_dir, "settings.json"), settings.get_default_settings(), True),
+            (os.path.join(data_dir, "credentials.json"), {}, True),
+            (os.path.join(data_dir, "processed_courses.json"), [], False)
         ]
         
         # Check and repair each file
-        for i, (file_path, default_data) in enumerate(config_files):
+        for i, (file_path, default_data, pretty) in enumerate(config_files):
             try:
                 # Check if file exists
                 if not os.path.exists(file_path):
                     # Create file with default data
-                    with open(file_path, 'w', encoding='utf-8') as f:
-                        json.dump(default_data, f, indent=4, ensure_ascii=False)
+                    _write_bytes_synced(file_path, _json_dumps(default_data, pretty=pretty))
                     
                     logger.info(f"Created configuration file: {file_path}")
                 else:
@@ -1924,13 +2407,8 @@ class SystemMaintenance:
                         with open(file_path, 'r', encoding='utf-8') as f:
                             data = json.load(f)
                     except Exception:
-                        # Create backup of corrupted file
-                        backup_path = f"{file_path}.corrupted"
-                        shutil.copy2(file_path, backup_path)
-                        
-                        # Create new file with default data
-                        with open(file_path, 'w', encoding='utf-8') as f:
-                            json.dump(default_data, f, indent=4, ensure_ascii=False)
+                        # Replace corrupted file with default data, keeping a backup
+                        _safe_rewrite(file_path, _json_dumps(default_data, pretty=pretty), ".corrupted")
                         
                         logger.info(f"Repaired corrupted configuration file: {file_path}")
                 
@@ -1973,8 +2451,7 @@ class SystemMaintenance:
                 
                 # Save modified settings
                 if modified:
-                    with open(settings_file, 'w', encoding='utf-8') as f:
-                        json.dump(settings_data, f, indent=4, ensure_ascii=False)
+                    _write_bytes_synced(settings_file, _json_dumps(settings_data, pretty=True))
                     
                     logger.info(f"Updated settings.json structure")
             except Exception as e:
@@ -1993,7 +2470,7 @@ class SystemMaintenance:
         logger.info("Repairing progress database")
         
         # Get data directory
-        data_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data")
+        data_dir = self.data_dir
         
         # Progress database file
         progress_file = os.path.join(data_dir, "processed_courses.json")
@@ -2002,8 +2479,7 @@ class SystemMaintenance:
             # Check if file exists
             if not os.path.exists(progress_file):
                 # Create empty progress database
-                with open(progress_file, 'w', encoding='utf-8') as f:
-                    json.dump([], f, indent=4, ensure_ascii=False)
+                _write_bytes_synced(progress_file, b"[]")
                 
                 logger.info(f"Created progress database: {progress_file}")
                 
@@ -2018,13 +2494,8 @@ class SystemMaintenance:
                 with open(progress_file, 'r', encoding='utf-8') as f:
                     progress_data = json.load(f)
             except Exception:
-                # Create backup of corrupted file
-                backup_path = f"{progress_file}.corrupted"
-                shutil.copy2(progress_file, backup_path)
-                
-                # Create empty progress database
-                with open(progress_file, 'w', encoding='utf-8') as f:
-                    json.dump([], f, indent=4, ensure_ascii=False)
+                # Replace corrupted file with an empty progress database, keeping a backup
+                _safe_rewrite(progress_file, b"[]", ".corrupted")
                 
                 logger.info(f"Repaired corrupted progress database: {progress_file}")
                 
@@ -2036,13 +2507,8 @@ class SystemMaintenance:
             
             # Check if progress data is a list
             if not isinstance(progress_data, list):
-                # Create backup of invalid file
-                backup_path = f"{progress_file}.invalid"
-                shutil.copy2(progress_file, backup_path)
-                
-                # Create empty progress database
-                with open(progress_file, 'w', encoding='utf-8') as f:
-                    json.dump([], f, indent=4, ensure_ascii=False)
+                # Replace invalid file with an empty progress database, keeping a backup
+                _safe_rewrite(progress_file, b"[]", ".invalid")
                 
                 logger.info(f"Repaired invalid progress database: {progress_file}")
                 
@@ -2052,56 +2518,78 @@ class SystemMaintenance:
                 
                 return
             
-            # Check each course
-            valid_courses = []
+            # Index course directories by lowercase name for directory lookups
+            dir_index = {os.path.basename(course_dir).lower(): course_dir for course_dir in self._iter_courses()}
+            
+            # Check each course, keeping valid ones in place
             total_courses = len(progress_data)
+            modified = False
+            kept = 0
             
             for i, course in enumerate(progress_data):
-                # Check required fields
-                required_fields = ["course_name", "directory", "created_at", "last_updated"]
-                
-                # Skip invalid courses
-                if not all(field in course for field in required_fields):
-                    logger.warning(f"Skipping invalid course: {course.get('course_name', 'Unknown')}")
-                    continue
-                
-                # Check if directory exists
-                if "directory" in course and not os.path.exists(course["directory"]):
-                    # Try to find course directory
-                    course_name = course["course_name"]
-                    possible_dirs = []
-                    
-                    for item in os.listdir(self.base_dir):
-                        item_path = os.path.join(self.base_dir, item)
-                        if os.path.isdir(item_path) and item.lower() == course_name.lower():
-                            possible_dirs.append(item_path)
-                    
-                    if possible_dirs:
-                        # Update directory
-                        course["directory"] = possible_dirs[0]
-                        logger.info(f"Updated directory for course: {course_name}")
-                    else:
-                        # Skip course with non-existent directory
-                        logger.warning(f"Skipping course with non-existent directory: {course_name}")
-                        continue
-                
-                # Add valid course
-                valid_courses.append(course)
+                if not isinstance(course, dict):
+                    # Drop entries that are not objects
+                    logger.warning(f"Skipping invalid course entry {i}: {type(course).__name__}")
+                    modified = True
+                else:
+                    directory = course.get("directory")
+                    if self._validate_course(course, dir_index):
+                        progress_data[kept] = course
+                        kept += 1
+                        if course["directory"] != directory:
+                            modified = True
                 
                 # Update progress
                 if progress and task_id is not None:
                     progress.update(task_id, completed=(i + 1) * 100 / total_courses)
             
-            # Save valid courses
-            with open(progress_file, 'w', encoding='utf-8') as f:
-                json.dump(valid_courses, f, indent=4, ensure_ascii=False)
+            del progress_data[kept:]
             
-            logger.info(f"Repaired progress database: {len(valid_courses)} valid courses out of {total_courses}")
+            # Save valid courses only if something changed
+            if modified or kept != total_courses:
+                _write_bytes_synced(progress_file, _json_dumps(progress_data))
+                
+                logger.info(f"Repaired progress database: {kept} valid courses out of {total_courses}")
+            else:
+                logger.debug("Progress database is valid, no changes needed")
         except Exception as e:
             logger.error(f"Failed to repair progress database: {str(e)}")
         
         logger.info("Progress database repair completed")
     
+    def _validate_course(self, course: Dict[str, Any], dir_index: Dict[str, str]) -> bool:
+        """
+        Check a progress database entry, relocating its directory if needed
+        
+        Args:
+            course: Course entry (its directory is updated in place when relocated)
+            dir_index: Course directories keyed by lowercase name
+            
+        Returns:
+            bool: True if the course should be kept
+        """
+        # Skip invalid courses
+        if not _REQUIRED_COURSE_FIELDS <= course.keys():
+            logger.warning(f"Skipping invalid course: {course.get('course_name', 'Unknown')}")
+            return False
+        
+        # Check if directory exists
+        if not os.path.exists(course["directory"]):
+            # Try to find course directory
+            course_name = course["course_name"]
+            match = dir_index.get(course_name.lower())
+            
+            if match:
+                # Update directory
+                course["directory"] = match
+                logger.info(f"Updated directory for course: {course_name}")
+            else:
+                # Skip course with non-existent directory
+                logger.warning(f"Skipping course with non-existent directory: {course_name}")
+                return False
+        
+        return True
+    
     def _repair_drive_links(self, progress: Optional[Progress] = None, task_id: Optional[int] = None):
         """
         Repair Google Drive links
@@ -2113,11 +2601,7 @@ class SystemMaintenance:
         logger.info("Repairing Google Drive links")
         
         # Get all course directories
-        course_dirs = []
-        for item in os.listdir(self.base_dir):
-            item_path = os.path.join(self.base_dir, item)
-            if os.path.isdir(item_path) and item not in ["temp", "cache", "logs", "backups"]:
-                course_dirs.append(item_path)
+        course_dirs = list(self._iter_courses())
         
         # No courses to repair
         if not course_dirs:
@@ -2129,6 +2613,10 @@ class SystemMaintenance:
         # Check each course
         total_courses = len(course_dirs)
         
+        # Reference time and replacement expiry (one year from now) for all links
+        now = datetime.datetime.now()
+        new_expiry_iso = (now + datetime.timedelta(days=365)).isoformat()
+        
         for i, course_dir in enumerate(course_dirs):
             # Look for drive_links.json
             drive_links_file = os.path.join(course_dir, "drive_links.json")
@@ -2152,25 +2640,23 @@ class SystemMaintenance:
                     if "expiry" in link_info:
                         try:
                             expiry_date = datetime.datetime.fromisoformat(link_info["expiry"])
-                            if expiry_date < datetime.datetime.now():
+                            if expiry_date < now:
                                 # Set expiry to 1 year from now
-                                new_expiry = datetime.datetime.now() + datetime.timedelta(days=365)
-                                link_info["expiry"] = new_expiry.isoformat()
+                                link_info["expiry"] = new_expiry_iso
                                 modified = True
                                 
                                 logger.info(f"Updated expiry for link: {link_name} in {os.path.basename(course_dir)}")
                         except Exception:
                             # Set expiry to 1 year from now
-                            new_expiry = datetime.datetime.now() + datetime.timedelta(days=365)
-                            link_info["expiry"] = new_expiry.isoformat()
+                            link_info["expiry"] = new_expiry_iso
                             modified = True
                             
                             logger.info(f"Fixed invalid expiry for link: {link_name} in {os.path.basename(course_dir)}")
                     
                     # Check if link URL is valid
-                    if "url" not in link_info or not link_info["url"].startswith("https://drive.google.com/"):
+                    if not link_info.get("url", "").startswith(_GDRIVE_PREFIX):
                         # Set placeholder URL
-                        link_info["url"] = "https://drive.google.com/placeholder"
+                        link_info["url"] = _GDRIVE_PLACEHOLDER_URL
                         modified = True
                         
                         logger.info(f"Set placeholder URL for link: {link_name} in {os.path.basename(course_dir)}")
@@ -2214,12 +2700,16 @@ class SystemMaintenance:
             
             return
         
-        # Get all XML files
-        xml_files = []
-        for root, dirs, files in os.walk(xml_dir):
-            for file in files:
-                if file.endswith(".xml"):
-                    xml_files.append(os.path.join(root, file))
+        # Get all XML files as (path, course name, size), largest first so the
+        # longest repairs start early
+        xml_files = sorted(
+            (
+                (entry.path, os.path.splitext(entry.name)[0], entry.stat().st_size)
+                for entry in _iter_files(xml_dir) if entry.name.endswith(".xml")
+            ),
+            key=lambda xml_entry: xml_entry[2],
+            reverse=True
+        )
         
         # No XML files to repair
         if not xml_files:
@@ -2231,81 +2721,194 @@ class SystemMaintenance:
         # Check each XML file
         total_files = len(xml_files)
         
-        for i, xml_file in enumerate(xml_files):
-            try:
-                # Read XML file
-                with open(xml_file, 'r', encoding='utf-8') as f:
-                    xml_content = f.read()
-                
-                # Check if XML is well-formed
-                if not xml_content.strip().startswith("<?xml"):
-                    # Create backup of invalid file
-                    backup_path = f"{xml_file}.invalid"
-                    shutil.copy2(xml_file, backup_path)
-                    
-                    # Create basic XML structure
-                    course_name = os.path.splitext(os.path.basename(xml_file))[0]
-                    
-                    basic_xml = f"""<?xml version="1.0" encoding="UTF-8"?>
-<rss version="2.0" xmlns:itunes="http://www.itunes.com/dtds/podcast-1.0.dtd">
-  <channel>
-    <title>{course_name}</title>
-    <description>Curso processado automaticamente</description>
-    <pubDate>{datetime.datetime.now().strftime('%a, %d %b %Y %H:%M:%S %z')}</pubDate>
-    <item>
-      <title>{course_name} - Episódio 1</title>
-      <description>Episódio 1 do curso {course_name}</description>
-      <enclosure url="https://example.com/{course_name}.mp3" type="audio/mpeg" length="0"/>
-    </item>
-  </channel>
-</rss>"""
-                    
-                    # Save basic XML
-                    with open(xml_file, 'w', encoding='utf-8') as f:
-                        f.write(basic_xml)
-                    
-                    logger.info(f"Repaired invalid XML file: {xml_file}")
-                else:
-                    # Check for required tags
-                    required_tags = ["title", "description", "pubDate", "enclosure"]
-                    missing_tags = []
-                    
-                    for tag in required_tags:
-                        if f"<{tag}>" not in xml_content and f"<{tag} " not in xml_content:
-                            missing_tags.append(tag)
-                    
-                    if missing_tags:
-                        # Create backup of incomplete file
-                        backup_path = f"{xml_file}.incomplete"
-                        shutil.copy2(xml_file, backup_path)
-                        
-                        # Add missing tags
-                        for tag in missing_tags:
-                            if tag == "title":
-                                course_name = os.path.splitext(os.path.basename(xml_file))[0]
-                                xml_content = xml_content.replace("<channel>", f"<channel>\n    <title>{course_name}</title>")
-                            elif tag == "description":
-                                xml_content = xml_content.replace("<channel>", f"<channel>\n    <description>Curso processado automaticamente</description>")
-                            elif tag == "pubDate":
-                                pub_date = datetime.datetime.now().strftime('%a, %d %b %Y %H:%M:%S %z')
-                                xml_content = xml_content.replace("<channel>", f"<channel>\n    <pubDate>{pub_date}</pubDate>")
-                            elif tag == "enclosure":
-                                course_name = os.path.splitext(os.path.basename(xml_file))[0]
-                                xml_content = xml_content.replace("<item>", f"<item>\n      <enclosure url=\"https://example.com/{course_name}.mp3\" type=\"audio/mpeg\" length=\"0\"/>")
-                        
-                        # Save updated XML
-                        with open(xml_file, 'w', encoding='utf-8') as f:
-                            f.write(xml_content)
-                        
-                        logger.info(f"Added missing tags to XML file: {xml_file}")
-            except Exception as e:
-                logger.error(f"Failed to repair XML file {xml_file}: {str(e)}")
+        # Publication date for every tag added in this batch
+        pub_date = datetime.datetime.now().strftime('%a, %d %b %Y %H:%M:%S %z')
+        
+        # Refresh the progress bar about once per percent (the task total is 100)
+        update_every = max(1, total_files // 100)
+        
+        # Repair files in parallel (file I/O and parsing release the GIL)
+        max_workers = min(32, (os.cpu_count() or 1) * 4, total_files)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self._repair_xml_file, xml_file, course_name, pub_date): xml_file
+                for xml_file, course_name, _ in xml_files
+            }
             
-            # Update progress
-            if progress and task_id is not None:
-                progress.update(task_id, completed=(i + 1) * 100 / total_files)
+            for done, future in enumerate(as_completed(futures), 1):
+                error = future.exception()
+                if error is not None:
+                    logger.error(f"Failed to repair XML file {futures[future]}: {str(error)}")
+                
+                # Update progress
+                if progress and task_id is not None and (done % update_every == 0 or done == total_files):
+                    progress.update(task_id, completed=done * 100 / total_files)
         
         logger.info("XML files repair completed")
+    
+    def _repair_xml_file(self, xml_file: str, course_name: str, pub_date: str):
+        """
+        Repair a single XML file
+        
+        Args:
+            xml_file: XML file to repair
+            course_name: Course name (the file name without extension)
+            pub_date: Publication date for added pubDate tags
+        """
+        # Check the XML declaration from the file head
+        is_xml = _read_file_bytes(xml_file, 256).lstrip().startswith(b"<?xml")
+        
+        # Scan the tags in one streaming pass, stopping once every required
+        # tag has been seen (None if not well-formed)
+        missing_tags = None
+        if is_xml:
+            try:
+                seen = set()
+                for _, elem in ET.iterparse(xml_file, events=("end",)):
+                    seen.add(elem.tag)
+                    elem.clear()
+                    if seen >= _REQUIRED_XML_TAG_SET:
+                        break
+                missing_tags = [tag for tag in _REQUIRED_XML_TAGS if tag not in seen]
+            except ET.ParseError:
+                pass
+        
+        # Salvage malformed feeds with lxml's recovering parser (one parser
+        # per call, lxml parsers are not thread-safe)
+        tree = None
+        backup_suffix = ".incomplete"
+        if missing_tags is None and is_xml and HAS_LXML:
+            try:
+                tree = ET.parse(xml_file, ET.XMLParser(recover=True, huge_tree=True))
+            except ET.XMLSyntaxError:
+                tree = None
+            
+            root = tree.getroot() if tree is not None else None
+            if root is not None and root.find("channel") is not None:
+                seen = {elem.tag for elem in root.iter()}
+                missing_tags = [tag for tag in _REQUIRED_XML_TAGS if tag not in seen]
+                backup_suffix = ".invalid"
+            else:
+                tree = None
+        
+        # Check if XML is well-formed (or could be recovered)
+        if missing_tags is None:
+            # Create basic XML structure
+            basic_xml = _basic_rss(course_name, pub_date)
+            
+            # Save basic XML, keeping the invalid file as backup
+            _safe_rewrite(xml_file, basic_xml, ".invalid")
+            
+            logger.info(f"Repaired invalid XML file: {xml_file}")
+        elif missing_tags or tree is not None:
+            # Build the full tree only for files that need changes
+            if tree is None:
+                tree = ET.parse(xml_file)
+            channel = tree.getroot().find("channel")
+            
+            if channel is None:
+                logger.warning(f"Cannot add missing tags to XML file without <channel>: {xml_file}")
+            else:
+                # Add missing tags (channel tags go first, enclosures into each item)
+                new_elements = []
+                for tag in missing_tags:
+                    if tag == "enclosure":
+                        enclosure_attrib = {
+                            "url": _PLACEHOLDER_ENCLOSURE_URL.substitute(course_name=course_name),
+                            "type": "audio/mpeg",
+                            "length": "0"
+                        }
+                        for item in channel.iter("item"):
+                            ET.SubElement(item, "enclosure", enclosure_attrib)
+                        continue
+                    
+                    element = ET.Element(tag)
+                    if tag == "title":
+                        element.text = course_name
+                    elif tag == "description":
+                        element.text = _PLACEHOLDER_DESCRIPTION
+                    elif tag == "pubDate":
+                        element.text = pub_date
+                    new_elements.append(element)
+                
+                # Insert all channel tags in a single splice
+                channel[0:0] = new_elements
+                
+                # Save updated XML, keeping the original file as backup
+                buffer = io.BytesIO()
+                tree.write(buffer, encoding='utf-8', xml_declaration=True)
+                _safe_rewrite(xml_file, buffer.getvalue(), backup_suffix)
+                
+                if backup_suffix == ".invalid":
+                    logger.info(f"Recovered malformed XML file: {xml_file}")
+                else:
+                    logger.info(f"Added missing tags to XML file: {xml_file}")
+
+
+@functools.lru_cache(maxsize=8)
+def _separator(width: int) -> str:
+    """Menu separator line for a console width (cached per width)"""
+    return "\n" + "─" * width + "\n"
+
+
+def _action_cleanup(maintenance: SystemMaintenance):
+    """Run the comprehensive cleanup"""
+    return maintenance.comprehensive_cleanup()
+
+
+def _action_migrate(maintenance: SystemMaintenance):
+    """Prompt for the migration parameters and migrate course data"""
+    return maintenance.migrate_course_data(
+        Prompt.ask("[bold]Diretório de origem"),
+        Prompt.ask("[bold]Diretório de destino"),
+        Prompt.ask("[bold]Operação (copy/move/sync)", choices=["copy", "move", "sync"], default="copy")
+    )
+
+
+def _action_validate(maintenance: SystemMaintenance):
+    """Validate system integrity"""
+    return maintenance.validate_system_integrity()
+
+
+def _action_optimize(maintenance: SystemMaintenance):
+    """Optimize storage usage"""
+    return maintenance.optimize_storage()
+
+
+def _action_repair(maintenance: SystemMaintenance):
+    """Run the automatic system repair"""
+    return maintenance.auto_repair_system()
+
+
+def _action_backup(maintenance: SystemMaintenance):
+    """Back up the whole project directory"""
+    return maintenance.create_backup(
+        maintenance.project_root,
+        f"system_backup_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    )
+
+
+# Maintenance menu: (label, action taking the maintenance system); the last
+# entry (no action) exits the menu
+MENU = (
+    ("🧹 Limpeza Completa", _action_cleanup),
+    ("🔄 Migrar Dados", _action_migrate),
+    ("🔍 Verificar Integridade", _action_validate),
+    ("💾 Otimizar Armazenamento", _action_optimize),
+    ("🔧 Auto-Reparo", _action_repair),
+    ("📦 Backup do Sistema", _action_backup),
+    ("🔙 Voltar", None)
+)
+MENU_CHOICES = [str(i) for i in range(1, len(MENU) + 1)]
+
+# Menu text, rendered once instead of on every pass of the menu loop
+_MENU_TEXT = "\n".join([
+    CYAN_OPEN + "🔧 Sistema de Manutenção" + CYAN_CLOSE,
+    DIM_OPEN + "━━━━━━━━━━━━━━━━━━━━━━━━━━━━" + DIM_CLOSE,
+    "",
+    *(BLUE_OPEN + f"[{i}]" + BLUE_CLOSE + " " + item_name for i, (item_name, _) in enumerate(MENU, 1)),
+    ""
+])
 
 
 def main():
@@ -2315,53 +2918,29 @@ def main():
     
     # Display menu
     while True:
-        console.print(f"[{NORD_CYAN}]🔧 Sistema de Manutenção[/{NORD_CYAN}]")
-        console.print(f"[{NORD_DIM}]━━━━━━━━━━━━━━━━━━━━━━━━━━━━[/{NORD_DIM}]")
-        console.print()
-        
-        menu_items = [
-            ("🧹 Limpeza Completa", maintenance.comprehensive_cleanup),
-            ("🔄 Migrar Dados", lambda: maintenance.migrate_course_data(
-                Prompt.ask("[bold]Diretório de origem"),
-                Prompt.ask("[bold]Diretório de destino"),
-                Prompt.ask("[bold]Operação (copy/move/sync)", choices=["copy", "move", "sync"], default="copy")
-            )),
-            ("🔍 Verificar Integridade", maintenance.validate_system_integrity),
-            ("💾 Otimizar Armazenamento", maintenance.optimize_storage),
-            ("🔧 Auto-Reparo", maintenance.auto_repair_system),
-            ("📦 Backup do Sistema", lambda: maintenance.create_backup(
-                os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
-                f"system_backup_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}"
-            )),
-            ("🔙 Voltar")
-        ]
-        
-        for i, (item_name, _) in enumerate(menu_items, 1):
-            console.print(f"[{NORD_BLUE}][{i}][/{NORD_BLUE}] {item_name}")
-        
-        console.print()
+        console.print(_MENU_TEXT)
         
         choice = Prompt.ask(
             "[bold]Escolha uma opção",
-            choices=[str(i) for i in range(1, len(menu_items) + 1)],
-            default="7"
+            choices=MENU_CHOICES,
+            default=MENU_CHOICES[-1]
         )
         
-        choice_idx = int(choice) - 1
+        item_name, action = MENU[int(choice) - 1]
         
-        if choice_idx == len(menu_items) - 1:
+        if action is None:
             # Exit
             break
         
         # Execute selected function
         try:
-            menu_items[choice_idx][1]()
+            action(maintenance)
         except Exception as e:
-            logger.error(f"Error executing {menu_items[choice_idx][0]}: {str(e)}")
-            console.print(f"[{NORD_RED}]❌ Erro: {str(e)}[/{NORD_RED}]")
+            logger.error(f"Error executing {item_name}: {str(e)}")
+            console.print(RED_OPEN + "❌ Erro: " + str(e) + RED_CLOSE)
         
         # Add separator
-        console.print("\n" + "─" * console.width + "\n")
+        console.print(_separator(console.width))
 
 
 if __name__ == "__main__":
@@ -5,11 +5,18 @@ Simplified version of the maintenance.py file for testing
 
 import os
 import sys
+import errno
+import functools
+import contextlib
 import json
 import time
+import re
 import shutil
 import logging
 import tempfile
+import mmap
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed, wait
 from typing import Dict, List, Any, Optional, Tuple
 
 import typer
@@ -20,9 +27,26 @@ from rich.text import Text
 from rich.table import Table
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskID
 
+# orjson is optional; fall back to the standard json module
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# ijson is optional; without it settings are checked with a full parse
+try:
+    import ijson
+    HAS_IJSON = True
+except ImportError:
+    HAS_IJSON = False
+
 # Initialize console
 console = Console()
 
+# Initialize logger
+logger = logging.getLogger("maintenance_simple")
+
 # Define Nord Theme colors
 NORD_BLUE = "bright_blue"
 NORD_CYAN = "bright_cyan"
@@ -31,6 +55,432 @@ NORD_YELLOW = "bright_yellow"
 NORD_RED = "bright_red"
 NORD_DIM = "dim white"
 
+# Progress bar columns shared by all maintenance operations
+PROGRESS_COLUMNS = (
+    SpinnerColumn(),
+    TextColumn("[progress.description]{task.description}"),
+    BarColumn(),
+    TextColumn("[progress.percentage]{task.percentage:>3.0f}%")
+)
+
+def _progress() -> Progress:
+    """Create a progress bar with the shared maintenance columns"""
+    return Progress(*PROGRESS_COLUMNS, console=console)
+
+# Age (in seconds) after which log, cache and backup files are removed
+LOG_AGE = 30 * 24 * 60 * 60
+CACHE_AGE = 7 * 24 * 60 * 60
+BACKUP_AGE = 90 * 24 * 60 * 60
+
+# File extensions handled by the log, backup and database passes
+LOG_EXTS = (".log",)
+BACKUP_EXTS = (".bak", ".backup")
+JSON_EXTS = (".json",)
+
+def _is_empty_dir(path: str) -> bool:
+    """
+    Check whether a directory is empty (or missing) by reading one entry
+    
+    Args:
+        path: Directory path
+        
+    Returns:
+        bool: True if the directory has no entries
+    """
+    try:
+        with os.scandir(path) as entries:
+            return next(entries, None) is None
+    except OSError:
+        return True
+
+# Whether stat results report allocated blocks (not on Windows)
+_HAS_ST_BLOCKS = hasattr(os.stat_result, "st_blocks")
+
+def _iter_size(path: str, on_disk: bool = False):
+    """
+    Yield the size of every file below a directory
+    
+    Walks the tree with an explicit stack of os.scandir calls, using the
+    stat data cached by each DirEntry, so each file is stat'ed once.
+    Symlinks are never followed.
+    
+    Args:
+        path: Directory path
+        on_disk: Yield allocated size (st_blocks * 512) instead of
+            apparent size, where the platform reports it
+        
+    Yields:
+        int: File size in bytes
+    """
+    on_disk = on_disk and _HAS_ST_BLOCKS
+    stack = [path]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_file(follow_symlinks=False):
+                            st = entry.stat(follow_symlinks=False)
+                            yield st.st_blocks * 512 if on_disk else st.st_size
+                        elif entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                    except OSError:
+                        pass
+        except OSError:
+            pass
+
+# JSON files smaller than this are not worth minifying
+_MIN_MINIFY_SIZE = 256
+
+# Minimum number of changed JSON files worth starting worker processes for
+_PROCESS_POOL_MIN_FILES = 64
+
+# Whitespace only found outside string literals in JSON that is not compact:
+# raw newlines and tabs (escaped inside strings), or spaces next to
+# structural characters (may also match inside strings, which only costs
+# a parse)
+_LOOSE_JSON_RE = re.compile(rb"[\n\r\t]|[,:\[{] | [,:\]}]")
+
+# Runs of 19+ digits: possibly integers beyond 64 bits (below -2**63 or
+# above 2**64 - 1), which orjson would read as floats (losing precision)
+# but json keeps exact
+_LONG_NUMBER_RE = re.compile(rb"\d{19,}")
+
+def _load_json_file(file_path: str) -> Any:
+    """
+    Parse a JSON file, with orjson when available
+    
+    Args:
+        file_path: JSON file path
+        
+    Returns:
+        Any: Parsed content
+        
+    Raises:
+        json.JSONDecodeError: If the file is not valid JSON
+    """
+    with open(file_path, "rb") as f:
+        content = f.read()
+    
+    if HAS_ORJSON:
+        return orjson.loads(content)
+    return json.loads(content)
+
+def _top_level_keys(file_path: str) -> set:
+    """
+    Read the top-level keys of a JSON object file
+    
+    With ijson the file is streamed and nested values are never built.
+    
+    Args:
+        file_path: JSON file path
+        
+    Returns:
+        set: Top-level keys
+        
+    Raises:
+        ValueError: If the file is not a valid JSON object
+    """
+    if not HAS_IJSON:
+        content = _load_json_file(file_path)
+        if not isinstance(content, dict):
+            raise ValueError("not a JSON object")
+        return set(content)
+    
+    with open(file_path, "rb") as f:
+        try:
+            events = ijson.parse(f)
+            first = next(events, None)
+            if first is None or first[1] != "start_map":
+                raise ValueError("not a JSON object")
+            return {value for prefix, event, value in events if prefix == "" and event == "map_key"}
+        except ijson.JSONError as e:
+            raise ValueError(str(e)) from e
+
+def _write_file_atomic(file_path: str, data: bytes):
+    """
+    Replace a file's content in one write, atomically
+    
+    The data is written to a temporary file that is then swapped in, so
+    readers never see a partially written file.
+    
+    Args:
+        file_path: File path
+        data: New content
+    """
+    temp_path = file_path + ".tmp"
+    try:
+        with open(temp_path, "wb") as f:
+            f.write(data)
+        os.replace(temp_path, file_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+# Content written for a missing or invalid processed_courses.json
+_EMPTY_COURSES = b"[]"
+
+def _is_bracketed_array(file_path: str) -> bool:
+    """
+    Cheaply check whether a file looks like a JSON array
+    
+    Only the first and last 8 KB are read: the file must start with "["
+    and end with "]" (ignoring whitespace). The content in between is not
+    checked, so the file must still be parsed to know it is valid.
+    
+    Args:
+        file_path: JSON file path
+        
+    Returns:
+        bool: True if the file is bracketed like an array
+    """
+    with open(file_path, "rb") as f:
+        head = f.read(8192).lstrip()
+        if not head.startswith(b"["):
+            return False
+        size = f.seek(0, os.SEEK_END)
+        f.seek(max(size - 8192, 0))
+        tail = f.read().rstrip()
+    return tail.endswith(b"]")
+
+def _minify_json_file(file_path: str):
+    """
+    Rewrite a JSON file without whitespace, atomically
+    
+    Small files, and files without whitespace between tokens, are left
+    untouched, as is any file that minifies to its current content. Past
+    the first 4 KB, whitespace is looked for through a read-only memory
+    map, so compact files are never copied into memory.
+    
+    Args:
+        file_path: JSON file path
+    """
+    with open(file_path, "rb") as f:
+        head = f.read(4096)
+        if len(head) < _MIN_MINIFY_SIZE:
+            return
+        if not _LOOSE_JSON_RE.search(head):
+            if len(head) < 4096:
+                return
+            # Resume the search just before the end of the head, so
+            # whitespace on the boundary is not missed
+            start = len(head) - 1
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if not _LOOSE_JSON_RE.search(mm, start):
+                    return
+        content = head + f.read()
+    
+    if HAS_ORJSON and not _LONG_NUMBER_RE.search(content):
+        minified = orjson.dumps(orjson.loads(content))
+    else:
+        minified = json.dumps(json.loads(content), separators=(",", ":")).encode("utf-8")
+    
+    # Already compact
+    if minified == content:
+        return
+    
+    _write_file_atomic(file_path, minified)
+
+# Subdirectories never searched for log, backup or database files
+# (hidden directories are skipped as well)
+_PRUNE_DIRS = frozenset(("node_modules", "__pycache__"))
+
+def _is_pruned(name: str) -> bool:
+    """Whether a subdirectory is skipped by extension-filtered walks"""
+    return name.startswith(".") or name in _PRUNE_DIRS
+
+def _iter_json_files(root: str):
+    """
+    Yield the JSON files below a directory
+    
+    Walks the tree with an explicit stack of os.scandir calls, skipping
+    hidden and _PRUNE_DIRS subdirectories and symlinks.
+    
+    Args:
+        root: Directory path
+        
+    Yields:
+        os.DirEntry: Entry of each JSON file
+    """
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if not _is_pruned(entry.name):
+                                stack.append(entry.path)
+                        elif entry.name.endswith(JSON_EXTS) and entry.is_file(follow_symlinks=False):
+                            yield entry
+                    except OSError:
+                        pass
+        except OSError:
+            pass
+
+def _try_minify_json_file(file_path: str) -> bool:
+    """
+    Minify a JSON file, reporting failures instead of raising
+    
+    Args:
+        file_path: JSON file path
+        
+    Returns:
+        bool: True if the file was handled (minified or already compact)
+    """
+    try:
+        _minify_json_file(file_path)
+        return True
+    except (OSError, ValueError, RecursionError):
+        return False
+
+# Whether files can be unlinked relative to an open directory (unlinkat)
+_UNLINK_DIR_FD = os.unlink in os.supports_dir_fd and hasattr(os, "O_DIRECTORY")
+
+def _walk(top: str, topdown: bool = True):
+    """
+    Walk a directory tree, with directory descriptors where supported
+    
+    Uses os.fwalk on POSIX so callers can stat, unlink and rmdir entries
+    relative to their directory instead of by full path.
+    
+    Args:
+        top: Directory path
+        topdown: Yield directories before their subdirectories
+        
+    Yields:
+        Tuple: (root, dirs, files, dir_fd), dir_fd being None without os.fwalk
+    """
+    if hasattr(os, "fwalk"):
+        yield from os.fwalk(top, topdown=topdown)
+    else:
+        for root, dirs, files in os.walk(top, topdown=topdown):
+            yield root, dirs, files, None
+
+def _match_all(name: str, mtime: float) -> bool:
+    """Sweep predicate that deletes every file"""
+    return True
+
+# Fingerprints of the optimized database files, kept in the cache
+# directory; sweeps never delete them
+_OPT_CACHE_NAME = ".opt-cache.json"
+
+def _run_after(future: Future, step):
+    """
+    Run a step once another one has finished (successfully or not)
+    
+    Args:
+        future: Future of the step to wait for
+        step: Step to run
+        
+    Returns:
+        Any: Result of the step
+    """
+    wait([future])
+    return step()
+
+def _sweep(root: str, predicate, prune: bool = False,
+           exts: Optional[Tuple[str, ...]] = None) -> Tuple[int, int]:
+    """
+    Measure a directory and delete matching files in a single walk
+    
+    Where supported, files are unlinked relative to a descriptor of their
+    directory, opened on the first deletion, so paths are resolved once
+    per directory instead of once per file. The database fingerprint file
+    is skipped.
+    
+    Args:
+        root: Directory path
+        predicate: Called with (file name, mtime); files it accepts are deleted
+        prune: Skip hidden and _PRUNE_DIRS subdirectories
+        exts: Only consider files with these extensions; others are never
+            stat'ed and do not count towards the initial size
+        
+    Returns:
+        Tuple[int, int]: Initial size and space freed, in bytes
+    """
+    initial = 0
+    freed = 0
+    dir_fd = None
+    try:
+        with os.scandir(root) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if prune and _is_pruned(entry.name):
+                            continue
+                        sub_initial, sub_freed = _sweep(entry.path, predicate, prune, exts)
+                        initial += sub_initial
+                        freed += sub_freed
+                        continue
+                    
+                    if exts is not None and not entry.name.endswith(exts):
+                        continue
+                    if entry.name == _OPT_CACHE_NAME:
+                        continue
+                    
+                    st = entry.stat(follow_symlinks=False)
+                    initial += st.st_size
+                    if predicate(entry.name, st.st_mtime):
+                        if _UNLINK_DIR_FD:
+                            if dir_fd is None:
+                                dir_fd = os.open(root, os.O_RDONLY | os.O_DIRECTORY)
+                            os.unlink(entry.name, dir_fd=dir_fd)
+                        else:
+                            os.unlink(entry.path)
+                        freed += st.st_size
+                except OSError:
+                    pass
+    except OSError:
+        pass
+    finally:
+        if dir_fd is not None:
+            os.close(dir_fd)
+    
+    return initial, freed
+
+# Default settings, with "paths" relative to the base directory
+DEFAULT_SETTINGS = {
+    "paths": {
+        "work_dir": "work",
+        "github_dir": "github",
+        "xml_dir": "xml"
+    },
+    "language": "pt-BR",
+    "tts_settings": {
+        "voice": "pt-BR-Standard-A",
+        "rate": 1.0,
+        "pitch": 0.0
+    },
+    "ai_settings": {
+        "model": "gpt-4",
+        "temperature": 0.7,
+        "max_tokens": 4000
+    }
+}
+
+# Top-level keys every settings file must have
+_REQUIRED_SETTING_KEYS = frozenset(DEFAULT_SETTINGS)
+
+# System validations: (report name, SystemMaintenance validator method,
+# progress description, recommendation when the validation fails)
+VALIDATIONS = (
+    ("Diretórios", "validate_directories", "[cyan]Validando diretórios...", "Executar reparo de diretórios"),
+    ("Arquivos", "validate_files", "[cyan]Validando arquivos...", "Executar reparo de arquivos"),
+    ("Configurações", "validate_config_files", "[cyan]Validando arquivos de configuração...", "Restaurar configurações padrão"),
+    ("Banco de Dados", "validate_database", "[cyan]Validando banco de dados...", "Reparar banco de dados"),
+    ("APIs", "validate_api_credentials", "[cyan]Validando credenciais de API...", "Configurar credenciais de API")
+)
+
+# Repair steps, in order: (SystemMaintenance repair method, status message)
+REPAIRS = (
+    ("_repair_directories", "Reparando diretórios..."),
+    ("_repair_files", "Reparando arquivos..."),
+    ("_repair_config_files", "Reparando arquivos de configuração..."),
+    ("_repair_database", "Reparando banco de dados...")
+)
+
 class SystemMaintenance:
     """System maintenance class"""
     
@@ -44,9 +494,58 @@ class SystemMaintenance:
         self.cache_dir = os.path.join(self.base_dir, "cache")
         self.backups_dir = os.path.join(self.base_dir, "backups")
         
+        # Define required data files
+        self.settings_file = os.path.join(self.data_dir, "settings.json")
+        self.courses_file = os.path.join(self.data_dir, "processed_courses.json")
+        self.required_files = (self.settings_file, self.courses_file)
+        
         # Create directories if they don't exist
         for directory in [self.data_dir, self.temp_dir, self.logs_dir, self.cache_dir, self.backups_dir]:
             os.makedirs(directory, exist_ok=True)
+        
+        # Default settings, with paths resolved against the base directory,
+        # and their serialized form for recreating settings.json
+        self._default_settings = dict(DEFAULT_SETTINGS)
+        self._default_settings["paths"] = {
+            name: os.path.join(self.base_dir, path) for name, path in DEFAULT_SETTINGS["paths"].items()
+        }
+        self._default_settings_bytes = json.dumps(self._default_settings, indent=4).encode("utf-8")
+        
+        # Parsed settings.json, keyed by its (mtime, size) when it was read
+        self._settings_cache: Optional[Tuple[Tuple[int, int], Any]] = None
+    
+    def _load_settings(self) -> Any:
+        """
+        Load settings.json, reusing the last parse while the file is unchanged
+        
+        The returned object is shared between calls and must not be modified.
+        
+        Returns:
+            Any: Parsed settings
+            
+        Raises:
+            OSError: If the file cannot be read
+            json.JSONDecodeError: If the file is not valid JSON
+        """
+        st = os.stat(self.settings_file)
+        key = (st.st_mtime_ns, st.st_size)
+        cache = self._settings_cache
+        if cache is not None and cache[0] == key:
+            return cache[1]
+        
+        settings = _load_json_file(self.settings_file)
+        self._settings_cache = (key, settings)
+        return settings
+    
+    def _save_settings(self, data: bytes):
+        """
+        Write settings.json and drop the cached parse
+        
+        Args:
+            data: Serialized settings
+        """
+        self._settings_cache = None
+        _write_file_atomic(self.settings_file, data)
     
     def cleanup_temp_files(self) -> float:
         """
@@ -57,53 +556,55 @@ class SystemMaintenance:
         """
         console.print(f"[{NORD_CYAN}]Limpando arquivos temporários...[/{NORD_CYAN}]")
         
+        # Nothing to clean up
+        if _is_empty_dir(self.temp_dir):
+            console.print(f"[{NORD_GREEN}]✅ Limpeza concluída! Espaço liberado: 0.00 MB[/{NORD_GREEN}]")
+            return 0.0
+        
         # Create progress bar
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-            console=console
-        ) as progress:
+        with _progress() as progress:
             # Add task
             task = progress.add_task("[cyan]Limpando...", total=100)
             
-            # Get initial size
-            initial_size = self.get_directory_size(self.temp_dir)
+            # Space freed, counted as files are deleted
+            freed = 0
+            join = os.path.join
             
-            # Clean up temporary files
-            for root, dirs, files in os.walk(self.temp_dir):
+            # Clean up temporary files (bottom-up, so emptied subdirectories
+            # can be removed before their parents); entries are addressed
+            # relative to their directory's descriptor when there is one
+            for root, dirs, files, root_fd in _walk(self.temp_dir, topdown=False):
                 # Update progress
                 progress.update(task, advance=10)
                 
                 # Delete files
                 for file in files:
-                    file_path = os.path.join(root, file)
+                    target = file if root_fd is not None else join(root, file)
                     try:
-                        os.remove(file_path)
-                    except Exception as e:
-                        console.print(f"[{NORD_RED}]Erro ao excluir {file_path}: {str(e)}[/{NORD_RED}]")
+                        size = os.lstat(target, dir_fd=root_fd).st_size
+                        os.remove(target, dir_fd=root_fd)
+                        freed += size
+                    except OSError as e:
+                        console.print(f"[{NORD_RED}]Erro ao excluir {join(root, file)}: {str(e)}[/{NORD_RED}]")
                 
                 # Update progress
                 progress.update(task, advance=40)
                 
-                # Delete empty directories
+                # Delete empty directories (rmdir refuses non-empty ones)
                 for dir in dirs:
-                    dir_path = os.path.join(root, dir)
+                    target = dir if root_fd is not None else join(root, dir)
                     try:
-                        if not os.listdir(dir_path):
-                            os.rmdir(dir_path)
-                    except Exception as e:
-                        console.print(f"[{NORD_RED}]Erro ao excluir diretório {dir_path}: {str(e)}[/{NORD_RED}]")
+                        os.rmdir(target, dir_fd=root_fd)
+                    except OSError as e:
+                        if e.errno in (errno.ENOTEMPTY, errno.EEXIST):
+                            continue
+                        console.print(f"[{NORD_RED}]Erro ao excluir diretório {join(root, dir)}: {str(e)}[/{NORD_RED}]")
                 
                 # Update progress
                 progress.update(task, advance=50)
             
-            # Get final size
-            final_size = self.get_directory_size(self.temp_dir)
-            
             # Calculate space freed
-            space_freed = (initial_size - final_size) / (1024 * 1024)  # Convert to MB
+            space_freed = freed / (1024 * 1024)  # Convert to MB
             
             # Complete progress
             progress.update(task, completed=100)
@@ -112,26 +613,18 @@ class SystemMaintenance:
         
         return space_freed
     
-    def get_directory_size(self, directory: str) -> float:
+    def get_directory_size(self, directory: str, on_disk: bool = False) -> float:
         """
         Get directory size
         
         Args:
             directory: Directory path
+            on_disk: Count allocated disk space rather than file sizes
             
         Returns:
             float: Directory size in bytes
         """
-        total_size = 0
-        for root, dirs, files in os.walk(directory):
-            for file in files:
-                file_path = os.path.join(root, file)
-                try:
-                    total_size += os.path.getsize(file_path)
-                except Exception:
-                    pass
-        
-        return total_size
+        return sum(_iter_size(directory, on_disk))
     
     def format_size(self, size_bytes: float) -> str:
         """
@@ -163,57 +656,40 @@ class SystemMaintenance:
         console.print(f"[{NORD_CYAN}]Validando integridade do sistema...[/{NORD_CYAN}]")
         
         # Create progress bar
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-            console=console
-        ) as progress:
+        with _progress() as progress:
             # Add task
             task = progress.add_task("[cyan]Validando...", total=100)
             
-            # Validate directories
-            progress.update(task, advance=20, description="[cyan]Validando diretórios...")
-            directories_valid = self.validate_directories()
-            
-            # Validate files
-            progress.update(task, advance=20, description="[cyan]Validando arquivos...")
-            files_valid = self.validate_files()
+            # Run the validators concurrently, advancing the bar as each one finishes
+            with ThreadPoolExecutor(max_workers=len(VALIDATIONS)) as executor:
+                futures = {
+                    executor.submit(getattr(self, method_name)): (validation_name, description)
+                    for validation_name, method_name, description, _ in VALIDATIONS
+                }
+                validations = {}
+                for future in as_completed(futures):
+                    validation_name, description = futures[future]
+                    progress.update(task, advance=20, description=description)
+                    validations[validation_name] = future.result()
             
-            # Validate config files
-            progress.update(task, advance=20, description="[cyan]Validando arquivos de configuração...")
-            config_valid = self.validate_config_files()
-            
-            # Validate database
-            progress.update(task, advance=20, description="[cyan]Validando banco de dados...")
-            database_valid = self.validate_database()
-            
-            # Validate API credentials
-            progress.update(task, advance=20, description="[cyan]Validando credenciais de API...")
-            api_valid = self.validate_api_credentials()
+            # Keep the validations in table order
+            validations = {name: validations[name] for name, _, _, _ in VALIDATIONS}
             
             # Complete progress
             progress.update(task, completed=100)
         
-        # Create health report
-        validations = {
-            "Diretórios": directories_valid,
-            "Arquivos": files_valid,
-            "Configurações": config_valid,
-            "Banco de Dados": database_valid,
-            "APIs": api_valid
-        }
-        
-        # Count issues
+        # Collect issues and recommendations
         issues = []
-        for validation_name, validation in validations.items():
+        recommendations = []
+        for validation_name, _, _, recommendation in VALIDATIONS:
+            validation = validations[validation_name]
             if not validation["is_valid"]:
                 for issue in validation["issues"]:
                     issues.append({
                         "validation": validation_name,
                         "description": issue
                     })
+                recommendations.append(recommendation)
         
         # Determine system health
         if len(issues) == 0:
@@ -223,29 +699,10 @@ class SystemMaintenance:
         else:
             system_health = "CRÍTICO"
         
-        # Create recommendations
-        recommendations = []
-        if not directories_valid["is_valid"]:
-            recommendations.append("Executar reparo de diretórios")
-        if not files_valid["is_valid"]:
-            recommendations.append("Executar reparo de arquivos")
-        if not config_valid["is_valid"]:
-            recommendations.append("Restaurar configurações padrão")
-        if not database_valid["is_valid"]:
-            recommendations.append("Reparar banco de dados")
-        if not api_valid["is_valid"]:
-            recommendations.append("Configurar credenciais de API")
-        
         # Create health report
         health_report = {
             "system_health": system_health,
-            "validations": {
-                "Diretórios": directories_valid,
-                "Arquivos": files_valid,
-                "Configurações": config_valid,
-                "Banco de Dados": database_valid,
-                "APIs": api_valid
-            },
+            "validations": validations,
             "issues": issues,
             "recommendations": recommendations
         }
@@ -296,12 +753,7 @@ class SystemMaintenance:
         issues = []
         
         # Check if required files exist
-        required_files = [
-            os.path.join(self.data_dir, "settings.json"),
-            os.path.join(self.data_dir, "processed_courses.json")
-        ]
-        
-        for file_path in required_files:
+        for file_path in self.required_files:
             if not os.path.exists(file_path):
                 issues.append(f"Arquivo não encontrado: {file_path}")
             elif not os.path.isfile(file_path):
@@ -326,15 +778,13 @@ class SystemMaintenance:
         issues = []
         
         # Check if settings.json is valid
-        settings_file = os.path.join(self.data_dir, "settings.json")
+        settings_file = self.settings_file
         if os.path.exists(settings_file):
             try:
-                with open(settings_file, "r") as f:
-                    settings = json.load(f)
+                settings = self._load_settings()
                 
                 # Check if settings has required keys
-                required_keys = ["paths", "language", "tts_settings", "ai_settings"]
-                for key in required_keys:
+                for key in DEFAULT_SETTINGS:
                     if key not in settings:
                         issues.append(f"Configuração ausente: {key}")
             except json.JSONDecodeError:
@@ -357,11 +807,10 @@ class SystemMaintenance:
         issues = []
         
         # Check if processed_courses.json is valid
-        courses_file = os.path.join(self.data_dir, "processed_courses.json")
+        courses_file = self.courses_file
         if os.path.exists(courses_file):
             try:
-                with open(courses_file, "r") as f:
-                    courses = json.load(f)
+                courses = _load_json_file(courses_file)
                 
                 # Check if courses is a list
                 if not isinstance(courses, list):
@@ -419,42 +868,38 @@ class SystemMaintenance:
         elif health_report["system_health"] == "CRÍTICO":
             health_color = NORD_RED
         
-        # Create health report panel
-        report_text = [
-            f"🏥 Relatório de Saúde do Sistema",
-            f"[{NORD_DIM}]━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━[/{NORD_DIM}]",
-            "",
-            f"[{health_color}]✅ Sistema Geral: {health_report['system_health']}[/{health_color}]",
-            "",
-            f"[{NORD_CYAN}]🔍 Verificações Realizadas:[/{NORD_CYAN}]"
-        ]
-        
-        # Add validation results
-        for validation_name, result in health_report["validations"].items():
-            status_icon = "✅" if result["is_valid"] else "⚠️"
-            report_text.append(f"{status_icon} {validation_name}")
+        # Create health report text
+        validation_lines = "\n".join(
+            f"{'✅' if result['is_valid'] else '⚠️'} {validation_name}"
+            for validation_name, result in health_report["validations"].items()
+        )
+        report_text = (
+            f"🏥 Relatório de Saúde do Sistema\n"
+            f"[{NORD_DIM}]━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━[/{NORD_DIM}]\n\n"
+            f"[{health_color}]✅ Sistema Geral: {health_report['system_health']}[/{health_color}]\n\n"
+            f"[{NORD_CYAN}]🔍 Verificações Realizadas:[/{NORD_CYAN}]\n"
+            f"{validation_lines}"
+        )
         
         # Add issues
         if health_report["issues"]:
-            report_text.append("")
-            report_text.append(f"[{NORD_YELLOW}]⚠️ Problemas Encontrados:[/{NORD_YELLOW}]")
-            
-            for issue in health_report["issues"]:
-                report_text.append(f"• {issue['description']}")
+            issue_lines = "\n".join(f"• {issue['description']}" for issue in health_report["issues"])
+            report_text += f"\n\n[{NORD_YELLOW}]⚠️ Problemas Encontrados:[/{NORD_YELLOW}]\n{issue_lines}"
         
         # Add recommendations
         if health_report["recommendations"]:
-            report_text.append("")
-            report_text.append(f"[{NORD_CYAN}]🔧 Ações Recomendadas:[/{NORD_CYAN}]")
-            
-            for i, recommendation in enumerate(health_report["recommendations"], 1):
-                report_text.append(f"[{NORD_BLUE}][{i}][/{NORD_BLUE}] {recommendation}")
-            
-            report_text.append(f"[{NORD_BLUE}][0][/{NORD_BLUE}] ← Voltar")
+            recommendation_lines = "\n".join(
+                f"[{NORD_BLUE}][{i}][/{NORD_BLUE}] {recommendation}"
+                for i, recommendation in enumerate(health_report["recommendations"], 1)
+            )
+            report_text += (
+                f"\n\n[{NORD_CYAN}]🔧 Ações Recomendadas:[/{NORD_CYAN}]\n{recommendation_lines}\n"
+                f"[{NORD_BLUE}][0][/{NORD_BLUE}] ← Voltar"
+            )
         
         # Create panel
         panel = Panel(
-            Text.from_markup("\n".join(report_text)),
+            Text.from_markup(report_text),
             title="Relatório de Saúde do Sistema",
             border_style=NORD_CYAN,
             padding=(1, 2)
@@ -468,106 +913,43 @@ class SystemMaintenance:
         """
         console.print(f"[{NORD_CYAN}]Otimizando armazenamento...[/{NORD_CYAN}]")
         
-        # Get initial sizes
-        temp_initial_size = self.get_directory_size(self.temp_dir)
-        logs_initial_size = self.get_directory_size(self.logs_dir)
-        data_initial_size = self.get_directory_size(self.data_dir)
-        cache_initial_size = self.get_directory_size(self.cache_dir)
-        backups_initial_size = self.get_directory_size(self.backups_dir)
-        
         # Create progress bar
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-            console=console
-        ) as progress:
-            # Add task
+        with _progress() as progress:
+            # Add tasks (the database pass advances its own bar per file)
             task = progress.add_task("[cyan]Otimizando...", total=100)
+            db_task = progress.add_task("[cyan]Arquivos do banco de dados", total=None)
             
-            # Clean up temporary files
-            progress.update(task, advance=20, description="[cyan]Limpando arquivos temporários...")
-            for root, dirs, files in os.walk(self.temp_dir):
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    try:
-                        os.remove(file_path)
-                    except Exception:
-                        pass
-            
-            # Clean up log files
-            progress.update(task, advance=20, description="[cyan]Limpando arquivos de log...")
-            for root, dirs, files in os.walk(self.logs_dir):
-                for file in files:
-                    if file.endswith(".log"):
-                        file_path = os.path.join(root, file)
-                        try:
-                            # Check if file is older than 30 days
-                            if os.path.getmtime(file_path) < time.time() - 30 * 24 * 60 * 60:
-                                os.remove(file_path)
-                        except Exception:
-                            pass
-            
-            # Optimize database files
-            progress.update(task, advance=20, description="[cyan]Otimizando banco de dados...")
-            for root, dirs, files in os.walk(self.data_dir):
-                for file in files:
-                    if file.endswith(".json"):
-                        file_path = os.path.join(root, file)
-                        try:
-                            # Read file
-                            with open(file_path, "r") as f:
-                                data = json.load(f)
-                            
-                            # Write file with minimal formatting
-                            with open(file_path, "w") as f:
-                                json.dump(data, f, separators=(",", ":"))
-                        except Exception:
-                            pass
+            # Cleanup passes (independent directories, run concurrently)
+            passes = [
+                (self._cleanup_temp_files, "[cyan]Limpando arquivos temporários..."),
+                (self._cleanup_log_files, "[cyan]Limpando arquivos de log..."),
+                (self._cleanup_cache_files, "[cyan]Limpando arquivos de cache..."),
+                (self._remove_old_backups, "[cyan]Removendo backups antigos...")
+            ]
             
-            # Clean up cache files
-            progress.update(task, advance=20, description="[cyan]Limpando arquivos de cache...")
-            for root, dirs, files in os.walk(self.cache_dir):
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    try:
-                        # Check if file is older than 7 days
-                        if os.path.getmtime(file_path) < time.time() - 7 * 24 * 60 * 60:
-                            os.remove(file_path)
-                    except Exception:
-                        pass
-            
-            # Remove old backups
-            progress.update(task, advance=20, description="[cyan]Removendo backups antigos...")
-            for root, dirs, files in os.walk(self.backups_dir):
-                for file in files:
-                    if file.endswith(".bak") or file.endswith(".backup"):
-                        file_path = os.path.join(root, file)
-                        try:
-                            # Check if file is older than 90 days
-                            if os.path.getmtime(file_path) < time.time() - 90 * 24 * 60 * 60:
-                                os.remove(file_path)
-                        except Exception:
-                            pass
+            # Run all passes, advancing the bar as each one finishes
+            with ThreadPoolExecutor(max_workers=len(passes) + 1) as executor:
+                futures = {executor.submit(cleanup_pass): description for cleanup_pass, description in passes}
+                
+                # The database pass rewrites its fingerprints in the cache
+                # directory, so it starts once the cache pass (third) is done
+                cache_future = list(futures)[2]
+                db_future = executor.submit(
+                    _run_after, cache_future, functools.partial(self._optimize_database_files, progress, db_task)
+                )
+                futures[db_future] = "[cyan]Otimizando banco de dados..."
+                
+                for future in as_completed(futures):
+                    progress.update(task, advance=20, description=futures[future])
+                
+                # Space freed per pass in MB (in submission order)
+                temp_space_freed, log_space_freed, cache_space_freed, backup_space_freed, db_space_freed = (
+                    future.result()[1] / (1024 * 1024) for future in futures
+                )
             
             # Complete progress
             progress.update(task, completed=100)
         
-        # Get final sizes
-        temp_final_size = self.get_directory_size(self.temp_dir)
-        logs_final_size = self.get_directory_size(self.logs_dir)
-        data_final_size = self.get_directory_size(self.data_dir)
-        cache_final_size = self.get_directory_size(self.cache_dir)
-        backups_final_size = self.get_directory_size(self.backups_dir)
-        
-        # Calculate space freed
-        temp_space_freed = (temp_initial_size - temp_final_size) / (1024 * 1024)  # Convert to MB
-        log_space_freed = (logs_initial_size - logs_final_size) / (1024 * 1024)  # Convert to MB
-        db_space_freed = (data_initial_size - data_final_size) / (1024 * 1024)  # Convert to MB
-        cache_space_freed = (cache_initial_size - cache_final_size) / (1024 * 1024)  # Convert to MB
-        backup_space_freed = (backups_initial_size - backups_final_size) / (1024 * 1024)  # Convert to MB
-        
         # Calculate total space freed
         total_space_freed = temp_space_freed + log_space_freed + db_space_freed + cache_space_freed + backup_space_freed
         
@@ -596,128 +978,136 @@ class SystemMaintenance:
         
         console.print(panel)
     
-    def _cleanup_log_files(self) -> float:
+    def _cleanup_temp_files(self) -> Tuple[int, int]:
         """
-        Clean up log files
+        Clean up temporary files
         
         Returns:
-            float: Space freed in MB
+            Tuple[int, int]: Initial size and space freed, in bytes
         """
-        # Get initial size
-        initial_size = self.get_directory_size(self.logs_dir)
-        
-        # Clean up log files
-        for root, dirs, files in os.walk(self.logs_dir):
-            for file in files:
-                if file.endswith(".log"):
-                    file_path = os.path.join(root, file)
-                    try:
-                        # Check if file is older than 30 days
-                        if os.path.getmtime(file_path) < time.time() - 30 * 24 * 60 * 60:
-                            os.remove(file_path)
-                    except Exception:
-                        pass
-        
-        # Get final size
-        final_size = self.get_directory_size(self.logs_dir)
-        
-        # Calculate space freed
-        space_freed = (initial_size - final_size) / (1024 * 1024)  # Convert to MB
+        return _sweep(self.temp_dir, _match_all)
+    
+    def _cleanup_log_files(self) -> Tuple[int, int]:
+        """
+        Clean up log files
         
-        return space_freed
+        Returns:
+            Tuple[int, int]: Initial size of the log files and space freed, in bytes
+        """
+        # Delete log files older than 30 days
+        cutoff = time.time() - LOG_AGE
+        return _sweep(self.logs_dir, lambda name, mtime: mtime < cutoff, prune=True, exts=LOG_EXTS)
     
-    def _optimize_database_files(self) -> float:
+    def _optimize_database_files(self, progress: Optional[Progress] = None,
+                                 task_id: Optional[TaskID] = None) -> Tuple[int, int]:
         """
         Optimize database files
         
+        Args:
+            progress: Optional progress bar, advanced as each file is optimized
+            task_id: Optional task ID for progress bar
+            
         Returns:
-            float: Space freed in MB
+            Tuple[int, int]: Initial size of the database files and space freed, in bytes
         """
-        # Get initial size
-        initial_size = self.get_directory_size(self.data_dir)
-        
-        # Optimize database files
-        for root, dirs, files in os.walk(self.data_dir):
-            for file in files:
-                if file.endswith(".json"):
-                    file_path = os.path.join(root, file)
-                    try:
-                        # Read file
-                        with open(file_path, "r") as f:
-                            data = json.load(f)
-                        
-                        # Write file with minimal formatting
-                        with open(file_path, "w") as f:
-                            json.dump(data, f, separators=(",", ":"))
-                    except Exception:
-                        pass
-        
-        # Get final size
-        final_size = self.get_directory_size(self.data_dir)
-        
-        # Calculate space freed
-        space_freed = (initial_size - final_size) / (1024 * 1024)  # Convert to MB
-        
-        return space_freed
+        # Nothing to optimize
+        if _is_empty_dir(self.data_dir):
+            if progress is not None:
+                progress.update(task_id, total=1, completed=1)
+            return 0, 0
+        
+        # Load the (size, mtime) fingerprints of files handled on earlier runs
+        cache_file = os.path.join(self.cache_dir, _OPT_CACHE_NAME)
+        try:
+            with open(cache_file, "r") as f:
+                fingerprints = json.load(f)
+        except (OSError, ValueError):
+            fingerprints = {}
+        updated_fingerprints = {}
+        initial_size = 0
+        freed = 0
+        
+        # Measure the database files and find those changed since the last run
+        candidates = []
+        for entry in _iter_json_files(self.data_dir):
+            try:
+                st = entry.stat(follow_symlinks=False)
+            except OSError:
+                continue
+            initial_size += st.st_size
+            fingerprint = [st.st_size, st.st_mtime_ns]
+            if fingerprints.get(entry.path) == fingerprint:
+                updated_fingerprints[entry.path] = fingerprint
+            else:
+                candidates.append((entry.path, st.st_size))
+        
+        # Optimize them, in worker processes when there are many, taking
+        # each result as soon as it is ready
+        if progress is not None:
+            progress.update(task_id, total=len(candidates) or 1, completed=0 if candidates else 1)
+        use_pool = len(candidates) >= _PROCESS_POOL_MIN_FILES
+        skipped = []
+        with (ProcessPoolExecutor(mp_context=multiprocessing.get_context("spawn"))
+              if use_pool else contextlib.nullcontext()) as executor:
+            if use_pool:
+                futures = {
+                    executor.submit(_try_minify_json_file, file_path): (file_path, size)
+                    for file_path, size in candidates
+                }
+                results = ((futures[future], future.result()) for future in as_completed(futures))
+            else:
+                results = (((file_path, size), _try_minify_json_file(file_path)) for file_path, size in candidates)
+            
+            for (file_path, size), optimized in results:
+                if progress is not None:
+                    progress.advance(task_id)
+                if not optimized:
+                    skipped.append(file_path)
+                    continue
+                try:
+                    st = os.stat(file_path)
+                except OSError:
+                    continue
+                updated_fingerprints[file_path] = [st.st_size, st.st_mtime_ns]
+                freed += size - st.st_size
+        
+        if skipped:
+            logger.warning(f"Skipped {len(skipped)} database files that could not be optimized: {', '.join(skipped)}")
+        
+        # Save fingerprints for the next run
+        try:
+            _write_file_atomic(cache_file, json.dumps(updated_fingerprints).encode("utf-8"))
+        except OSError:
+            pass
+        
+        return initial_size, freed
     
-    def _cleanup_cache_files(self) -> float:
+    def _cleanup_cache_files(self) -> Tuple[int, int]:
         """
         Clean up cache files
         
         Returns:
-            float: Space freed in MB
+            Tuple[int, int]: Initial size and space freed, in bytes
         """
-        # Get initial size
-        initial_size = self.get_directory_size(self.cache_dir)
-        
-        # Clean up cache files
-        for root, dirs, files in os.walk(self.cache_dir):
-            for file in files:
-                file_path = os.path.join(root, file)
-                try:
-                    # Check if file is older than 7 days
-                    if os.path.getmtime(file_path) < time.time() - 7 * 24 * 60 * 60:
-                        os.remove(file_path)
-                except Exception:
-                    pass
-        
-        # Get final size
-        final_size = self.get_directory_size(self.cache_dir)
-        
-        # Calculate space freed
-        space_freed = (initial_size - final_size) / (1024 * 1024)  # Convert to MB
-        
-        return space_freed
+        # Delete cache files older than 7 days
+        cutoff = time.time() - CACHE_AGE
+        return _sweep(self.cache_dir, lambda name, mtime: mtime < cutoff)
     
-    def _remove_old_backups(self) -> float:
+    def _remove_old_backups(self) -> Tuple[int, int]:
         """
         Remove old backups
         
         Returns:
-            float: Space freed in MB
+            Tuple[int, int]: Initial size of the backup files and space freed, in bytes
         """
-        # Get initial size
-        initial_size = self.get_directory_size(self.backups_dir)
-        
-        # Clean up backup files
-        for root, dirs, files in os.walk(self.backups_dir):
-            for file in files:
-                if file.endswith(".bak") or file.endswith(".backup"):
-                    file_path = os.path.join(root, file)
-                    try:
-                        # Check if file is older than 90 days
-                        if os.path.getmtime(file_path) < time.time() - 90 * 24 * 60 * 60:
-                            os.remove(file_path)
-                    except Exception:
-                        pass
-        
-        # Get final size
-        final_size = self.get_directory_size(self.backups_dir)
-        
-        # Calculate space freed
-        space_freed = (initial_size - final_size) / (1024 * 1024)  # Convert to MB
-        
-        return space_freed
+        # Delete backup files older than 90 days
+        cutoff = time.time() - BACKUP_AGE
+        return _sweep(
+            self.backups_dir,
+            lambda name, mtime: mtime < cutoff,
+            prune=True,
+            exts=BACKUP_EXTS
+        )
     
     def comprehensive_cleanup(self):
         """
@@ -725,102 +1115,46 @@ class SystemMaintenance:
         """
         console.print(f"[{NORD_CYAN}]Realizando limpeza completa...[/{NORD_CYAN}]")
         
-        # Get initial sizes
-        temp_initial_size = self.get_directory_size(self.temp_dir)
-        logs_initial_size = self.get_directory_size(self.logs_dir)
-        data_initial_size = self.get_directory_size(self.data_dir)
-        cache_initial_size = self.get_directory_size(self.cache_dir)
-        backups_initial_size = self.get_directory_size(self.backups_dir)
-        
         # Create progress bar
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-            console=console
-        ) as progress:
-            # Add task
+        with _progress() as progress:
+            # Add tasks (the database step advances its own bar per file)
             task = progress.add_task("[cyan]Limpando...", total=100)
+            db_task = progress.add_task("[cyan]Arquivos do banco de dados", total=None)
             
-            # Clean up temporary files
-            progress.update(task, advance=20, description="[cyan]Limpando arquivos temporários...")
-            for root, dirs, files in os.walk(self.temp_dir):
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    try:
-                        os.remove(file_path)
-                    except Exception:
-                        pass
-            
-            # Clean up log files
-            progress.update(task, advance=20, description="[cyan]Limpando arquivos de log...")
-            for root, dirs, files in os.walk(self.logs_dir):
-                for file in files:
-                    if file.endswith(".log"):
-                        file_path = os.path.join(root, file)
-                        try:
-                            os.remove(file_path)
-                        except Exception:
-                            pass
+            # Cleanup steps (all files of each kind, regardless of age)
+            steps = [
+                (functools.partial(_sweep, self.temp_dir, _match_all), "[cyan]Limpando arquivos temporários..."),
+                (functools.partial(_sweep, self.logs_dir, _match_all, prune=True, exts=LOG_EXTS),
+                 "[cyan]Limpando arquivos de log..."),
+                (functools.partial(_sweep, self.cache_dir, _match_all), "[cyan]Limpando arquivos de cache..."),
+                (functools.partial(_sweep, self.backups_dir, _match_all, prune=True, exts=BACKUP_EXTS),
+                 "[cyan]Removendo backups antigos...")
+            ]
             
-            # Clean up cache files
-            progress.update(task, advance=20, description="[cyan]Limpando arquivos de cache...")
-            for root, dirs, files in os.walk(self.cache_dir):
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    try:
-                        os.remove(file_path)
-                    except Exception:
-                        pass
-            
-            # Remove old backups
-            progress.update(task, advance=20, description="[cyan]Removendo backups antigos...")
-            for root, dirs, files in os.walk(self.backups_dir):
-                for file in files:
-                    if file.endswith(".bak") or file.endswith(".backup"):
-                        file_path = os.path.join(root, file)
-                        try:
-                            os.remove(file_path)
-                        except Exception:
-                            pass
-            
-            # Optimize database files
-            progress.update(task, advance=20, description="[cyan]Otimizando banco de dados...")
-            for root, dirs, files in os.walk(self.data_dir):
-                for file in files:
-                    if file.endswith(".json"):
-                        file_path = os.path.join(root, file)
-                        try:
-                            # Read file
-                            with open(file_path, "r") as f:
-                                data = json.load(f)
-                            
-                            # Write file with minimal formatting
-                            with open(file_path, "w") as f:
-                                json.dump(data, f, separators=(",", ":"))
-                        except Exception:
-                            pass
+            # Run the steps concurrently (each one works on its own directory),
+            # advancing the bar as each one finishes
+            with ThreadPoolExecutor(max_workers=len(steps) + 1) as executor:
+                futures = {executor.submit(step): description for step, description in steps}
+                
+                # The database step rewrites its fingerprints in the cache
+                # directory, so it starts once the cache sweep (third) is done
+                cache_future = list(futures)[2]
+                db_future = executor.submit(
+                    _run_after, cache_future, functools.partial(self._optimize_database_files, progress, db_task)
+                )
+                futures[db_future] = "[cyan]Otimizando banco de dados..."
+                
+                for future in as_completed(futures):
+                    progress.update(task, advance=20, description=futures[future])
+                
+                # Total space freed in bytes
+                freed = sum(future.result()[1] for future in futures)
             
             # Complete progress
             progress.update(task, completed=100)
         
-        # Get final sizes
-        temp_final_size = self.get_directory_size(self.temp_dir)
-        logs_final_size = self.get_directory_size(self.logs_dir)
-        data_final_size = self.get_directory_size(self.data_dir)
-        cache_final_size = self.get_directory_size(self.cache_dir)
-        backups_final_size = self.get_directory_size(self.backups_dir)
-        
-        # Calculate space freed
-        temp_space_freed = (temp_initial_size - temp_final_size) / (1024 * 1024)  # Convert to MB
-        log_space_freed = (logs_initial_size - logs_final_size) / (1024 * 1024)  # Convert to MB
-        db_space_freed = (data_initial_size - data_final_size) / (1024 * 1024)  # Convert to MB
-        cache_space_freed = (cache_initial_size - cache_final_size) / (1024 * 1024)  # Convert to MB
-        backup_space_freed = (backups_initial_size - backups_final_size) / (1024 * 1024)  # Convert to MB
-        
         # Calculate total space freed
-        total_space_freed = temp_space_freed + log_space_freed + db_space_freed + cache_space_freed + backup_space_freed
+        total_space_freed = freed / (1024 * 1024)  # Convert to MB
         
         console.print(f"[{NORD_GREEN}]✅ Limpeza completa concluída![/{NORD_GREEN}]")
     
@@ -830,35 +1164,10 @@ class SystemMaintenance:
         """
         console.print(f"[{NORD_CYAN}]Reparando sistema automaticamente...[/{NORD_CYAN}]")
         
-        # Create progress bar
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-            console=console
-        ) as progress:
-            # Add task
-            task = progress.add_task("[cyan]Reparando...", total=100)
-            
-            # Repair directories
-            progress.update(task, advance=20, description="[cyan]Reparando diretórios...")
-            self._repair_directories()
-            
-            # Repair files
-            progress.update(task, advance=20, description="[cyan]Reparando arquivos...")
-            self._repair_files()
-            
-            # Repair config files
-            progress.update(task, advance=20, description="[cyan]Reparando arquivos de configuração...")
-            self._repair_config_files()
-            
-            # Repair database
-            progress.update(task, advance=20, description="[cyan]Reparando banco de dados...")
-            self._repair_database()
-            
-            # Complete progress
-            progress.update(task, completed=100)
+        # Run the repair steps (all quick, so a status line each is enough)
+        for step, (method, description) in enumerate(REPAIRS, 1):
+            console.print(f"[cyan]{step}/{len(REPAIRS)} {description}")
+            getattr(self, method)()
         
         # Validate system integrity
         health_report = self.validate_system_integrity()
@@ -881,123 +1190,74 @@ class SystemMaintenance:
         """
         Repair files
         """
-        # Create required files if they don't exist
-        required_files = [
-            os.path.join(self.data_dir, "settings.json"),
-            os.path.join(self.data_dir, "processed_courses.json")
-        ]
-        
-        for file_path in required_files:
-            if not os.path.exists(file_path):
-                # Create file with default content
-                if file_path.endswith("settings.json"):
-                    with open(file_path, "w") as f:
-                        json.dump({
-                            "paths": {
-                                "work_dir": os.path.join(self.base_dir, "work"),
-                                "github_dir": os.path.join(self.base_dir, "github"),
-                                "xml_dir": os.path.join(self.base_dir, "xml")
-                            },
-                            "language": "pt-BR",
-                            "tts_settings": {
-                                "voice": "pt-BR-Standard-A",
-                                "rate": 1.0,
-                                "pitch": 0.0
-                            },
-                            "ai_settings": {
-                                "model": "gpt-4",
-                                "temperature": 0.7,
-                                "max_tokens": 4000
-                            }
-                        }, f, indent=4)
-                elif file_path.endswith("processed_courses.json"):
-                    with open(file_path, "w") as f:
-                        json.dump([], f, indent=4)
+        # List the data directory once instead of checking each file
+        try:
+            with os.scandir(self.data_dir) as entries:
+                existing = {entry.name for entry in entries}
+        except OSError:
+            existing = set()
+        
+        # Create required files with default content if they don't exist
+        if "settings.json" not in existing:
+            self._save_settings(self._default_settings_bytes)
+        if "processed_courses.json" not in existing:
+            _write_file_atomic(self.courses_file, _EMPTY_COURSES)
     
     def _repair_config_files(self):
         """
         Repair configuration files
         """
         # Repair settings.json
-        settings_file = os.path.join(self.data_dir, "settings.json")
+        settings_file = self.settings_file
         if os.path.exists(settings_file):
             try:
-                # Try to read settings
+                # Check if settings has required keys (streamed, without
+                # loading the values); healthy files are left untouched
+                missing_keys = _REQUIRED_SETTING_KEYS - _top_level_keys(settings_file)
+                if not missing_keys:
+                    return
+                
+                # Read settings
                 with open(settings_file, "r") as f:
                     settings = json.load(f)
-                
-                # Check if settings has required keys
-                required_keys = ["paths", "language", "tts_settings", "ai_settings"]
-                for key in required_keys:
-                    if key not in settings:
-                        # Add missing key
-                        if key == "paths":
-                            settings["paths"] = {
-                                "work_dir": os.path.join(self.base_dir, "work"),
-                                "github_dir": os.path.join(self.base_dir, "github"),
-                                "xml_dir": os.path.join(self.base_dir, "xml")
-                            }
-                        elif key == "language":
-                            settings["language"] = "pt-BR"
-                        elif key == "tts_settings":
-                            settings["tts_settings"] = {
-                                "voice": "pt-BR-Standard-A",
-                                "rate": 1.0,
-                                "pitch": 0.0
-                            }
-                        elif key == "ai_settings":
-                            settings["ai_settings"] = {
-                                "model": "gpt-4",
-                                "temperature": 0.7,
-                                "max_tokens": 4000
-                            }
-                
-                # Write settings
-                with open(settings_file, "w") as f:
-                    json.dump(settings, f, indent=4)
-            except Exception:
+            except (OSError, ValueError):
                 # Create new settings file
-                with open(settings_file, "w") as f:
-                    json.dump({
-                        "paths": {
-                            "work_dir": os.path.join(self.base_dir, "work"),
-                            "github_dir": os.path.join(self.base_dir, "github"),
-                            "xml_dir": os.path.join(self.base_dir, "xml")
-                        },
-                        "language": "pt-BR",
-                        "tts_settings": {
-                            "voice": "pt-BR-Standard-A",
-                            "rate": 1.0,
-                            "pitch": 0.0
-                        },
-                        "ai_settings": {
-                            "model": "gpt-4",
-                            "temperature": 0.7,
-                            "max_tokens": 4000
-                        }
-                    }, f, indent=4)
+                self._save_settings(self._default_settings_bytes)
+                return
+            
+            # Add missing keys (in default order) and write settings
+            settings.update(
+                (key, value) for key, value in self._default_settings.items() if key in missing_keys
+            )
+            self._save_settings(json.dumps(settings, indent=4).encode("utf-8"))
     
     def _repair_database(self):
         """
         Repair database
         """
         # Repair processed_courses.json
-        courses_file = os.path.join(self.data_dir, "processed_courses.json")
+        courses_file = self.courses_file
         if os.path.exists(courses_file):
             try:
-                # Try to read courses
-                with open(courses_file, "r") as f:
-                    courses = json.load(f)
-                
-                # Check if courses is a list
-                if not isinstance(courses, list):
-                    # Create new courses file
-                    with open(courses_file, "w") as f:
-                        json.dump([], f, indent=4)
-            except Exception:
-                # Create new courses file
-                with open(courses_file, "w") as f:
-                    json.dump([], f, indent=4)
+                # A file bracketed like an array is most likely healthy, so
+                # it is parsed with orjson when available; json decides
+                # anything orjson rejects (e.g. NaN) and every other file
+                if HAS_ORJSON and _is_bracketed_array(courses_file):
+                    with open(courses_file, "rb") as f:
+                        content = f.read()
+                    try:
+                        courses = orjson.loads(content)
+                    except orjson.JSONDecodeError:
+                        courses = json.loads(content)
+                else:
+                    with open(courses_file, "r") as f:
+                        courses = json.load(f)
+            except (OSError, ValueError):
+                courses = None
+            
+            # Create new courses file if it is unreadable or not a list
+            if not isinstance(courses, list):
+                _write_file_atomic(courses_file, _EMPTY_COURSES)
 
 def display_menu():
     """Display maintenance menu"""
@@ -1,12 +1,41 @@
 """
 Modules package for Curso Processor
+
+Submodules are imported lazily, on first access, so importing the package
+does not pull in the heavy dependencies (Whisper, AI clients, Google APIs)
+of the ones that are not used.
 """
 
-from .audio_converter import *
-from .transcription import *
-from .ai_processor import *
-from .timestamp_generator import *
-from .xml_generator import *
-from .drive_uploader import *
-from .github_manager import *
-from .tts_generator import *
\ No newline at end of file
+import importlib
+
+_SUBMODULES = (
+    "audio_converter",
+    "transcription",
+    "ai_processor",
+    "timestamp_generator",
+    "xml_generator",
+    "drive_uploader",
+    "github_manager",
+    "github_manager_fixed",
+    "tts_generator"
+)
+
+__all__ = list(_SUBMODULES)
+
+def __getattr__(name: str):
+    """
+    Import submodules on first access
+
+    Args:
+        name: Attribute name
+
+    Returns:
+        Any: Submodule
+    """
+    if name in _SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(set(globals()) | set(_SUBMODULES))
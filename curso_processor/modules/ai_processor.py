@@ -6,11 +6,15 @@ Supports both Claude (Anthropic) and ChatGPT (OpenAI) for processing transcripti
 import os
 import re
 import time
+import hashlib
+import functools
+import asyncio
 import json
 import yaml
 import logging
 import datetime
 import random
+from collections import OrderedDict
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Union, Any, Callable
 
@@ -21,6 +25,13 @@ from rich.table import Table
 from utils import file_manager, ui_components
 from config import settings, credentials
 
+# tiktoken is optional; fall back to estimating tokens from the text length
+try:
+    import tiktoken
+    HAS_TIKTOKEN = True
+except ImportError:
+    HAS_TIKTOKEN = False
+
 # Configure logging
 logger = logging.getLogger("ai_processor")
 
@@ -79,14 +90,42 @@ OPENAI_MODELS = {
     }
 }
 
+# Prompt caching: price of input tokens read from and written to the
+# provider's cache, relative to regular input tokens
+CACHE_READ_FACTOR = {"claude": 0.1, "openai": 0.5}
+CACHE_WRITE_FACTOR = {"claude": 1.25, "openai": 1.0}
+
 DEFAULT_CLAUDE_MODEL = "claude-3-5-sonnet-20241022"
 DEFAULT_OPENAI_MODEL = "gpt-4-turbo-preview"
 
+# Maximum number of transcriptions processed at once in batch processing
+DEFAULT_MAX_CONCURRENCY = 4
+
+# Batch API: seconds between status checks, and price relative to regular requests
+BATCH_POLL_INTERVAL = 30
+BATCH_API_DISCOUNT = 0.5
+
 # Control tokens for conversation management
 CONTINUE_TOKEN = "[CONTINUA]"
 CONTINUE_COMMAND = "[CONTINUAR]"
 END_TOKEN = "[FIM]"
 
+# Number of tiktoken counts kept by each processor, by text digest
+TOKEN_CACHE_SIZE = 1024
+
+# Shortest prompt prefix Claude caches, in tokens (2048 on Haiku models)
+CLAUDE_CACHE_MIN_TOKENS = 1024
+
+
+@functools.lru_cache(maxsize=8)
+def _get_encoding(model: str):
+    """tiktoken encoding for an OpenAI model (cached per model)"""
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.get_encoding("cl100k_base")
+
+
 class AIProcessor:
     """Class for processing transcriptions using AI models"""
     
@@ -117,7 +156,8 @@ class AIProcessor:
         self.temperature = temperature
         self.console = console or Console()
         
-        # Initialize clients if API keys are available
+        # Initialize clients if API keys are available (async clients are
+        # opened per batch, see _open_async_client)
         self.claude_client = None
         if self.claude_api_key:
             try:
@@ -134,6 +174,13 @@ class AIProcessor:
             except ImportError:
                 logger.warning("OpenAI package not installed. ChatGPT processing will not be available.")
         
+        # tiktoken counts of OpenAI texts, by text digest (see estimate_tokens)
+        self._token_counts = OrderedDict()
+        
+        # Static header of the last prompt template long enough for Claude's
+        # prompt cache (see _claude_request)
+        self._template_header = None
+        
         # Prompts directory
         self.prompts_dir = Path(__file__).parent.parent / "prompts"
         
@@ -177,19 +224,11 @@ class AIProcessor:
         if progress and task_id is not None:
             progress.update(task_id, description="Loading prompt...")
         
-        # Load prompt
-        prompt_text, prompt_file = self.load_custom_prompt(prompt_path)
-        if not prompt_text:
-            error_message = f"Failed to load prompt from {prompt_path}"
-            logger.error(error_message)
-            return False, {"error": error_message}
-        
-        # Apply template variables
-        prompt_text = self.apply_template_variables(prompt_text, transcription, metadata)
-        
-        # Validate prompt size
-        if not self.validate_prompt_size(prompt_text, "claude"):
-            error_message = f"Prompt size exceeds Claude model context window"
+        # Load prompt, apply template variables and validate prompt size
+        prompt_text, prompt_file, input_tokens, error_message = self._prepare_prompt(
+            transcription, prompt_path, metadata, "claude"
+        )
+        if error_message:
             logger.error(error_message)
             return False, {"error": error_message}
         
@@ -199,43 +238,25 @@ class AIProcessor:
         
         # Process with Claude
         try:
-            # Estimate tokens and cost
-            input_tokens = self.estimate_tokens(prompt_text, "claude")
-            
             # Start time for tracking
             start_time = time.time()
             
             # Process with Claude using conversation management
+            usage = {}
             processed_content = self.manage_conversation(
                 prompt_text, 
                 provider="claude",
                 progress=progress,
-                task_id=task_id
+                task_id=task_id,
+                usage=usage
             )
             
             # End time for tracking
             end_time = time.time()
             processing_time = end_time - start_time
             
-            # Estimate output tokens and cost
-            output_tokens = self.estimate_tokens(processed_content, "claude")
-            total_tokens = input_tokens + output_tokens
-            
-            # Calculate cost
-            cost = self.calculate_cost(input_tokens, output_tokens, "claude")
-            
-            # Create result
-            result = {
-                "content": processed_content,
-                "model": self.claude_model,
-                "prompt_file": prompt_file,
-                "input_tokens": input_tokens,
-                "output_tokens": output_tokens,
-                "total_tokens": total_tokens,
-                "cost_usd": cost,
-                "processing_time": processing_time,
-                "processed_at": datetime.datetime.now().isoformat()
-            }
+            # Create result (with output tokens and cost)
+            result = self._build_result(processed_content, "claude", prompt_file, input_tokens, processing_time, usage)
             
             # Save processed content if output_path is provided
             if output_path:
@@ -284,19 +305,11 @@ class AIProcessor:
         if progress and task_id is not None:
             progress.update(task_id, description="Loading prompt...")
         
-        # Load prompt
-        prompt_text, prompt_file = self.load_custom_prompt(prompt_path)
-        if not prompt_text:
-            error_message = f"Failed to load prompt from {prompt_path}"
-            logger.error(error_message)
-            return False, {"error": error_message}
-        
-        # Apply template variables
-        prompt_text = self.apply_template_variables(prompt_text, transcription, metadata)
-        
-        # Validate prompt size
-        if not self.validate_prompt_size(prompt_text, "openai"):
-            error_message = f"Prompt size exceeds OpenAI model context window"
+        # Load prompt, apply template variables and validate prompt size
+        prompt_text, prompt_file, input_tokens, error_message = self._prepare_prompt(
+            transcription, prompt_path, metadata, "openai"
+        )
+        if error_message:
             logger.error(error_message)
             return False, {"error": error_message}
         
@@ -306,43 +319,25 @@ class AIProcessor:
         
         # Process with ChatGPT
         try:
-            # Estimate tokens and cost
-            input_tokens = self.estimate_tokens(prompt_text, "openai")
-            
             # Start time for tracking
             start_time = time.time()
             
             # Process with ChatGPT using conversation management
+            usage = {}
             processed_content = self.manage_conversation(
                 prompt_text, 
                 provider="openai",
                 progress=progress,
-                task_id=task_id
+                task_id=task_id,
+                usage=usage
             )
             
             # End time for tracking
             end_time = time.time()
             processing_time = end_time - start_time
             
-            # Estimate output tokens and cost
-            output_tokens = self.estimate_tokens(processed_content, "openai")
-            total_tokens = input_tokens + output_tokens
-            
-            # Calculate cost
-            cost = self.calculate_cost(input_tokens, output_tokens, "openai")
-            
-            # Create result
-            result = {
-                "content": processed_content,
-                "model": self.openai_model,
-                "prompt_file": prompt_file,
-                "input_tokens": input_tokens,
-                "output_tokens": output_tokens,
-                "total_tokens": total_tokens,
-                "cost_usd": cost,
-                "processing_time": processing_time,
-                "processed_at": datetime.datetime.now().isoformat()
-            }
+            # Create result (with output tokens and cost)
+            result = self._build_result(processed_content, "openai", prompt_file, input_tokens, processing_time, usage)
             
             # Save processed content if output_path is provided
             if output_path:
@@ -367,11 +362,70 @@ class AIProcessor:
         prompt_path: Optional[Union[str, Path]] = None,
         metadata: Optional[Dict[str, Any]] = None,
         create_summary: bool = True,
-        console: Optional[Console] = None
+        console: Optional[Console] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        use_batch_api: bool = False
     ) -> Tuple[bool, Dict[str, Any]]:
         """
         Process multiple transcriptions
         
+        Runs abatch_process_transcriptions in a new event loop; call that
+        coroutine directly from async code. With use_batch_api, all prompts
+        are submitted at once through the provider's Batch API instead, which
+        costs half as much but may take up to 24 hours to complete.
+        
+        Args:
+            transcription_paths: List of transcription file paths
+            output_dir: Directory to save processed content
+            provider: AI provider ("claude" or "openai")
+            prompt_path: Path to prompt file (if None, will use default prompt)
+            metadata: Additional metadata for template variables
+            create_summary: Whether to create a summary of all processed content
+            console: Rich console for output
+            max_concurrency: Maximum number of transcriptions processed at once
+            use_batch_api: Whether to process through the provider's Batch API
+            
+        Returns:
+            Tuple[bool, Dict[str, Any]]: Success status and results
+        """
+        if use_batch_api:
+            return self._batch_api_process_transcriptions(
+                transcription_paths=transcription_paths,
+                output_dir=output_dir,
+                provider=provider,
+                prompt_path=prompt_path,
+                metadata=metadata,
+                create_summary=create_summary,
+                console=console
+            )
+        
+        return asyncio.run(self.abatch_process_transcriptions(
+            transcription_paths=transcription_paths,
+            output_dir=output_dir,
+            provider=provider,
+            prompt_path=prompt_path,
+            metadata=metadata,
+            create_summary=create_summary,
+            console=console,
+            max_concurrency=max_concurrency
+        ))
+    
+    def _batch_api_process_transcriptions(
+        self,
+        transcription_paths: List[Union[str, Path]],
+        output_dir: Union[str, Path],
+        provider: str = "claude",
+        prompt_path: Optional[Union[str, Path]] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        create_summary: bool = True,
+        console: Optional[Console] = None
+    ) -> Tuple[bool, Dict[str, Any]]:
+        """
+        Process multiple transcriptions through the provider's Batch API
+        
+        The first turn of every conversation is submitted in a single batch;
+        responses that ask to continue are completed with regular requests.
+        
         Args:
             transcription_paths: List of transcription file paths
             output_dir: Directory to save processed content
@@ -384,6 +438,20 @@ class AIProcessor:
         Returns:
             Tuple[bool, Dict[str, Any]]: Success status and results
         """
+        if provider == "claude":
+            client, api_name, submit = self.claude_client, "Claude", self._submit_claude_batch
+        elif provider == "openai":
+            client, api_name, submit = self.openai_client, "OpenAI", self._submit_openai_batch
+        else:
+            error_message = f"Invalid provider: {provider}"
+            logger.error(error_message)
+            return False, {"error": error_message}
+        
+        if client is None:
+            error_message = f"{api_name} API key not available"
+            logger.error(error_message)
+            return False, {"error": error_message}
+        
         # Convert paths to Path objects
         transcription_paths = [Path(p) for p in transcription_paths]
         output_dir = Path(output_dir)
@@ -394,9 +462,6 @@ class AIProcessor:
         # Use provided console or instance console
         console = console or self.console
         
-        # Create progress bar
-        progress = ui_components.create_progress_bar("Processando transcrições")
-        
         results = {
             "success": True,
             "processed": [],
@@ -404,132 +469,646 @@ class AIProcessor:
             "total": len(transcription_paths),
             "provider": provider,
             "total_tokens": 0,
+            "total_cached_tokens": 0,
             "total_cost": 0.0
         }
         
-        with progress:
-            # Add task
-            task = progress.add_task("Iniciando processamento...", total=len(transcription_paths))
+        # Prepare prompts, by custom ID (file paths are not valid batch IDs)
+        prompts = {}
+        pending = {}
+        for index, transcription_path in enumerate(transcription_paths):
+            try:
+                transcription, file_metadata = self._read_transcription(transcription_path)
+            except Exception as e:
+                error_message = f"Error processing {transcription_path}: {str(e)}"
+                logger.error(error_message)
+                self._record_result(results, transcription_path, None, False, {"error": error_message})
+                continue
             
-            # Process each transcription
-            for transcription_path in transcription_paths:
-                # Update progress
-                progress.update(task, description=f"Processando {transcription_path.name}")
-                
+            # Merge with provided metadata
+            if metadata:
+                file_metadata.update(metadata)
+            
+            prompt_text, prompt_file, input_tokens, error_message = self._prepare_prompt(
+                transcription, prompt_path, file_metadata, provider
+            )
+            if error_message:
+                logger.error(error_message)
+                self._record_result(results, transcription_path, None, False, {"error": error_message})
+                continue
+            
+            custom_id = f"t{index}"
+            prompts[custom_id] = prompt_text
+            pending[custom_id] = (transcription_path, prompt_file, input_tokens, file_metadata)
+        
+        if prompts:
+            # Submit all prompts and wait for the batch to end
+            start_time = time.time()
+            try:
+                with console.status(f"[cyan]Aguardando a Batch API ({len(prompts)} transcrições)...[/cyan]"):
+                    responses = submit(prompts)
+            except Exception as e:
+                logger.error(f"Error submitting {api_name} batch: {str(e)}")
+                responses = dict.fromkeys(prompts, e)
+            processing_time = time.time() - start_time
+            
+            for custom_id, (transcription_path, prompt_file, input_tokens, file_metadata) in pending.items():
                 try:
-                    # Read transcription
-                    with open(transcription_path, "r", encoding="utf-8") as f:
-                        transcription = f.read()
+                    response = responses[custom_id]
+                    if isinstance(response, Exception):
+                        raise response
+                    response_text, batch_usage = response
                     
-                    # Extract metadata from transcription file
-                    file_metadata = self._extract_metadata_from_file(transcription_path)
+                    # Complete the conversation, if the response asks to continue
+                    continuation_usage = {}
+                    processed_content = self.manage_conversation(
+                        prompts[custom_id], provider=provider, first_response=response_text,
+                        usage=continuation_usage
+                    )
                     
-                    # Merge with provided metadata
-                    if metadata:
-                        file_metadata.update(metadata)
+                    # Create result, with the usage of all turns
+                    usage = dict(batch_usage)
+                    self._add_usage(usage, continuation_usage)
+                    result = self._build_result(processed_content, provider, prompt_file, input_tokens, processing_time, usage)
                     
-                    # Set output path
-                    output_path = output_dir / f"{transcription_path.stem}_processed.md"
+                    # Only the batched turn is charged at the Batch API price;
+                    # continuation turns are regular requests
+                    result["cost_usd"] = round(
+                        self._usage_cost(batch_usage, provider) * BATCH_API_DISCOUNT
+                        + self._usage_cost(continuation_usage, provider),
+                        4
+                    )
                     
-                    # Process transcription
-                    if provider == "claude":
-                        success, result = self.process_with_claude(
-                            transcription=transcription,
-                            prompt_path=prompt_path,
-                            output_path=output_path,
-                            metadata=file_metadata,
-                            progress=progress,
-                            task_id=task
-                        )
-                    elif provider == "openai":
-                        success, result = self.process_with_chatgpt(
-                            transcription=transcription,
-                            prompt_path=prompt_path,
-                            output_path=output_path,
-                            metadata=file_metadata,
-                            progress=progress,
-                            task_id=task
-                        )
-                    else:
-                        error_message = f"Invalid provider: {provider}"
-                        logger.error(error_message)
-                        return False, {"error": error_message}
+                    # Save processed content
+                    output_path = output_dir / f"{transcription_path.stem}_processed.md"
+                    self.save_processed_content(result, output_path, file_metadata)
                     
-                    # Store result
-                    if success:
-                        results["processed"].append({
-                            "transcription_path": str(transcription_path),
-                            "output_path": str(output_path),
-                            "tokens": result.get("total_tokens", 0),
-                            "cost": result.get("cost_usd", 0.0)
-                        })
-                        
-                        # Update totals
-                        results["total_tokens"] += result.get("total_tokens", 0)
-                        results["total_cost"] += result.get("cost_usd", 0.0)
-                    else:
-                        results["failed"].append({
-                            "transcription_path": str(transcription_path),
-                            "error": result.get("error", "Unknown error")
-                        })
-                        results["success"] = False
+                    self._record_result(results, transcription_path, output_path, True, result)
                 
                 except Exception as e:
                     error_message = f"Error processing {transcription_path}: {str(e)}"
                     logger.error(error_message)
-                    
-                    results["failed"].append({
-                        "transcription_path": str(transcription_path),
-                        "error": error_message
+                    self._record_result(results, transcription_path, None, False, {"error": error_message})
+        
+        return self._finish_batch(results, output_dir, provider, create_summary, console)
+    
+    def _submit_claude_batch(
+        self,
+        prompts: Dict[str, str]
+    ) -> Dict[str, Union[Tuple[str, Dict[str, int]], Exception]]:
+        """
+        Send prompts through the Anthropic Message Batches API
+        
+        Args:
+            prompts: Prompts to send, by custom ID
+            
+        Returns:
+            Dict[str, Union[Tuple[str, Dict[str, int]], Exception]]: Response
+            text and token usage (or error), by custom ID
+        """
+        if not self.claude_client:
+            raise ValueError("Claude client not initialized")
+        
+        batch = self.claude_client.messages.batches.create(requests=[
+            {"custom_id": custom_id, "params": self._claude_request(prompt)}
+            for custom_id, prompt in prompts.items()
+        ])
+        logger.info(f"Submitted Claude batch {batch.id} with {len(prompts)} requests")
+        
+        # Wait for the batch to end
+        while batch.processing_status != "ended":
+            time.sleep(BATCH_POLL_INTERVAL)
+            batch = self.claude_client.messages.batches.retrieve(batch.id)
+        
+        responses = {}
+        for item in self.claude_client.messages.batches.results(batch.id):
+            if item.result.type == "succeeded":
+                message = item.result.message
+                responses[item.custom_id] = (message.content[0].text, self._claude_usage(message))
+            else:
+                responses[item.custom_id] = RuntimeError(f"Claude batch request {item.result.type}")
+        
+        # Requests without results failed
+        for custom_id in prompts:
+            responses.setdefault(custom_id, RuntimeError(f"Claude batch {batch.id} returned no result"))
+        
+        return responses
+    
+    def _submit_openai_batch(
+        self,
+        prompts: Dict[str, str]
+    ) -> Dict[str, Union[Tuple[str, Dict[str, int]], Exception]]:
+        """
+        Send prompts through the OpenAI Batch API
+        
+        Args:
+            prompts: Prompts to send, by custom ID
+            
+        Returns:
+            Dict[str, Union[Tuple[str, Dict[str, int]], Exception]]: Response
+            text and token usage (or error), by custom ID
+        """
+        if not self.openai_client:
+            raise ValueError("OpenAI client not initialized")
+        
+        # Upload the requests as JSONL, one chat completion per line
+        lines = [
+            json.dumps({
+                "custom_id": custom_id,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": self._openai_request(prompt)
+            }, ensure_ascii=False)
+            for custom_id, prompt in prompts.items()
+        ]
+        input_file = self.openai_client.files.create(
+            file=("batch_requests.jsonl", "\n".join(lines).encode("utf-8")),
+            purpose="batch"
+        )
+        
+        batch = self.openai_client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        logger.info(f"Submitted OpenAI batch {batch.id} with {len(prompts)} requests")
+        
+        # Wait for the batch to end
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            time.sleep(BATCH_POLL_INTERVAL)
+            batch = self.openai_client.batches.retrieve(batch.id)
+        
+        # Download successful and failed requests
+        responses = {}
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if not file_id:
+                continue
+            
+            for line in self.openai_client.files.content(file_id).text.splitlines():
+                if not line.strip():
+                    continue
+                
+                item = json.loads(line)
+                response = item.get("response") or {}
+                if item.get("error") or response.get("status_code") != 200:
+                    error = item.get("error") or response.get("body")
+                    responses[item["custom_id"]] = RuntimeError(f"OpenAI batch request failed: {error}")
+                else:
+                    body = response["body"]
+                    usage = body.get("usage") or {}
+                    responses[item["custom_id"]] = (body["choices"][0]["message"]["content"], {
+                        "input_tokens": usage.get("prompt_tokens", 0),
+                        "output_tokens": usage.get("completion_tokens", 0),
+                        "cached_tokens": (usage.get("prompt_tokens_details") or {}).get("cached_tokens", 0),
+                        "cache_write_tokens": 0
                     })
-                    results["success"] = False
         
-        # Create summary if requested
-        if create_summary and results["processed"]:
-            try:
-                # Create summary file
-                summary_path = output_dir / "Resumo_Completo.md"
-                
-                # Create summary content
-                summary_content = self._create_summary(
-                    [Path(item["output_path"]) for item in results["processed"]],
-                    provider=provider
-                )
-                
-                # Save summary
-                with open(summary_path, "w", encoding="utf-8") as f:
-                    f.write(summary_content)
-                
-                results["summary_path"] = str(summary_path)
-                
-                console.print(f"[green]Resumo completo criado: {summary_path}[/green]")
+        # Requests without results failed
+        for custom_id in prompts:
+            responses.setdefault(
+                custom_id, RuntimeError(f"OpenAI batch {batch.id} returned no result (status: {batch.status})")
+            )
+        
+        return responses
+    
+    async def abatch_process_transcriptions(
+        self,
+        transcription_paths: List[Union[str, Path]],
+        output_dir: Union[str, Path],
+        provider: str = "claude",
+        prompt_path: Optional[Union[str, Path]] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        create_summary: bool = True,
+        console: Optional[Console] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+    ) -> Tuple[bool, Dict[str, Any]]:
+        """
+        Process multiple transcriptions concurrently
+        
+        Each transcription is processed in its own task, with at most
+        max_concurrency requests to the provider in flight at once, so the
+        network round-trips of different files overlap.
+        
+        Args:
+            transcription_paths: List of transcription file paths
+            output_dir: Directory to save processed content
+            provider: AI provider ("claude" or "openai")
+            prompt_path: Path to prompt file (if None, will use default prompt)
+            metadata: Additional metadata for template variables
+            create_summary: Whether to create a summary of all processed content
+            console: Rich console for output
+            max_concurrency: Maximum number of transcriptions processed at once
+            
+        Returns:
+            Tuple[bool, Dict[str, Any]]: Success status and results
+        """
+        if provider not in ("claude", "openai"):
+            error_message = f"Invalid provider: {provider}"
+            logger.error(error_message)
+            return False, {"error": error_message}
+        
+        # Async clients keep their connections bound to the event loop they
+        # run in, so every batch opens its own and closes it when done
+        client = self._open_async_client(provider)
+        if client is None:
+            error_message = f"{'Claude' if provider == 'claude' else 'OpenAI'} API key not available"
+            logger.error(error_message)
+            return False, {"error": error_message}
+        
+        # Convert paths to Path objects
+        transcription_paths = [Path(p) for p in transcription_paths]
+        output_dir = Path(output_dir)
+        
+        # Ensure output directory exists
+        output_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Use provided console or instance console
+        console = console or self.console
+        
+        # Create progress bar
+        progress = ui_components.create_progress_bar("Processando transcrições")
+        
+        results = {
+            "success": True,
+            "processed": [],
+            "failed": [],
+            "total": len(transcription_paths),
+            "provider": provider,
+            "total_tokens": 0,
+            "total_cached_tokens": 0,
+            "total_cost": 0.0
+        }
+        
+        # Limit the number of requests in flight
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        
+        async def process_file(transcription_path: Path) -> Tuple[Path, bool, Dict[str, Any]]:
+            async with semaphore:
+                # Update progress
+                progress.update(task, description=f"Processando {transcription_path.name}")
+                
+                # Read transcription and its metadata (off the event loop)
+                transcription, file_metadata = await asyncio.to_thread(
+                    self._read_transcription, transcription_path
+                )
+                
+                # Merge with provided metadata
+                if metadata:
+                    file_metadata.update(metadata)
+                
+                # Set output path
+                output_path = output_dir / f"{transcription_path.stem}_processed.md"
+                
+                # Process transcription
+                success, result = await self.aprocess_transcription(
+                    transcription=transcription,
+                    provider=provider,
+                    prompt_path=prompt_path,
+                    output_path=output_path,
+                    metadata=file_metadata,
+                    client=client
+                )
+                
+                # Update progress
+                progress.update(task, advance=1)
+                
+                return output_path, success, result
+        
+        async with client:
+            with progress:
+                # Add task
+                task = progress.add_task("Iniciando processamento...", total=len(transcription_paths))
+                
+                # Process all transcriptions concurrently
+                outcomes = await asyncio.gather(
+                    *(process_file(transcription_path) for transcription_path in transcription_paths),
+                    return_exceptions=True
+                )
+        
+        # Store results (in input order)
+        for transcription_path, outcome in zip(transcription_paths, outcomes):
+            if isinstance(outcome, BaseException):
+                error_message = f"Error processing {transcription_path}: {str(outcome)}"
+                logger.error(error_message)
+                self._record_result(results, transcription_path, None, False, {"error": error_message})
+                continue
+            
+            output_path, success, result = outcome
+            self._record_result(results, transcription_path, output_path, success, result)
+        
+        return self._finish_batch(results, output_dir, provider, create_summary, console)
+    
+    def _record_result(
+        self,
+        results: Dict[str, Any],
+        transcription_path: Path,
+        output_path: Optional[Path],
+        success: bool,
+        result: Dict[str, Any]
+    ):
+        """
+        Add the outcome of one transcription to batch results
+        
+        Args:
+            results: Batch results to update
+            transcription_path: Path to transcription file
+            output_path: Path of the processed content
+            success: Whether processing succeeded
+            result: Processing result (or error)
+        """
+        if success:
+            results["processed"].append({
+                "transcription_path": str(transcription_path),
+                "output_path": str(output_path),
+                "tokens": result.get("total_tokens", 0),
+                "cached_tokens": result.get("cached_tokens", 0),
+                "cost": result.get("cost_usd", 0.0)
+            })
+            
+            # Update totals
+            results["total_tokens"] += result.get("total_tokens", 0)
+            results["total_cached_tokens"] += result.get("cached_tokens", 0)
+            results["total_cost"] += result.get("cost_usd", 0.0)
+        else:
+            results["failed"].append({
+                "transcription_path": str(transcription_path),
+                "error": result.get("error", "Unknown error")
+            })
+            results["success"] = False
+    
+    def _finish_batch(
+        self,
+        results: Dict[str, Any],
+        output_dir: Path,
+        provider: str,
+        create_summary: bool,
+        console: Console
+    ) -> Tuple[bool, Dict[str, Any]]:
+        """
+        Create the batch summary file (if requested) and print the batch report
+        
+        Args:
+            results: Batch results
+            output_dir: Directory with the processed content
+            provider: AI provider used for processing
+            create_summary: Whether to create a summary of all processed content
+            console: Rich console for output
+            
+        Returns:
+            Tuple[bool, Dict[str, Any]]: Success status and results
+        """
+        # Create summary if requested
+        if create_summary and results["processed"]:
+            try:
+                # Create summary file
+                summary_path = output_dir / "Resumo_Completo.md"
+                
+                # Create summary content
+                summary_content = self._create_summary(
+                    [Path(item["output_path"]) for item in results["processed"]],
+                    provider=provider
+                )
+                
+                # Save summary
+                with open(summary_path, "w", encoding="utf-8") as f:
+                    f.write(summary_content)
+                
+                results["summary_path"] = str(summary_path)
+                
+                console.print(f"[green]Resumo completo criado: {summary_path}[/green]")
+            
+            except Exception as e:
+                error_message = f"Error creating summary: {str(e)}"
+                logger.error(error_message)
+                results["summary_error"] = error_message
+        
+        # Print summary
+        successful = len(results["processed"])
+        console.print(f"[green]Processamento concluído: {successful}/{results['total']} arquivos processados com sucesso[/green]")
+        console.print(f"[cyan]Total de tokens: {results['total_tokens']}[/cyan]")
+        if results["total_cached_tokens"]:
+            console.print(f"[cyan]Tokens de entrada em cache: {results['total_cached_tokens']}[/cyan]")
+        console.print(f"[cyan]Custo total: ${results['total_cost']:.2f} USD[/cyan]")
+        
+        if results["failed"]:
+            console.print(f"[red]Falhas: {len(results['failed'])} arquivos[/red]")
+            
+            # Print failed files
+            for item in results["failed"]:
+                console.print(f"[red]  {Path(item['transcription_path']).name}: {item['error']}[/red]")
+        
+        return results["success"], results
+    
+    def _open_async_client(self, provider: str) -> Any:
+        """
+        Create an async client for a provider
+        
+        Async clients keep their connections bound to the event loop they
+        first run in, so they are created per event loop and used as async
+        context managers, which close them.
+        
+        Args:
+            provider: AI provider ("claude" or "openai")
+            
+        Returns:
+            Any: Async client (None if the API key or the package is missing)
+        """
+        try:
+            if provider == "claude" and self.claude_api_key:
+                import anthropic
+                return anthropic.AsyncAnthropic(api_key=self.claude_api_key)
+            if provider == "openai" and self.openai_api_key:
+                import openai
+                return openai.AsyncOpenAI(api_key=self.openai_api_key)
+        except ImportError:
+            pass
+        
+        return None
+    
+    async def aprocess_transcription(
+        self,
+        transcription: str,
+        provider: str = "claude",
+        prompt_path: Optional[Union[str, Path]] = None,
+        output_path: Optional[Union[str, Path]] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        client: Any = None
+    ) -> Tuple[bool, Dict[str, Any]]:
+        """
+        Process transcription with the async client of a provider
+        
+        Args:
+            transcription: Transcription text to process
+            provider: AI provider ("claude" or "openai")
+            prompt_path: Path to prompt file (if None, will use default prompt)
+            output_path: Path to save processed content
+            metadata: Additional metadata for template variables
+            client: Async client of the provider (if None, one is opened and
+                closed for this transcription)
+            
+        Returns:
+            Tuple[bool, Dict[str, Any]]: Success status and processed content
+        """
+        provider_name = "Claude" if provider == "claude" else "ChatGPT"
+        
+        if client is None:
+            client = self._open_async_client(provider)
+            if client is None:
+                error_message = f"{'Claude' if provider == 'claude' else 'OpenAI'} API key not available"
+                logger.error(error_message)
+                return False, {"error": error_message}
+            
+            async with client:
+                return await self.aprocess_transcription(
+                    transcription, provider, prompt_path, output_path, metadata, client
+                )
+        
+        # Load prompt, apply template variables and validate prompt size
+        prompt_text, prompt_file, input_tokens, error_message = self._prepare_prompt(
+            transcription, prompt_path, metadata, provider
+        )
+        if error_message:
+            logger.error(error_message)
+            return False, {"error": error_message}
+        
+        try:
+            # Process using conversation management
+            start_time = time.time()
+            usage = {}
+            processed_content = await self.amanage_conversation(client, prompt_text, provider=provider, usage=usage)
+            processing_time = time.time() - start_time
+            
+            # Create result (with output tokens and cost)
+            result = self._build_result(processed_content, provider, prompt_file, input_tokens, processing_time, usage)
+            
+            # Save processed content if output_path is provided
+            if output_path:
+                await asyncio.to_thread(self.save_processed_content, result, output_path, metadata)
+            
+            return True, result
+        
+        except Exception as e:
+            error_message = f"Error processing with {provider_name}: {str(e)}"
+            logger.error(error_message)
+            return False, {"error": error_message}
+    
+    def _prepare_prompt(
+        self,
+        transcription: str,
+        prompt_path: Optional[Union[str, Path]],
+        metadata: Optional[Dict[str, Any]],
+        provider: str
+    ) -> Tuple[str, str, int, Optional[str]]:
+        """
+        Load a prompt, apply its template variables and validate its size
+        
+        Args:
+            transcription: Transcription text
+            prompt_path: Path to prompt file (if None, will use default prompt)
+            metadata: Additional metadata for template variables
+            provider: AI provider ("claude" or "openai")
+            
+        Returns:
+            Tuple[str, str, int, Optional[str]]: Prompt text, prompt file name,
+            estimated input tokens and error message (None if the prompt is
+            ready to send)
+        """
+        # Load prompt
+        prompt_text, prompt_file = self.load_custom_prompt(prompt_path)
+        if not prompt_text:
+            return "", "", 0, f"Failed to load prompt from {prompt_path}"
+        
+        # Apply template variables (the template header is kept for caching,
+        # if Claude would cache it)
+        template_header, transcription_segment = self.template_segments(prompt_text, transcription, metadata)
+        prompt_text = template_header + transcription_segment
+        if provider == "claude" and self.estimate_tokens(template_header, provider) >= CLAUDE_CACHE_MIN_TOKENS:
+            self._template_header = template_header
+        
+        # Estimate tokens and validate prompt size
+        input_tokens = self.estimate_tokens(prompt_text, provider)
+        if not self.validate_prompt_size(prompt_text, provider, tokens=input_tokens):
+            api_name = "Claude" if provider == "claude" else "OpenAI"
+            return prompt_text, prompt_file, input_tokens, f"Prompt size exceeds {api_name} model context window"
+        
+        return prompt_text, prompt_file, input_tokens, None
+    
+    def _build_result(
+        self,
+        processed_content: str,
+        provider: str,
+        prompt_file: str,
+        input_tokens: int,
+        processing_time: float,
+        usage: Optional[Dict[str, int]] = None
+    ) -> Dict[str, Any]:
+        """
+        Build the processing result, with token counts and cost
+        
+        Args:
+            processed_content: Processed content
+            provider: AI provider ("claude" or "openai")
+            prompt_file: Prompt file name
+            input_tokens: Estimated number of input tokens
+            processing_time: Processing time in seconds
+            usage: Token usage reported by the provider (if None or empty,
+                output tokens are estimated and no input is taken as cached)
             
-            except Exception as e:
-                error_message = f"Error creating summary: {str(e)}"
-                logger.error(error_message)
-                results["summary_error"] = error_message
+        Returns:
+            Dict[str, Any]: Processing result
+        """
+        usage = usage or {}
         
-        # Print summary
-        successful = len(results["processed"])
-        console.print(f"[green]Processamento concluído: {successful}/{len(transcription_paths)} arquivos processados com sucesso[/green]")
-        console.print(f"[cyan]Total de tokens: {results['total_tokens']}[/cyan]")
-        console.print(f"[cyan]Custo total: ${results['total_cost']:.2f} USD[/cyan]")
+        # Prefer the token counts reported by the provider to estimates
+        if usage:
+            input_tokens = usage["input_tokens"]
+            output_tokens = usage["output_tokens"]
+        else:
+            output_tokens = self.estimate_tokens(processed_content, provider)
         
-        if results["failed"]:
-            console.print(f"[red]Falhas: {len(results['failed'])} arquivos[/red]")
+        cached_tokens = usage.get("cached_tokens", 0)
+        cost = self.calculate_cost(
+            input_tokens, output_tokens, provider,
+            cached_tokens=cached_tokens,
+            cache_write_tokens=usage.get("cache_write_tokens", 0)
+        )
+        
+        return {
+            "content": processed_content,
+            "model": self.claude_model if provider == "claude" else self.openai_model,
+            "prompt_file": prompt_file,
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "total_tokens": input_tokens + output_tokens,
+            "cached_tokens": cached_tokens,
+            "cost_usd": cost,
+            "processing_time": processing_time,
+            "processed_at": datetime.datetime.now().isoformat()
+        }
+    
+    def _read_transcription(self, transcription_path: Path) -> Tuple[str, Dict[str, Any]]:
+        """
+        Read a transcription file and its metadata
+        
+        Args:
+            transcription_path: Path to transcription file
             
-            # Print failed files
-            for item in results["failed"]:
-                console.print(f"[red]  {Path(item['transcription_path']).name}: {item['error']}[/red]")
+        Returns:
+            Tuple[str, Dict[str, Any]]: Transcription text and metadata
+        """
+        with open(transcription_path, "r", encoding="utf-8") as f:
+            transcription = f.read()
         
-        return results["success"], results
+        return transcription, self._extract_metadata_from_file(transcription_path)
     
     def manage_conversation(
         self,
         prompt: str,
         provider: str = "claude",
         progress: Optional[Progress] = None,
-        task_id: Optional[TaskID] = None
+        task_id: Optional[TaskID] = None,
+        first_response: Optional[str] = None,
+        usage: Optional[Dict[str, int]] = None
     ) -> str:
         """
         Manage conversation with AI model
@@ -539,6 +1118,9 @@ class AIProcessor:
             provider: AI provider ("claude" or "openai")
             progress: Rich progress object
             task_id: Task ID for progress tracking
+            first_response: Response to the initial prompt, if already
+                obtained (e.g. through a batch API); only later turns are sent
+            usage: Dictionary to add the token usage of the sent turns to
             
         Returns:
             str: Full processed content
@@ -556,122 +1138,357 @@ class AIProcessor:
             if progress and task_id is not None:
                 progress.update(task_id, description=f"Processando (turno {conversation_turn})...")
             
+            if conversation_turn == 1 and first_response is not None:
+                response = first_response
+            else:
+                # Send message to AI with retry logic
+                for attempt in range(max_retries):
+                    try:
+                        if provider == "claude":
+                            response, turn_usage = self._send_to_claude(message, conversation_turn > 1)
+                        elif provider == "openai":
+                            response, turn_usage = self._send_to_openai(message, conversation_turn > 1)
+                        else:
+                            raise ValueError(f"Invalid provider: {provider}")
+                    
+                        self._add_usage(usage, turn_usage)
+                    
+                        # Break retry loop if successful
+                        break
+                
+                    except Exception as e:
+                        logger.warning(f"API error (attempt {attempt+1}/{max_retries}): {str(e)}")
+                    
+                        # Update progress if provided
+                        if progress and task_id is not None:
+                            progress.update(task_id, description=f"API error, retrying... ({attempt+1}/{max_retries})")
+                    
+                        # Exponential backoff with jitter
+                        sleep_time = retry_delay * (2 ** attempt) + random.uniform(0, 1)
+                        time.sleep(sleep_time)
+                    
+                        # If this is the last attempt, re-raise the exception
+                        if attempt == max_retries - 1:
+                            raise
+            
+            # Check for end or continue tokens
+            text, continues = self._split_control_tokens(response)
+            full_response += text
+            if not continues:
+                break
+            
+            # Set next message to continue command
+            message = CONTINUE_COMMAND
+            conversation_turn += 1
+        
+        # Clean response
+        cleaned_response = self.clean_ai_response(full_response)
+        
+        # Format for Obsidian
+        formatted_response = self.format_for_obsidian(cleaned_response)
+        
+        return formatted_response
+    
+    async def amanage_conversation(
+        self,
+        client: Any,
+        prompt: str,
+        provider: str = "claude",
+        usage: Optional[Dict[str, int]] = None
+    ) -> str:
+        """
+        Manage conversation with AI model using an async client
+        
+        Args:
+            client: Async client of the provider
+            prompt: Initial prompt
+            provider: AI provider ("claude" or "openai")
+            usage: Dictionary to add the token usage of each turn to
+            
+        Returns:
+            str: Full processed content
+        """
+        full_response = ""
+        message = prompt
+        conversation_turn = 1
+        
+        # Retry parameters
+        max_retries = 5
+        retry_delay = 1  # Initial delay in seconds
+        
+        while True:
             # Send message to AI with retry logic
             for attempt in range(max_retries):
                 try:
                     if provider == "claude":
-                        response = self._send_to_claude(message, conversation_turn > 1)
+                        response, turn_usage = await self._asend_to_claude(client, message, conversation_turn > 1)
                     elif provider == "openai":
-                        response = self._send_to_openai(message, conversation_turn > 1)
+                        response, turn_usage = await self._asend_to_openai(client, message, conversation_turn > 1)
                     else:
                         raise ValueError(f"Invalid provider: {provider}")
                     
+                    self._add_usage(usage, turn_usage)
+                    
                     # Break retry loop if successful
                     break
                 
                 except Exception as e:
                     logger.warning(f"API error (attempt {attempt+1}/{max_retries}): {str(e)}")
                     
-                    # Update progress if provided
-                    if progress and task_id is not None:
-                        progress.update(task_id, description=f"API error, retrying... ({attempt+1}/{max_retries})")
-                    
-                    # Exponential backoff with jitter
-                    sleep_time = retry_delay * (2 ** attempt) + random.uniform(0, 1)
-                    time.sleep(sleep_time)
-                    
                     # If this is the last attempt, re-raise the exception
                     if attempt == max_retries - 1:
                         raise
+                    
+                    # Exponential backoff with jitter (other tasks keep running)
+                    await asyncio.sleep(retry_delay * (2 ** attempt) + random.uniform(0, 1))
             
             # Check for end or continue tokens
-            if END_TOKEN in response:
-                # Remove end token and add to full response
-                full_response += response.replace(END_TOKEN, "")
-                break
-            elif CONTINUE_TOKEN in response:
-                # Remove continue token and add to full response
-                full_response += response.replace(CONTINUE_TOKEN, "")
-                # Set next message to continue command
-                message = CONTINUE_COMMAND
-                conversation_turn += 1
-            else:
-                # No control tokens, add response and break
-                full_response += response
+            text, continues = self._split_control_tokens(response)
+            full_response += text
+            if not continues:
                 break
+            
+            # Set next message to continue command
+            message = CONTINUE_COMMAND
+            conversation_turn += 1
         
-        # Clean response
-        cleaned_response = self.clean_ai_response(full_response)
+        # Clean response and format for Obsidian
+        return self.format_for_obsidian(self.clean_ai_response(full_response))
+    
+    def _add_usage(self, usage: Optional[Dict[str, int]], turn_usage: Dict[str, int]):
+        """
+        Add the token usage of a conversation turn to a running total
         
-        # Format for Obsidian
-        formatted_response = self.format_for_obsidian(cleaned_response)
+        Args:
+            usage: Running total (nothing is done if None)
+            turn_usage: Token usage of the turn
+        """
+        if usage is None:
+            return
         
-        return formatted_response
+        for key, value in turn_usage.items():
+            usage[key] = usage.get(key, 0) + value
     
-    def _send_to_claude(self, message: str, is_continuation: bool = False) -> str:
+    def _usage_cost(self, usage: Dict[str, int], provider: str) -> float:
         """
-        Send message to Claude
+        Calculate cost of the token usage reported by a provider
+        
+        Args:
+            usage: Token usage (as returned by the senders)
+            provider: AI provider ("claude" or "openai")
+            
+        Returns:
+            float: Cost in USD
+        """
+        return self.calculate_cost(
+            usage.get("input_tokens", 0),
+            usage.get("output_tokens", 0),
+            provider,
+            cached_tokens=usage.get("cached_tokens", 0),
+            cache_write_tokens=usage.get("cache_write_tokens", 0)
+        )
+    
+    def _split_control_tokens(self, response: str) -> Tuple[str, bool]:
+        """
+        Remove the control token ending a response turn
+        
+        Args:
+            response: AI response
+            
+        Returns:
+            Tuple[str, bool]: Response text and whether the model will continue
+        """
+        if END_TOKEN in response:
+            return response.replace(END_TOKEN, ""), False
+        if CONTINUE_TOKEN in response:
+            return response.replace(CONTINUE_TOKEN, ""), True
+        return response, False
+    
+    def _claude_request(self, message: str, is_continuation: bool = False) -> Dict[str, Any]:
+        """
+        Build the arguments of a Claude messages request
         
         Args:
             message: Message to send
             is_continuation: Whether this is a continuation of a previous message
             
         Returns:
-            str: Claude's response
+            Dict[str, Any]: Keyword arguments for messages.create
         """
-        if not self.claude_client:
-            raise ValueError("Claude client not initialized")
-        
         # For continuation messages, use a simpler system prompt
         system_prompt = "You are a helpful AI assistant that processes course transcriptions."
         if is_continuation:
             system_prompt = "Continue from where you left off."
         
-        # Send message to Claude
-        response = self.claude_client.messages.create(
-            model=self.claude_model,
-            max_tokens=4000,
-            temperature=self.temperature,
-            system=system_prompt,
-            messages=[
-                {"role": "user", "content": message}
+        # Mark the template header of a prompt for Claude's prompt cache, so
+        # the other transcriptions processed with the template reuse it
+        content = message
+        header = self._template_header
+        if header and message.startswith(header) and message[len(header):].strip():
+            content = [
+                {"type": "text", "text": header, "cache_control": {"type": "ephemeral"}},
+                {"type": "text", "text": message[len(header):]}
             ]
-        )
         
-        # Extract response text
-        return response.content[0].text
+        return {
+            "model": self.claude_model,
+            "max_tokens": 4000,
+            "temperature": self.temperature,
+            "system": system_prompt,
+            "messages": [
+                {"role": "user", "content": content}
+            ]
+        }
     
-    def _send_to_openai(self, message: str, is_continuation: bool = False) -> str:
+    def _openai_request(self, message: str, is_continuation: bool = False) -> Dict[str, Any]:
         """
-        Send message to OpenAI
+        Build the arguments of an OpenAI chat completion request
         
         Args:
             message: Message to send
             is_continuation: Whether this is a continuation of a previous message
             
         Returns:
-            str: OpenAI's response
+            Dict[str, Any]: Keyword arguments for chat.completions.create
         """
-        if not self.openai_client:
-            raise ValueError("OpenAI client not initialized")
-        
         # For continuation messages, use a simpler system prompt
         system_prompt = "You are a helpful AI assistant that processes course transcriptions."
         if is_continuation:
             system_prompt = "Continue from where you left off."
         
-        # Send message to OpenAI
-        response = self.openai_client.chat.completions.create(
-            model=self.openai_model,
-            temperature=self.temperature,
-            messages=[
+        return {
+            "model": self.openai_model,
+            "temperature": self.temperature,
+            "messages": [
                 {"role": "system", "content": system_prompt},
                 {"role": "user", "content": message}
             ]
-        )
+        }
+    
+    def _claude_usage(self, response: Any) -> Dict[str, int]:
+        """
+        Token usage of a Claude response
+        
+        Args:
+            response: Claude message
+            
+        Returns:
+            Dict[str, int]: Input tokens (cached ones included), output tokens,
+            input tokens read from and written to the prompt cache
+        """
+        usage = response.usage
+        cached_tokens = getattr(usage, "cache_read_input_tokens", None) or 0
+        cache_write_tokens = getattr(usage, "cache_creation_input_tokens", None) or 0
+        
+        return {
+            "input_tokens": usage.input_tokens + cached_tokens + cache_write_tokens,
+            "output_tokens": usage.output_tokens,
+            "cached_tokens": cached_tokens,
+            "cache_write_tokens": cache_write_tokens
+        }
+    
+    def _openai_usage(self, response: Any) -> Dict[str, int]:
+        """
+        Token usage of an OpenAI chat completion
+        
+        Args:
+            response: Chat completion
+            
+        Returns:
+            Dict[str, int]: Input tokens (cached ones included), output tokens,
+            input tokens read from and written to the prompt cache
+        """
+        usage = response.usage
+        details = getattr(usage, "prompt_tokens_details", None)
+        
+        return {
+            "input_tokens": usage.prompt_tokens,
+            "output_tokens": usage.completion_tokens,
+            "cached_tokens": getattr(details, "cached_tokens", None) or 0,
+            "cache_write_tokens": 0
+        }
+    
+    def _send_to_claude(self, message: str, is_continuation: bool = False) -> Tuple[str, Dict[str, int]]:
+        """
+        Send message to Claude
+        
+        Args:
+            message: Message to send
+            is_continuation: Whether this is a continuation of a previous message
+            
+        Returns:
+            Tuple[str, Dict[str, int]]: Claude's response and token usage
+        """
+        if not self.claude_client:
+            raise ValueError("Claude client not initialized")
+        
+        # Send message to Claude
+        response = self.claude_client.messages.create(**self._claude_request(message, is_continuation))
+        
+        # Extract response text
+        return response.content[0].text, self._claude_usage(response)
+    
+    async def _asend_to_claude(
+        self,
+        client: Any,
+        message: str,
+        is_continuation: bool = False
+    ) -> Tuple[str, Dict[str, int]]:
+        """
+        Send message to Claude with an async client
+        
+        Args:
+            client: Async Anthropic client
+            message: Message to send
+            is_continuation: Whether this is a continuation of a previous message
+            
+        Returns:
+            Tuple[str, Dict[str, int]]: Claude's response and token usage
+        """
+        response = await client.messages.create(**self._claude_request(message, is_continuation))
+        return response.content[0].text, self._claude_usage(response)
+    
+    def _send_to_openai(self, message: str, is_continuation: bool = False) -> Tuple[str, Dict[str, int]]:
+        """
+        Send message to OpenAI
+        
+        Args:
+            message: Message to send
+            is_continuation: Whether this is a continuation of a previous message
+            
+        Returns:
+            Tuple[str, Dict[str, int]]: OpenAI's response and token usage
+        """
+        if not self.openai_client:
+            raise ValueError("OpenAI client not initialized")
+        
+        # Send message to OpenAI
+        response = self.openai_client.chat.completions.create(**self._openai_request(message, is_continuation))
         
         # Extract response text
-        return response.choices[0].message.content
+        return response.choices[0].message.content, self._openai_usage(response)
+    
+    async def _asend_to_openai(
+        self,
+        client: Any,
+        message: str,
+        is_continuation: bool = False
+    ) -> Tuple[str, Dict[str, int]]:
+        """
+        Send message to OpenAI with an async client
+        
+        Args:
+            client: Async OpenAI client
+            message: Message to send
+            is_continuation: Whether this is a continuation of a previous message
+            
+        Returns:
+            Tuple[str, Dict[str, int]]: OpenAI's response and token usage
+        """
+        response = await client.chat.completions.create(
+            **self._openai_request(message, is_continuation)
+        )
+        return response.choices[0].message.content, self._openai_usage(response)
     
     def load_custom_prompt(
         self,
@@ -749,19 +1566,48 @@ class AIProcessor:
         
         return prompt_text
     
-    def validate_prompt_size(self, prompt_text: str, provider: str) -> bool:
+    def template_segments(
+        self,
+        prompt_text: str,
+        transcription: str,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> Tuple[str, str]:
+        """
+        Split prompt into its template header and the transcription segment
+        
+        The header, everything before the first template variable, is the
+        same for every transcription processed with the prompt.
+        
+        Args:
+            prompt_text: Prompt text with template variables
+            transcription: Transcription text
+            metadata: Additional metadata for template variables
+            
+        Returns:
+            Tuple[str, str]: Template header and the rest of the prompt, with
+            variables replaced
+        """
+        split = prompt_text.find("{{")
+        if split == -1:
+            split = len(prompt_text)
+        
+        return prompt_text[:split], self.apply_template_variables(prompt_text[split:], transcription, metadata)
+    
+    def validate_prompt_size(self, prompt_text: str, provider: str, tokens: Optional[int] = None) -> bool:
         """
         Validate prompt size against model context window
         
         Args:
             prompt_text: Prompt text
             provider: AI provider ("claude" or "openai")
+            tokens: Number of tokens in the prompt, if already estimated
             
         Returns:
             bool: True if prompt size is valid, False otherwise
         """
         # Estimate tokens
-        tokens = self.estimate_tokens(prompt_text, provider)
+        if tokens is None:
+            tokens = self.estimate_tokens(prompt_text, provider)
         
         # Get context window size
         if provider == "claude":
@@ -788,36 +1634,68 @@ class AIProcessor:
         Returns:
             int: Estimated number of tokens
         """
-        # Simple estimation based on words and characters
-        # This is a rough estimate, actual token count may vary
+        if provider not in ("claude", "openai"):
+            raise ValueError(f"Invalid provider: {provider}")
+        
+        # Estimates from the text length cost less than hashing the text
+        if provider != "openai" or not HAS_TIKTOKEN:
+            return self._count_tokens(text, provider)
+        
+        # The same texts (prompts, then their responses) are encoded several
+        # times per file; counts are kept by digest, not by the text itself
+        key = hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+        tokens = self._token_counts.get(key)
+        if tokens is not None:
+            self._token_counts.move_to_end(key)
+            return tokens
+        
+        tokens = self._count_tokens(text, provider)
+        self._token_counts[key] = tokens
+        if len(self._token_counts) > TOKEN_CACHE_SIZE:
+            self._token_counts.popitem(last=False)
         
-        # Count words and characters
-        words = len(text.split())
-        chars = len(text)
+        return tokens
+    
+    def _count_tokens(self, text: str, provider: str) -> int:
+        """
+        Count tokens in text, with tiktoken for OpenAI models when available
+        
+        Args:
+            text: Text to count tokens for
+            provider: AI provider ("claude" or "openai")
+            
+        Returns:
+            int: Estimated number of tokens
+        """
+        if provider == "openai" and HAS_TIKTOKEN:
+            return len(_get_encoding(self.openai_model).encode(text, disallowed_special=()))
         
-        # Estimate tokens based on provider
+        # Simple estimation based on characters
+        # This is a rough estimate, actual token count may vary
         if provider == "claude":
             # Claude uses about 5 characters per token on average
-            return int(chars / 5)
-        elif provider == "openai":
-            # GPT models use about 4 characters per token on average
-            return int(chars / 4)
-        else:
-            raise ValueError(f"Invalid provider: {provider}")
+            return int(len(text) / 5)
+        
+        # GPT models use about 4 characters per token on average
+        return int(len(text) / 4)
     
     def calculate_cost(
         self,
         input_tokens: int,
         output_tokens: int,
-        provider: str
+        provider: str,
+        cached_tokens: int = 0,
+        cache_write_tokens: int = 0
     ) -> float:
         """
         Calculate cost of API usage
         
         Args:
-            input_tokens: Number of input tokens
+            input_tokens: Number of input tokens (cached ones included)
             output_tokens: Number of output tokens
             provider: AI provider ("claude" or "openai")
+            cached_tokens: Number of input tokens read from the prompt cache
+            cache_write_tokens: Number of input tokens written to the prompt cache
             
         Returns:
             float: Estimated cost in USD
@@ -833,8 +1711,13 @@ class AIProcessor:
         else:
             raise ValueError(f"Invalid provider: {provider}")
         
-        # Calculate cost
-        input_cost = input_tokens * input_cost_per_token
+        # Calculate cost (cached input tokens at their own rates)
+        uncached_tokens = input_tokens - cached_tokens - cache_write_tokens
+        input_cost = (
+            uncached_tokens
+            + cached_tokens * CACHE_READ_FACTOR[provider]
+            + cache_write_tokens * CACHE_WRITE_FACTOR[provider]
+        ) * input_cost_per_token
         output_cost = output_tokens * output_cost_per_token
         total_cost = input_cost + output_cost
         
@@ -1163,7 +2046,9 @@ def batch_process_transcriptions(
     prompt_path: Optional[Union[str, Path]] = None,
     temperature: float = 0.7,
     create_summary: bool = True,
-    console: Optional[Console] = None
+    console: Optional[Console] = None,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    use_batch_api: bool = False
 ) -> Tuple[bool, Dict[str, Any]]:
     """
     Process all transcriptions in a directory
@@ -1177,6 +2062,8 @@ def batch_process_transcriptions(
         temperature: Sampling temperature (0.0 to 1.0)
         create_summary: Whether to create a summary of all processed content
         console: Rich console for output
+        max_concurrency: Maximum number of transcriptions processed at once
+        use_batch_api: Whether to process through the provider's Batch API
         
     Returns:
         Tuple[bool, Dict[str, Any]]: Success status and processing results
@@ -1185,8 +2072,9 @@ def batch_process_transcriptions(
     transcription_dir = Path(transcription_dir)
     output_dir = Path(output_dir)
     
-    # Find all transcription files
-    transcription_files = list(transcription_dir.glob("**/*.txt"))
+    # Find all transcription files (in a stable order, so files of the same
+    # course are processed together)
+    transcription_files = sorted(transcription_dir.glob("**/*.txt"))
     
     # Initialize processor
     processor = AIProcessor(
@@ -1202,7 +2090,9 @@ def batch_process_transcriptions(
         output_dir=output_dir,
         provider=provider,
         prompt_path=prompt_path,
-        create_summary=create_summary
+        create_summary=create_summary,
+        max_concurrency=max_concurrency,
+        use_batch_api=use_batch_api
     )
 
 
@@ -5,8 +5,11 @@ Test script for the AI processor module
 
 import os
 import sys
+import asyncio
 import logging
+import tempfile
 from pathlib import Path
+from types import SimpleNamespace
 from rich.console import Console
 from rich.panel import Panel
 
@@ -256,6 +259,163 @@ def test_mock_openai_processing():
     
     return True
 
+class MockAsyncClaudeClient:
+    """
+    Async Claude client stub that, like the real clients, only works in the
+    event loop it first ran in, and not after it is closed
+    """
+    
+    def __init__(self):
+        self.loop = None
+        self.closed = False
+        self.messages = self
+    
+    async def create(self, **kwargs):
+        loop = asyncio.get_running_loop()
+        if self.closed or (self.loop is not None and self.loop is not loop):
+            raise RuntimeError("Event loop is closed")
+        self.loop = loop
+        
+        return SimpleNamespace(
+            content=[SimpleNamespace(text="# Aula\n\nConteúdo processado [FIM]")],
+            usage=SimpleNamespace(
+                input_tokens=100,
+                output_tokens=20,
+                cache_read_input_tokens=60,
+                cache_creation_input_tokens=0
+            )
+        )
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        self.closed = True
+
+def test_consecutive_async_batches():
+    """Test two concurrent batches in a row on one processor (mock clients)"""
+    console.print(Panel("Testing Consecutive Async Batches (Mock)", border_style="bright_blue"))
+    
+    processor = AIProcessor(
+        claude_api_key="sk-mock-anthropic-api-key-for-testing",
+        console=console
+    )
+    
+    # Record the async clients opened by the processor
+    clients = []
+    def open_async_client(provider):
+        clients.append(MockAsyncClaudeClient())
+        return clients[-1]
+    processor._open_async_client = open_async_client
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        test_dir = Path(temp_dir)
+        for i in range(3):
+            (test_dir / f"test_transcription_{i+1}.txt").write_text(f"Transcription {i+1}", encoding="utf-8")
+        
+        transcription_files = sorted(test_dir.glob("*.txt"))
+        for run in range(2):
+            success, results = processor.batch_process_transcriptions(
+                transcription_files,
+                test_dir / f"processed_{run}",
+                provider="claude",
+                create_summary=False
+            )
+            
+            assert success, results["failed"]
+            assert len(results["processed"]) == 3
+            assert results["total_cached_tokens"] == 3 * 60
+    
+    # One client per batch, closed when the batch ended
+    assert len(clients) == 2
+    assert all(client.closed for client in clients)
+    
+    console.print("[green]Consecutive async batches successful![/green]")
+    
+    return True
+
+class MockClaudeBatchClient:
+    """
+    Claude client stub for the Message Batches API, whose batches end at
+    once; the first transcription asks to continue
+    """
+    
+    def __init__(self):
+        self.messages = SimpleNamespace(create=self.create, batches=self)
+        self.requests = []
+        self.continuations = 0
+    
+    def create(self, requests=None, **kwargs):
+        # Batch submission
+        if requests is not None:
+            self.requests = requests
+            return SimpleNamespace(id="batch_mock", processing_status="ended")
+        
+        # Continuation turn (regular request)
+        self.continuations += 1
+        return SimpleNamespace(
+            content=[SimpleNamespace(text="Segunda parte [FIM]")],
+            usage=SimpleNamespace(input_tokens=20000, output_tokens=2000)
+        )
+    
+    def results(self, batch_id):
+        for index, request in enumerate(self.requests):
+            text = "Primeira parte [CONTINUA]" if index == 0 else "Conteúdo processado [FIM]"
+            message = SimpleNamespace(
+                content=[SimpleNamespace(text=text)],
+                usage=SimpleNamespace(input_tokens=100000, output_tokens=10000)
+            )
+            yield SimpleNamespace(
+                custom_id=request["custom_id"],
+                result=SimpleNamespace(type="succeeded", message=message)
+            )
+
+def test_batch_api_processing():
+    """Test processing through the Batch API, with a continuation turn (mock client)"""
+    console.print(Panel("Testing Batch API Processing (Mock)", border_style="bright_blue"))
+    
+    processor = AIProcessor(
+        claude_api_key="sk-mock-anthropic-api-key-for-testing",
+        console=console
+    )
+    client = MockClaudeBatchClient()
+    processor.claude_client = client
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        test_dir = Path(temp_dir)
+        for i in range(2):
+            (test_dir / f"test_transcription_{i+1}.txt").write_text(f"Transcription {i+1}", encoding="utf-8")
+        
+        success, results = processor.batch_process_transcriptions(
+            sorted(test_dir.glob("*.txt")),
+            test_dir / "processed",
+            provider="claude",
+            create_summary=False,
+            use_batch_api=True
+        )
+        
+        assert success, results["failed"]
+        assert len(client.requests) == 2
+        assert client.continuations == 1
+        
+        # The batched turn is discounted, the continuation turn is not
+        batch_cost = processor.calculate_cost(100000, 10000, "claude") * 0.5
+        continuation_cost = processor.calculate_cost(20000, 2000, "claude")
+        processed = {Path(item["transcription_path"]).name: item for item in results["processed"]}
+        first = processed["test_transcription_1.txt"]
+        second = processed["test_transcription_2.txt"]
+        assert first["tokens"] == 132000
+        assert first["cost"] == round(batch_cost + continuation_cost, 4)
+        assert second["tokens"] == 110000
+        assert second["cost"] == round(batch_cost, 4)
+        
+        content = Path(first["output_path"]).read_text(encoding="utf-8")
+        assert "Primeira parte" in content and "Segunda parte" in content
+    
+    console.print("[green]Batch API processing successful![/green]")
+    
+    return True
+
 def test_batch_processing():
     """Test batch processing"""
     console.print(Panel("Testing Batch Processing", border_style="bright_blue"))
@@ -361,6 +521,12 @@ def main():
     # Test batch processing
     batch_success = test_batch_processing()
     
+    # Test consecutive async batches
+    async_batch_success = test_consecutive_async_batches()
+    
+    # Test Batch API processing
+    batch_api_success = test_batch_api_processing()
+    
     # Display summary
     console.print(Panel("Test Summary", border_style="bright_blue"))
     console.print(f"Prompt loading: {'[green]Success[/green]' if prompt_success else '[red]Failed[/red]'}")
@@ -370,6 +536,8 @@ def main():
     console.print(f"Claude processing: {'[green]Success[/green]' if claude_success else '[red]Failed[/red]'}")
     console.print(f"OpenAI processing: {'[green]Success[/green]' if openai_success else '[red]Failed[/red]'}")
     console.print(f"Batch processing: {'[green]Success[/green]' if batch_success else '[red]Failed[/red]'}")
+    console.print(f"Async batches: {'[green]Success[/green]' if async_batch_success else '[red]Failed[/red]'}")
+    console.print(f"Batch API: {'[green]Success[/green]' if batch_api_success else '[red]Failed[/red]'}")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
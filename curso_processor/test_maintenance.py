@@ -184,6 +184,70 @@ def test_storage_optimization():
     else:
         console.print("[bold red]❌ Storage optimization failed[/bold red]")
 
+def test_database_optimization_keeps_values():
+    """Test that database optimization keeps big integers and skips invalid files"""
+    console.print("[bold cyan]Testing database optimization values...[/bold cyan]")
+    
+    # Create maintenance system with a temporary data directory
+    system = maintenance.SystemMaintenance()
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        system.data_dir = temp_dir
+        
+        # Integers at and beyond the 64-bit limits, in a file large enough
+        # for the orjson path
+        big_numbers = [
+            -9223372036854775808, -9223372036854775809, -9999999999999999999,
+            18446744073709551615, 18446744073709551616, 99999999999999999999
+        ]
+        courses = [{"course_name": f"Curso {i}", "ids": big_numbers} for i in range(2000)]
+        courses_file = os.path.join(temp_dir, "processed_courses.json")
+        with open(courses_file, "w") as f:
+            json.dump(courses, f, indent=4)
+        
+        # Corrupt file that must not be rewritten
+        settings_file = os.path.join(temp_dir, "settings.json")
+        with open(settings_file, "w") as f:
+            f.write('{"language":  "pt-BR",')
+        
+        system._optimize_database_files()
+        
+        with open(courses_file) as f:
+            optimized = json.load(f)
+        with open(settings_file) as f:
+            settings_content = f.read()
+    
+    assert optimized == courses
+    assert settings_content == '{"language":  "pt-BR",'
+    console.print("[bold green]✅ Database optimization kept all values[/bold green]")
+
+def test_database_migration_keeps_values():
+    """Test that database migration keeps big integers and non-finite floats"""
+    console.print("[bold cyan]Testing database migration values...[/bold cyan]")
+    
+    # Create maintenance system
+    system = maintenance.SystemMaintenance()
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        source_file = os.path.join(temp_dir, "source.json")
+        target_file = os.path.join(temp_dir, "target", "target.json")
+        
+        # Values json reads and writes but orjson cannot
+        data = {"big": 2**70, "nan": float("nan"), "inf": float("inf"), "ids": [1, 2**64]}
+        with open(source_file, "w") as f:
+            json.dump(data, f)
+        
+        system.migrate_database(source_file, target_file)
+        
+        with open(target_file) as f:
+            migrated = json.load(f)
+    
+    assert migrated["big"] == 2**70
+    assert migrated["nan"] != migrated["nan"]
+    assert migrated["inf"] == float("inf")
+    assert migrated["ids"] == [1, 2**64]
+    console.print("[bold green]✅ Database migration kept all values[/bold green]")
+
 def test_auto_repair():
     """Test auto-repair functionality"""
     console.print("[bold cyan]Testing auto-repair functionality...[/bold cyan]")
@@ -242,6 +306,12 @@ def main():
     test_storage_optimization()
     print()
     
+    test_database_optimization_keeps_values()
+    print()
+    
+    test_database_migration_keeps_values()
+    print()
+    
     test_auto_repair()
 
 if __name__ == "__main__":
@@ -14,6 +14,9 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.text import Text
 
+# Import simplified maintenance system
+import maintenance_simple
+
 # Initialize console
 console = Console()
 
@@ -141,6 +144,84 @@ def test_json_operations():
         except Exception as e:
             console.print(f"[bold red]❌ Error reading JSON file: {str(e)}[/bold red]")
 
+def test_json_minification():
+    """Test minification of single-line and indented JSON files"""
+    console.print("[bold cyan]Testing JSON minification...[/bold cyan]")
+    
+    test_data = {"courses": [{"name": f"Curso {i}", "files": i} for i in range(50)]}
+    compact = json.dumps(test_data, separators=(",", ":"))
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Default separators, indented, and already compact
+        contents = {
+            "single_line.json": json.dumps(test_data),
+            "indented.json": json.dumps(test_data, indent=4),
+            "compact.json": compact
+        }
+        for name, content in contents.items():
+            json_file = os.path.join(temp_dir, name)
+            with open(json_file, "w") as f:
+                f.write(content)
+            
+            maintenance_simple._minify_json_file(json_file)
+            
+            with open(json_file) as f:
+                assert f.read() == compact, name
+    
+    console.print("[bold green]✅ JSON files minified successfully[/bold green]")
+
+def test_json_minification_keeps_integers():
+    """Test that minification keeps integers at and beyond the 64-bit limits"""
+    console.print("[bold cyan]Testing JSON minification of large integers...[/bold cyan]")
+    
+    # int64 and uint64 boundaries, and the first integers past them
+    numbers = [
+        -9223372036854775808, -9223372036854775809, -9999999999999999999,
+        9223372036854775807, 18446744073709551615, 18446744073709551616,
+        99999999999999999999
+    ]
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for number in numbers:
+            json_file = os.path.join(temp_dir, "numbers.json")
+            with open(json_file, "w") as f:
+                json.dump({"values": [number] * 20}, f, indent=4)
+            
+            maintenance_simple._minify_json_file(json_file)
+            
+            with open(json_file) as f:
+                assert json.load(f) == {"values": [number] * 20}, number
+    
+    console.print("[bold green]✅ Large integers kept exactly[/bold green]")
+
+def test_database_repair_parses_courses():
+    """Test that the database repair replaces broken arrays and keeps valid ones"""
+    console.print("[bold cyan]Testing database repair...[/bold cyan]")
+    
+    # Create maintenance system with a temporary courses file
+    system = maintenance_simple.SystemMaintenance()
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        system.courses_file = os.path.join(temp_dir, "processed_courses.json")
+        
+        # Broken files bracketed like an array, and valid ones
+        contents = {
+            '[{"a":1,]': "[]",
+            '[1,2,' + ' ' * 10000 + ']': "[]",
+            '[{"course_name": "Curso"}]': '[{"course_name": "Curso"}]',
+            '[1, NaN]': '[1, NaN]'
+        }
+        for content, expected in contents.items():
+            with open(system.courses_file, "w") as f:
+                f.write(content)
+            
+            system._repair_database()
+            
+            with open(system.courses_file) as f:
+                assert f.read() == expected, content
+    
+    console.print("[bold green]✅ Database repaired successfully[/bold green]")
+
 def main():
     """Main function"""
     console.print(Panel(
@@ -156,6 +237,15 @@ def main():
     print()
     
     test_json_operations()
+    print()
+    
+    test_json_minification()
+    print()
+    
+    test_json_minification_keeps_integers()
+    print()
+    
+    test_database_repair_parses_courses()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file